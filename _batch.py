@@ -0,0 +1,309 @@
+"""Run many solutions over many inputs in parallel.
+
+Input files are found under an inputs directory using a pattern
+formatted with each solution's year and day, by default
+``<inputs>/<year>/day<day>/*.txt``, optionally falling back to the
+downloaded input. Each ``(solution, input file)`` pair is run in a worker
+process.
+"""
+
+import json
+import sys
+import time
+import pathlib
+import argparse
+import importlib
+import logging as lg
+import functools as ft
+import traceback
+import concurrent.futures
+
+import _common
+import solutions
+
+_logger = lg.getLogger(__name__)
+
+
+class Job:
+    """Solution run on one input.
+
+    Args:
+        module (str): solution module name
+        year (int): puzzle year
+        day (int): puzzle day
+        input_path (pathlib.Path): input file, ``None`` to download
+    """
+
+    def __init__(self, module, year, day, input_path=None):
+        self.module = module
+        self.year = year
+        self.day = day
+        self.input_path = input_path
+
+    def __repr__(self):
+        return "{}({}, {}, {}, {})".format(
+            type(self).__name__,
+            repr(self.module),
+            repr(self.year),
+            repr(self.day),
+            repr(self.input_path))
+
+
+def build_jobs(solutions, inputs_dir, pattern="{year}/day{day}/*.txt", download=False):
+    """Match solutions to input files.
+
+    Args:
+        solutions (list[tuple[str, int, int]]): solution module names, years
+            and days
+        inputs_dir (pathlib.Path): inputs directory
+        pattern (str): input file glob pattern, relative to ``inputs_dir``,
+            formatted with ``year`` and ``day``
+        download (bool): use the downloaded input for solutions without
+            input files
+
+    Returns:
+        list[Job]: jobs
+    """
+
+    jobs = []
+    for module, year, day in solutions:
+        paths = sorted(inputs_dir.glob(pattern.format(year=year, day=day)))
+        if paths:
+            jobs.extend(Job(module, year, day, path) for path in paths)
+        elif download:
+            jobs.append(Job(module, year, day))
+        else:
+            _logger.debug("No inputs for {} day {}".format(year, day))
+    return jobs
+
+
+def prefetch_jobs_inputs(jobs, max_in_flight=4):
+    """Download inputs of jobs without input files, before running.
+
+    Args:
+        jobs (list[Job]): jobs
+        max_in_flight (int): maximum number of concurrent requests
+
+    Returns:
+        dict[tuple[int, int], Exception]: download errors by puzzle year
+            and day
+    """
+
+    puzzles = sorted({(job.year, job.day) for job in jobs if job.input_path is None})
+    if not puzzles:
+        return {}
+    _logger.info("Prefetching {} inputs".format(len(puzzles)))
+    import asyncio
+
+    coro = _common.prefetch_inputs_async(puzzles, max_in_flight=max_in_flight)
+    _, errors = asyncio.run(coro)
+    return errors
+
+
+def _init_worker(log_level):
+    _common.setup_logging(level=log_level)
+
+
+def run_job(job, solution_args=()):
+    """Run a solution on an input.
+
+    Args:
+        job (Job): job to run
+        solution_args (list[str]): extra solution command-line arguments
+
+    Returns:
+        dict: job result, with answers, timings, memory usage and timeouts
+            (with last progress snapshot) keyed by phase name, phase records
+            (see :meth:`_common.Solution.phase_record`), and formatted error
+            on failure
+    """
+
+    result = {
+        "job": job,
+        "answers": {},
+        "timings": {},
+        "memory": {},
+        "timeouts": {},
+        "records": [],
+        "error": None,
+    }
+    try:
+        soln = importlib.import_module(job.module).Solution()
+        args = [] if job.input_path is None else [str(job.input_path)]
+        soln.parse_args(args + list(solution_args))
+        for phase in soln.phases:
+            try:
+                answer = soln.run_phase(phase)
+            except _common.PartTimeout as e:
+                _logger.warning("{} on '{}': {}".format(job.module, job.input_path, e))
+                result["timeouts"][phase] = {"budget": e.budget, "snapshot": e.snapshot}
+                result["records"].append(soln.phase_record(phase, status="timeout"))
+                if phase == "parse":
+                    break
+            else:
+                if phase != "parse":
+                    result["answers"][phase] = answer
+                result["records"].append(soln.phase_record(phase, answer=answer))
+            result["timings"][phase] = soln.timings[phase]
+            if phase in soln.memory:
+                result["memory"][phase] = soln.memory[phase]
+    except Exception:
+        _logger.exception("{} failed on '{}'".format(job.module, job.input_path))
+        result["error"] = traceback.format_exc(limit=1).strip().splitlines()[-1]
+    return result
+
+
+def run_batch(jobs, n_workers=None, log_level=lg.WARNING, solution_args=()):
+    """Run jobs over a process pool.
+
+    Args:
+        jobs (list[Job]): jobs to run
+        n_workers (int): number of worker processes, default: number of
+            processors
+        log_level (int): worker logging level
+        solution_args (list[str]): extra solution command-line arguments
+
+    Returns:
+        list[dict]: job results, in order of ``jobs``
+    """
+
+    with concurrent.futures.ProcessPoolExecutor(
+            max_workers=n_workers,
+            initializer=_init_worker,
+            initargs=(log_level,)) as executor:
+        return list(executor.map(ft.partial(run_job, solution_args=solution_args), jobs))
+
+
+def format_report(results):
+    """Format job results as a table.
+
+    Args:
+        results (list[dict]): job results
+
+    Returns:
+        str: report
+    """
+
+    headers = ("Year", "Day", "Input", "Part 1 answer", "Part 2 answer", "Parse (s)", "Part 1 (s)", "Part 2 (s)")
+    track_memory = any(r["memory"] for r in results)
+    if track_memory:
+        headers += ("Parse peak", "Part 1 peak", "Part 2 peak")
+    rows = []
+    for result in results:
+        job = result["job"]
+        row = [
+            str(job.year),
+            str(job.day),
+            str(job.input_path) if job.input_path else "<download>",
+        ]
+        row.extend(
+            "timed out" if p in result["timeouts"] else str(result["answers"].get(p, ""))
+            for p in ("part_1", "part_2"))
+        row.extend(
+            "{:.3f}".format(result["timings"][p]) if p in result["timings"] else ""
+            for p in ("parse", "part_1", "part_2"))
+        if track_memory:
+            row.extend(
+                _common._format_bytes(result["memory"][p]["peak"]) if p in result["memory"] else ""
+                for p in ("parse", "part_1", "part_2"))
+        if result["error"]:
+            row.append(result["error"])
+        rows.append(row)
+    widths = [max([len(h)] + [len(r[j]) for r in rows]) for j, h in enumerate(headers)]
+    lines = ["  ".join(h.ljust(w) for h, w in zip(headers, widths))]
+    lines.extend("  ".join(c.ljust(w) for c, w in zip(r, widths + [0])).rstrip() for r in rows)
+    return "\n".join(lines)
+
+
+def iter_records(results):
+    """Get machine-readable phase records of job results.
+
+    Args:
+        results (list[dict]): job results
+
+    Yields:
+        dict: JSON-serialisable phase record, with the job's input file,
+            and a record with status 'error' for each failed job
+    """
+
+    for result in results:
+        job = result["job"]
+        input_path = str(job.input_path) if job.input_path else None
+        for record in result["records"]:
+            yield dict(record, input=input_path)
+        if result["error"]:
+            yield {
+                "timestamp": time.time(),
+                "solution": job.module,
+                "year": job.year,
+                "day": job.day,
+                "input": input_path,
+                "status": "error",
+                "error": result["error"],
+            }
+
+
+def main(args=None):
+    """Run batch from command-line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("inputs_dir", type=pathlib.Path, help="inputs directory")
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        help="number of worker processes, default: number of processors")
+    parser.add_argument(
+        "--pattern",
+        default="{year}/day{day}/*.txt",
+        help="input file glob pattern, default: '%(default)s'")
+    parser.add_argument(
+        "--year",
+        type=int,
+        action="append",
+        help="only run solutions for year (may be repeated)")
+    parser.add_argument(
+        "--download",
+        action="store_true",
+        help="download (or use cached) input for solutions without input files")
+    parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="track peak and net memory allocation of each phase (slower)")
+    parser.add_argument(
+        "--time-budget",
+        action="append",
+        default=[],
+        metavar="[PHASE=]SECONDS",
+        help="stop a phase (default: each part) running longer than SECONDS (may be repeated)")
+    parser.add_argument("--json", action="store_true", help="print phase results as JSON lines")
+    parser.add_argument("-v", "--verbose", action="store_true", help="log solution progress")
+    args = parser.parse_args(args)
+    _common.setup_logging(level=lg.DEBUG if args.verbose else lg.INFO)
+
+    discovered = solutions.list_solutions(years=args.year)
+    jobs = build_jobs(discovered, args.inputs_dir, pattern=args.pattern, download=args.download)
+    prefetch_jobs_inputs(jobs)
+    _logger.info("Running {} jobs for {} solutions".format(len(jobs), len(discovered)))
+
+    t = time.time()
+    solution_args = ["--time-budget=" + budget for budget in args.time_budget]
+    if args.memory:
+        solution_args.append("--memory")
+    results = run_batch(
+        jobs,
+        n_workers=args.workers,
+        log_level=lg.DEBUG if args.verbose else lg.WARNING,
+        solution_args=solution_args)
+    wall = time.time() - t
+    total = sum(sum(r["timings"].values()) for r in results)
+    if args.json:
+        for record in iter_records(results):
+            print(json.dumps(record))
+    else:
+        print(format_report(results))
+    _logger.info("Completed {} jobs in {:.2f} s (sum of job times: {:.2f} s)".format(len(jobs), wall, total))
+    return 1 if any(r["error"] for r in results) else 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    sys.exit(main())
@@ -1,62 +1,587 @@
 """Common methods for my Advent of Code solutions."""
 
 import os
+import sys
+import json
+import mmap
 import time
 import atexit
+import hashlib
+import threading
 import pathlib
 import argparse
 import logging as lg
+import contextlib
 import functools as ft
 
-import numpy as np
+_logger = lg.getLogger(__name__)
+_timings = {}
+_record_call_times = os.environ.get("AOC_RECORD_CALL_TIMES", "1").lower() not in ("0", "false", "no")
+_session = None
+_answer_cache_counts = {"hits": 0, "misses": 0}
+_profiles = []
+_trace = None
+_progress_snapshot = {}
+_code_versions = {}
+_span_local = threading.local()
 
-try:
-    import coloredlogs
-except ImportError as e:
-    coloredlogs = e
 
-try:
-    import requests
-except ImportError as e:
-    requests = e
+def _get_rss():
+    """Get process resident set size (bytes), ``None`` if unavailable."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
 
-try:
-    import colored_traceback
-    colored_traceback.add_hook(style="perldoc")
-except ImportError as e:
-    colored_traceback = e
 
-_logger = lg.getLogger(__name__)
-_timings = {}
+def _format_bytes(n, sign=False):
+    """Format a number of bytes in binary units."""
+    for unit in ("B", "KiB", "MiB"):
+        if abs(n) < 1024:
+            break
+        n /= 1024
+    else:
+        unit = "GiB"
+    return ("{:+.1f} {}" if sign else "{:.1f} {}").format(n, unit)
+
+
+class _NullSpan:
+    """Span which records nothing, used when not tracing."""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, t, v, tb):
+        return False
+
+
+_null_span = _NullSpan()
+
+
+def _get_span_stack():
+    try:
+        return _span_local.stack
+    except AttributeError:
+        _span_local.stack = []
+        return _span_local.stack
+
+
+class Span:
+    """Traced context, nested under the current thread's open span.
+
+    Records monotonic wall time and thread CPU time.
+
+    Args:
+        name (str): span name
+        args (dict): extra trace event data
+    """
+
+    __slots__ = ("name", "args", "parent", "elapsed", "cpu", "_t", "_cpu_t")
+
+    def __init__(self, name, args=None):
+        self.name = name
+        self.args = args
+        self.parent = None
+        self.elapsed = None
+        self.cpu = None
+        self._t = None
+        self._cpu_t = None
+
+    def __enter__(self):
+        stack = _get_span_stack()
+        self.parent = stack[-1] if stack else None
+        stack.append(self)
+        self._cpu_t = time.thread_time_ns()
+        self._t = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, t, v, tb):
+        end = time.perf_counter_ns()
+        cpu = time.thread_time_ns() - self._cpu_t
+        self.elapsed = (end - self._t) / 1e9
+        self.cpu = cpu / 1e9
+        _get_span_stack().pop()
+        trace = _trace
+        if trace is not None:
+            if len(trace["events"]) < trace["max_events"]:
+                trace["events"].append((self.name, self._t, end - self._t, cpu, threading.get_ident(), self.args))
+            else:
+                trace["n_dropped"] += 1
+        return False
+
+
+def span(name, **args):
+    """Trace a context. Use as a context-manager.
+
+    Does nothing (and costs little) unless tracing was started with
+    :func:`start_tracing`.
+
+    Args:
+        name (str): span name
+        **args: extra trace event data
+
+    Returns:
+        Span: span context-manager
+    """
+
+    if _trace is None:
+        return _null_span
+    return Span(name, args or None)
+
+
+def start_tracing(max_events=10 ** 6):
+    """Start recording spans.
+
+    Args:
+        max_events (int): maximum number of spans to record, after which
+            spans are dropped
+    """
+
+    global _trace
+    _trace = {"events": [], "max_events": max_events, "n_dropped": 0, "t0": time.perf_counter_ns()}
+
+
+def stop_tracing():
+    """Stop recording spans.
+
+    Returns:
+        list[dict]: recorded spans as Chrome trace events
+    """
+
+    global _trace
+    trace, _trace = _trace, None
+    if trace is None:
+        return []
+    if trace["n_dropped"]:
+        _logger.warning("Dropped {} trace spans over limit".format(trace["n_dropped"]))
+    pid = os.getpid()
+    events = []
+    for name, start, duration, cpu, tid, args in trace["events"]:
+        event_args = {"cpu_ms": cpu / 1e6}
+        event_args.update(args or {})
+        events.append({
+            "name": name,
+            "ph": "X",
+            "ts": (start - trace["t0"]) / 1e3,
+            "dur": duration / 1e3,
+            "pid": pid,
+            "tid": tid,
+            "args": event_args,
+        })
+    return events
+
+
+def export_trace(path):
+    """Stop recording spans, and write them as Chrome trace-event JSON.
+
+    Args:
+        path (pathlib.Path): output trace file path
+    """
+
+    events = stop_tracing()
+    path.write_text(json.dumps({"traceEvents": events, "displayTimeUnit": "ms"}))
+    _logger.info("Wrote {} trace spans to '{}'".format(len(events), path))
 
 
 class LogTime:
     """Log time of context.
 
+    Also traced as a span, and records CPU time.
+
     Args:
         name (str): name of context
+        track_memory (bool): also log ``tracemalloc`` peak and net
+            allocation, and resident set size change, of context
     """
 
-    def __init__(self, name):
+    def __init__(self, name, track_memory=False):
         self.name = name
+        self.track_memory = track_memory
+        self.elapsed = None
+        self.cpu = None
+        self.memory = None
         self._t = None
+        self._cpu_t = None
+        self._span = None
+        self._stop_tracing = False
+        self._mem_start = None
+        self._rss_start = None
 
     def __enter__(self):
-        self._t = time.time()
+        if self.track_memory:
+            import tracemalloc
+
+            self._stop_tracing = not tracemalloc.is_tracing()
+            if self._stop_tracing:
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+            self._mem_start = tracemalloc.get_traced_memory()[0]
+            self._rss_start = _get_rss()
+        self._span = span(self.name)
+        self._span.__enter__()
+        self._cpu_t = time.process_time()
+        self._t = time.perf_counter()
         return self
 
     def __exit__(self, t, v, tb):
+        self.elapsed = time.perf_counter() - self._t
+        self.cpu = time.process_time() - self._cpu_t
+        self._span.__exit__(t, v, tb)
         _s = "completed" if (t, v, tb) == (None, None, None) else "failed"
-        _logger.debug("{} {} in {:.2f} s".format(self.name, _s, time.time() - self._t))
+        details = ["CPU {:.2f} s".format(self.cpu)]
+        if self.track_memory:
+            import tracemalloc
+
+            current, peak = tracemalloc.get_traced_memory()
+            if self._stop_tracing:
+                tracemalloc.stop()
+            rss = _get_rss()
+            self.memory = {
+                "peak": peak - self._mem_start,
+                "net": current - self._mem_start,
+                "rss": None if rss is None or self._rss_start is None else rss - self._rss_start,
+            }
+            details.append("peak {}".format(_format_bytes(self.memory["peak"])))
+            details.append("net {}".format(_format_bytes(self.memory["net"], sign=True)))
+            if self.memory["rss"] is not None:
+                details.append("RSS {}".format(_format_bytes(self.memory["rss"], sign=True)))
+        _logger.debug("{} {} in {:.2f} s ({})".format(self.name, _s, self.elapsed, ", ".join(details)))
+        return False
+
+
+class PartTimeout(Exception):
+    """Solution phase ran over its time budget.
+
+    Args:
+        phase (str): phase name
+        budget (float): time budget (s)
+        snapshot (dict): last progress snapshot of the phase
+    """
+
+    def __init__(self, phase=None, budget=None, snapshot=None):
+        super().__init__(phase, budget, snapshot)
+        self.phase = phase
+        self.budget = budget
+        self.snapshot = snapshot
+
+    def __str__(self):
+        return "{} ran over time budget of {} s, last progress: {}".format(self.phase, self.budget, self.snapshot)
+
+
+class Watchdog:
+    """Interrupt the current thread if a context runs over a time budget.
+
+    Raises :class:`PartTimeout` in the thread which entered the context,
+    from a timer thread. The exception is only raised between Python
+    bytecode instructions, so long-running C calls finish first.
+
+    Args:
+        budget (float): time budget (s)
+    """
+
+    def __init__(self, budget):
+        self.budget = budget
+        self.fired = False
+        self._thread_id = None
+        self._timer = None
+        self._active = False
+        self._lock = threading.Lock()
+
+    def _set_async_exc(self, exc):
+        import ctypes
+
+        exc = None if exc is None else ctypes.py_object(exc)  # None clears
+        ctypes.pythonapi.PyThreadState_SetAsyncExc(ctypes.c_ulong(self._thread_id), exc)
+
+    def _fire(self):
+        with self._lock:
+            if self._active:
+                self.fired = True
+                self._set_async_exc(PartTimeout)
+
+    def __enter__(self):
+        self._thread_id = threading.get_ident()
+        self._active = True
+        self._timer = threading.Timer(self.budget, self._fire)
+        self._timer.daemon = True
+        self._timer.start()
+        return self
+
+    def __exit__(self, t, v, tb):
+        with self._lock:
+            self._active = False
+            self._timer.cancel()
+            if self.fired and (t is None or not issubclass(t, PartTimeout)):
+                self._set_async_exc(None)  # fired just as context finished or failed
+        return False
+
+
+def set_progress_snapshot(**state):
+    """Record a snapshot of the current phase's progress.
+
+    Reported if the phase runs over its time budget. Call this
+    occasionally (eg when logging progress), not every step.
+
+    Args:
+        **state: progress description
+    """
+
+    _progress_snapshot.clear()
+    _progress_snapshot.update(state)
+
+
+def get_progress_snapshot():
+    """Get the last recorded progress snapshot.
+
+    Returns:
+        dict: progress description
+    """
+
+    return dict(_progress_snapshot)
+
+
+def _format_duration(seconds):
+    """Format a duration as eg '1:02:03'."""
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return "{}:{:02d}:{:02d}".format(hours, minutes, seconds)
+
+
+class Progress:
+    """Rate-limited progress reporter for hot loops.
+
+    Logs at most every ``interval`` seconds, with throughput and (given
+    ``total``) estimated time remaining, and records the progress
+    snapshot (see :func:`set_progress_snapshot`) each time the clock is
+    read. The clock is only read
+    after an adaptive number of steps, ``next_check``. In the hottest
+    loops, avoid the method call of :meth:`step` by comparing the loop's
+    own counter to ``next_check`` and only then calling :meth:`update`,
+    so a step which doesn't report costs a counter increment and
+    comparison.
+
+    Args:
+        name (str): name of the loop
+        total (int): total number of steps, if known
+        interval (float): minimum time between reports (s)
+        describe (callable): returns a dict of extra state to report,
+            only called when the clock is read
+        start (int): initial step count, eg when resuming
+        unit (str): step unit name
+        logger (logging.Logger): logger to report to, default: this
+            module's
+        level (int): logging level of reports
+    """
+
+    def __init__(
+            self,
+            name,
+            total=None,
+            interval=5.0,
+            describe=None,
+            start=0,
+            unit="steps",
+            logger=None,
+            level=lg.DEBUG):
+        self.name = name
+        self.total = total
+        self.interval = interval
+        self.describe = describe
+        self.unit = unit
+        self.logger = logger or _logger
+        self.level = level
+        self.count = start
+        self._start_count = self._last_count = start
+        self._start_time = self._last_time = time.perf_counter()
+        self._stride = 1
+        self.next_check = start + 1
+
+    def step(self, n=1):
+        """Record completed steps, reporting if due.
+
+        Args:
+            n (int): number of steps completed
+        """
+
+        self.count += n
+        if self.count >= self.next_check:
+            self._check()
+
+    def update(self, count):
+        """Set the number of completed steps, reporting if due.
+
+        Args:
+            count (int): total number of steps completed
+        """
+
+        self.count = count
+        if count >= self.next_check:
+            self._check()
+
+    def _check(self):
+        now = time.perf_counter()
+        state = self._snapshot()
+        if now - self._last_time >= self.interval:
+            self._log(now, state)
+            self._last_time = now
+            self._last_count = self.count
+        rate = (self.count - self._start_count) / max(now - self._start_time, 1e-9)
+        self._stride = max(1, min(2 * self._stride, int(rate * self.interval / 8)))
+        self.next_check = self.count + self._stride
+
+    def _snapshot(self):
+        state = self.describe() if self.describe else {}
+        set_progress_snapshot(**{self.unit: self.count}, **state)
+        return state
+
+    def report(self):
+        """Log progress and record the progress snapshot."""
+        self._log(time.perf_counter(), self._snapshot())
+
+    def _log(self, now, state):
+        if not self.logger.isEnabledFor(self.level):
+            return
+        rate = (self.count - self._last_count) / max(now - self._last_time, 1e-9)
+        details = ["{:.3g} {}/s".format(rate, self.unit)]
+        if self.total is not None:
+            progress = "{}/{} {} ({:.1f}%)".format(self.count, self.total, self.unit, 100 * self.count / self.total)
+            if rate > 0:
+                details.append("ETA {}".format(_format_duration((self.total - self.count) / rate)))
+        else:
+            progress = "{} {}".format(self.count, self.unit)
+        details.extend("{}: {}".format(k, v) for k, v in state.items())
+        self.logger.log(self.level, "{}: {}, {}".format(self.name, progress, ", ".join(details)))
+
+    def close(self):
+        """Log the loop's total steps and mean throughput."""
+        if not self.logger.isEnabledFor(self.level):
+            return
+        elapsed = time.perf_counter() - self._start_time
+        n = self.count - self._start_count
+        _s = "{}: completed {} {} in {:.2f} s ({:.3g} {}/s)"
+        self.logger.log(self.level, _s.format(self.name, n, self.unit, elapsed, n / max(elapsed, 1e-9), self.unit))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, t, v, tb):
+        if t is None:
+            self.close()
+        return False
+
+
+class Checkpointer:
+    """Periodically save simulation state, to resume after interruption.
+
+    State is pickled and gzip-compressed, written atomically to a single
+    file which is overwritten by each save, so the file always holds the
+    latest snapshot.
+
+    Simulations call :meth:`due` as they step (cheaply: not necessarily
+    every step), then :meth:`save` if due, and :meth:`load` before
+    starting.
+
+    Args:
+        path (pathlib.Path): checkpoint file path
+        every_steps (int): save after this many steps since the last save
+        every_seconds (float): save after this much time since the last
+            save (s)
+        resume (bool): load the existing checkpoint, if any
+    """
+
+    def __init__(self, path, every_steps=None, every_seconds=None, resume=False):
+        self.path = path
+        self.every_steps = every_steps
+        self.every_seconds = every_seconds
+        self.resume = resume
+        self._last_step = 0
+        self._last_time = time.perf_counter()
+
+    def due(self, step):
+        """Check if a checkpoint should be saved.
+
+        Args:
+            step (int): number of completed steps
+
+        Returns:
+            bool: checkpoint is due
+        """
+
+        if self.every_steps is not None and step - self._last_step >= self.every_steps:
+            return True
+        if self.every_seconds is not None and time.perf_counter() - self._last_time >= self.every_seconds:
+            return True
         return False
 
+    def save(self, step, state):
+        """Save a checkpoint.
+
+        Args:
+            step (int): number of completed steps
+            state: picklable simulation state
+        """
+
+        import gzip
+        import pickle
+
+        with LogTime("Checkpoint at step {}".format(step)):
+            data = gzip.compress(pickle.dumps((step, state), protocol=pickle.HIGHEST_PROTOCOL), compresslevel=1)
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp{}".format(os.getpid()))
+            tmp_path.write_bytes(data)
+            tmp_path.replace(self.path)
+        self._last_step = step
+        self._last_time = time.perf_counter()
+
+    def load(self):
+        """Load the latest checkpoint, if resuming.
+
+        Returns:
+            tuple[int, object]: number of completed steps and simulation
+                state, ``None`` if not resuming or there's no checkpoint
+        """
+
+        import gzip
+        import pickle
+
+        if not self.resume or not self.path.exists():
+            return None
+        step, state = pickle.loads(gzip.decompress(self.path.read_bytes()))
+        _logger.info("Resuming from checkpoint at step {} in '{}'".format(step, self.path))
+        self._last_step = step
+        return step, state
+
+    def clear(self):
+        """Remove the checkpoint, eg after the simulation completes."""
+        if self.path.exists():
+            self.path.unlink()
+
+
+def setup_logging(level=lg.DEBUG):
+    """Setup logging.
+
+    Args:
+        level (int): root logging level
+    """
 
-def setup_logging():
-    """Setup logging."""
-    level = lg.DEBUG
     format_ = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
     datefmt = "%H:%M:%S"
-    if not isinstance(coloredlogs, Exception):
+
+    try:
+        import colored_traceback
+    except ImportError:
+        pass
+    else:
+        colored_traceback.add_hook(style="perldoc")
+
+    try:
+        import coloredlogs
+    except ImportError:
+        coloredlogs = None
+
+    if coloredlogs is not None:
         field_styles = {
             "asctime": {"faint": True, "color": "white"},
             "levelname": {"bold": True, "color": "blue"},
@@ -67,9 +592,130 @@ def setup_logging():
         lg.basicConfig(level=level, format=format_, datefmt=datefmt)
 
 
+class CallStats:
+    """Streaming call-time statistics.
+
+    Keeps a fixed-size log-scale histogram of durations (8 buckets per
+    doubling) for percentile estimates, rather than every sample.
+    """
+
+    __slots__ = ("count", "total", "min", "max", "buckets")
+    _n_buckets = 496
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+        self.min = float("inf")
+        self.max = float("-inf")
+        self.buckets = [0] * self._n_buckets
+
+    @staticmethod
+    def _bucket(t):
+        if t < 16:
+            return t
+        e = t.bit_length() - 4
+        return e * 8 + 8 + ((t >> e) & 7)
+
+    @staticmethod
+    def _bucket_bounds(idx):
+        if idx < 16:
+            return idx, idx + 1
+        e, sub = divmod(idx - 8, 8)
+        return (8 + sub) << e, (9 + sub) << e
+
+    def add(self, t):
+        """Add a sample.
+
+        Args:
+            t (int): call duration (ns)
+        """
+
+        self.count += 1
+        self.total += t
+        if t < self.min:
+            self.min = t
+        if t > self.max:
+            self.max = t
+        if t < 16:
+            self.buckets[t] += 1
+        else:  # inlined _bucket
+            e = t.bit_length() - 4
+            self.buckets[e * 8 + 8 + ((t >> e) & 7)] += 1
+
+    @property
+    def mean(self):
+        return self.total / self.count
+
+    @property
+    def std(self):
+        """float: standard deviation, estimated from the histogram."""
+        mean = self.mean
+        total_sq = 0.0
+        for idx, n in enumerate(self.buckets):
+            if n:
+                lower, upper = self._bucket_bounds(idx)
+                total_sq += n * ((lower + upper - 1) / 2.0 - mean) ** 2
+        return (total_sq / self.count) ** 0.5
+
+    def percentile(self, q):
+        """Estimate a percentile from the histogram.
+
+        Args:
+            q (float): percentile, in [0, 100]
+
+        Returns:
+            float: estimated call duration (ns) at percentile
+        """
+
+        rank = q / 100.0 * self.count
+        seen = 0
+        for idx, n in enumerate(self.buckets):
+            seen += n
+            if n and seen >= rank:
+                lower, upper = self._bucket_bounds(idx)
+                return min(max((lower + upper - 1) / 2.0, self.min), self.max)
+        return float(self.max)
+
+
+def _percentile(values, q):
+    """Compute percentile of values, interpolating linearly."""
+    values = sorted(values)
+    pos = (len(values) - 1) * q / 100.0
+    j = int(pos)
+    if j + 1 >= len(values):
+        return values[-1]
+    return values[j] + (values[j + 1] - values[j]) * (pos - j)
+
+
+def measure_startup_time(module, n=1):
+    """Measure cold-start time of importing a module in a new interpreter.
+
+    Args:
+        module (str): module name, importable from the repository root
+        n (int): number of measurements
+
+    Returns:
+        list[float]: interpreter start and import times (s)
+    """
+
+    import subprocess
+
+    cmd = [sys.executable, "-c", "import {}".format(module)]
+    times = []
+    for _ in range(n):
+        t = time.perf_counter()
+        subprocess.run(cmd, cwd=str(pathlib.Path(__file__).parent), check=True)
+        times.append(time.perf_counter() - t)
+    return times
+
+
 def record_call_times(fn):
     """Record call times of function. Use as a decorator.
 
+    Disable recording by setting environment variable
+    ``AOC_RECORD_CALL_TIMES`` to ``0`` before import, which leaves
+    functions unwrapped.
+
     Args:
         fn (callable): function to record call times of
 
@@ -77,23 +723,119 @@ def record_call_times(fn):
         callable: wrapping function
     """
 
-    _timings[fn.__name__] = []
+    if not _record_call_times:
+        return fn
+
+    stats = _timings[fn.__qualname__] = CallStats()
+    add = stats.add
+    perf_counter_ns = time.perf_counter_ns
 
     @ft.wraps(fn)
     def wrapped(*args, **kwargs):
-        t = time.time()
+        t = perf_counter_ns()
         res = fn(*args, **kwargs)
-        _timings[fn.__name__].append(time.time() - t)
+        add(perf_counter_ns() - t)
         return res
 
     return wrapped
 
 
+def _to_json_value(value):
+    """Convert an answer to a JSON-serialisable value."""
+    if type(value).__module__ == "numpy":
+        value = value.item()
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    return str(value)
+
+
 class Solution:  # TODO: unit-test
     """Solution interface."""
+    phases = ("parse", "part_1", "part_2")
+    time_budgets = {}
+    _phase_names = {"parse": "Parse", "part_1": "Part 1", "part_2": "Part 2"}
+
     def __init__(self):
         self.parser = argparse.ArgumentParser()
+        self.parser.add_argument(
+            "--bench",
+            type=int,
+            metavar="N",
+            help="benchmark solution phases over N runs, instead of printing answers")
+        self.parser.add_argument(
+            "--warmup",
+            type=int,
+            default=0,
+            metavar="K",
+            help="number of unrecorded benchmark runs, default: %(default)s")
+        self.parser.add_argument(
+            "--baseline",
+            type=pathlib.Path,
+            help="benchmark baseline file, written if it doesn't exist")
+        self.parser.add_argument(
+            "--update-baseline",
+            action="store_true",
+            help="overwrite existing benchmark baseline")
+        self.parser.add_argument(
+            "--threshold",
+            type=float,
+            default=0.1,
+            help="fractional median slowdown from baseline to flag as regressed, default: %(default)s")
+        self.parser.add_argument(
+            "--memory",
+            action="store_true",
+            help="track peak and net memory allocation of each phase (slower)")
+        self.parser.add_argument(
+            "--time-budget",
+            action="append",
+            default=[],
+            metavar="[PHASE=]SECONDS",
+            help="stop a phase (default: each part) running longer than SECONDS (may be repeated)")
+        self.parser.add_argument(
+            "--json",
+            action="store_true",
+            help="print results as JSON lines, one record per phase")
+        self.parser.add_argument(
+            "--checkpoint-dir",
+            type=pathlib.Path,
+            metavar="DIR",
+            help="periodically save long-running simulation state to DIR")
+        self.parser.add_argument(
+            "--checkpoint-every-steps",
+            type=int,
+            metavar="N",
+            help="save a checkpoint every N simulation steps")
+        self.parser.add_argument(
+            "--checkpoint-every-seconds",
+            type=float,
+            metavar="SECONDS",
+            help="save a checkpoint every SECONDS, default: 60 if no step frequency is given")
+        self.parser.add_argument(
+            "--resume",
+            action="store_true",
+            help="resume simulations from their latest checkpoint in the checkpoint directory")
+        self.parser.add_argument(
+            "--trace",
+            type=pathlib.Path,
+            metavar="PATH",
+            help="write spans as Chrome trace-event JSON to PATH")
+        self.parser.add_argument(
+            "--profile",
+            type=pathlib.Path,
+            metavar="DIR",
+            help="profile each phase, writing pstats and collapsed-stack files to DIR")
+        self.parser.add_argument(
+            "--profile-top",
+            type=int,
+            default=10,
+            metavar="N",
+            help="number of hottest functions per profiled phase to log, default: %(default)s")
         self.args = None
+        self.timings = {}
+        self.cpu_times = {}
+        self.memory = {}
+        self.cache_hits = set()
+        self.checkpointer = None
 
     def part_1(self):
         """Part 1 solution computation."""
@@ -103,28 +845,346 @@ class Solution:  # TODO: unit-test
         """Part 2 solution computation."""
         raise NotImplementedError
 
+    def parse_args(self, args=None):
+        """Parse command-line arguments.
+
+        Args:
+            args (list[str]): arguments, default: ``sys.argv[1:]``
+        """
+
+        self.args = self.parser.parse_args(args)
+
     def parse(self):
         """Parse command-line argument."""
-        self.args = self.parser.parse_args()
+        if self.args is None:
+            self.parse_args()
+
+    def run_phase(self, phase):
+        """Run and time a solution phase.
+
+        Args:
+            phase (str): phase method name, one of ``phases``
+
+        Returns:
+            phase result
+        """
+
+        cache_key = self._get_answer_cache_key(phase)
+        if cache_key:
+            cache = AnswerCache()
+            with LogTime(self._phase_names[phase] + " (cache lookup)") as timer:
+                hit, res = cache.get(cache_key)
+            if hit:
+                self.timings[phase] = timer.elapsed
+                self.cpu_times[phase] = timer.cpu
+                self.cache_hits.add(phase)
+                return res
+
+        profile = None
+        if self.args and self.args.profile:
+            import cProfile
+
+            profile = cProfile.Profile()
+        track_memory = bool(self.args and self.args.memory)
+        budget = self.get_time_budget(phase)
+        watchdog = Watchdog(budget) if budget else contextlib.nullcontext()
+        _progress_snapshot.clear()
+        self.checkpointer = self.get_checkpointer(phase)
+        try:
+            with LogTime(self._phase_names[phase], track_memory=track_memory) as timer:
+                with watchdog:
+                    if profile:
+                        res = profile.runcall(getattr(self, phase))
+                    else:
+                        res = getattr(self, phase)()
+        except PartTimeout:
+            self.timings[phase] = timer.elapsed
+            self.cpu_times[phase] = timer.cpu
+            if track_memory:
+                self.memory[phase] = timer.memory
+            raise PartTimeout(phase, budget, get_progress_snapshot()) from None
+        self.timings[phase] = timer.elapsed
+        self.cpu_times[phase] = timer.cpu
+        if self.checkpointer:
+            self.checkpointer.clear()
+            self.checkpointer = None
+        if track_memory:
+            self.memory[phase] = timer.memory
+        if profile:
+            name = "{}.{}".format(self.module_name or type(self).__module__, phase)
+            write_profile(profile, self.args.profile / name, top=self.args.profile_top)
+        if cache_key:
+            cache.set(cache_key, res)
+        return res
+
+    @property
+    def module_name(self):
+        """str: solution's module importable name, ``None`` if unknown."""
+        module = type(self).__module__
+        if module == "__main__":
+            spec = sys.modules["__main__"].__spec__
+            module = spec and spec.name
+        return module
+
+    def _get_answer_cache_key(self, phase):
+        """Get the answer cache key for a phase, ``None`` to not cache."""
+        return None
+
+    def _get_checkpoint_name(self, phase):
+        """Get the checkpoint file name of a phase."""
+        return "{}.{}".format(self.module_name or type(self).__module__, phase)
+
+    def get_checkpointer(self, phase):
+        """Get simulation checkpointer for a phase.
+
+        Solutions pass ``self.checkpointer`` (set while a phase runs) to
+        long-running simulations.
+
+        Args:
+            phase (str): phase name
+
+        Returns:
+            Checkpointer: checkpointer, ``None`` if checkpointing is
+                disabled or for parsing
+        """
+
+        if phase == "parse" or not self.args or not self.args.checkpoint_dir:
+            return None
+        every_seconds = self.args.checkpoint_every_seconds
+        if every_seconds is None and self.args.checkpoint_every_steps is None:
+            every_seconds = 60.0
+        return Checkpointer(
+            self.args.checkpoint_dir / (self._get_checkpoint_name(phase) + ".ckpt.gz"),
+            every_steps=self.args.checkpoint_every_steps,
+            every_seconds=every_seconds,
+            resume=self.args.resume)
+
+    def get_time_budget(self, phase):
+        """Get time budget of a phase.
+
+        From command-line ``--time-budget``, else class attribute
+        ``time_budgets``.
+
+        Args:
+            phase (str): phase name
+
+        Returns:
+            float: time budget (s), ``None`` for no budget
+        """
+
+        budget = self.time_budgets.get(phase)
+        for item in (self.args.time_budget if self.args else []):
+            budget_phase, _, seconds = item.rpartition("=")
+            if budget_phase == phase or (not budget_phase and phase != "parse"):
+                budget = float(seconds)
+        return budget
+
+    def phase_record(self, phase, answer=None, status="ok"):
+        """Get machine-readable result of a run phase.
+
+        Args:
+            phase (str): phase name
+            answer: phase answer
+            status (str): phase outcome: 'ok' or 'timeout'
+
+        Returns:
+            dict: JSON-serialisable record
+        """
+
+        memory = self.memory.get(phase, {})
+        return {
+            "timestamp": time.time(),
+            "solution": self.module_name or type(self).__module__,
+            "phase": phase,
+            "status": status,
+            "answer": _to_json_value(answer),
+            "cached": phase in self.cache_hits,
+            "wall_time": self.timings.get(phase),
+            "cpu_time": self.cpu_times.get(phase),
+            "peak_memory": memory.get("peak"),
+        }
+
+    def _report_phase(self, phase, answer=None, status="ok", snapshot=None):
+        """Print a phase's answer, as text or JSON."""
+        if self.args.json:
+            record = self.phase_record(phase, answer=answer, status=status)
+            if snapshot is not None:
+                record["progress"] = {k: _to_json_value(v) for k, v in snapshot.items()}
+            print(json.dumps(record), flush=True)
+        elif phase != "parse":
+            answer = "timed out" if status == "timeout" else answer
+            print("{} answer:".format(self._phase_names[phase]), answer)
+
+    def run(self, args=None):
+        """Run solution.
+
+        Parts running over their time budget are reported as timed out,
+        and the remaining part still run.
+
+        Args:
+            args (list[str]): command-line arguments, default:
+                ``sys.argv[1:]``
+
+        Returns:
+            int: exit status, 1 if parsing timed out, or see :meth:`bench`
+        """
 
-    def run(self):
-        """Run solution."""
         setup_logging()
-        self.parse()
-        with LogTime("Part 1"):
-            print("Part 1 answer:", self.part_1())
-        with LogTime("Part 2"):
-            print("Part 2 answer:", self.part_2())
+        if args is not None or self.args is None:
+            self.parse_args(args)
+        if self.args.bench:
+            return self.bench()
+        if self.args.trace:
+            start_tracing()
+        try:
+            try:
+                self.run_phase("parse")
+            except PartTimeout as e:
+                _logger.error(str(e))
+                self._report_phase("parse", status="timeout", snapshot=e.snapshot)
+                return 1
+            self._report_phase("parse")
+            for phase in ("part_1", "part_2"):
+                try:
+                    answer = self.run_phase(phase)
+                except PartTimeout as e:
+                    _logger.warning(str(e))
+                    self._report_phase(phase, status="timeout", snapshot=e.snapshot)
+                else:
+                    self._report_phase(phase, answer=answer)
+        finally:
+            if self.args.trace:
+                export_trace(self.args.trace)
+
+    @property
+    def bench_key(self):
+        """str: benchmark baseline entry name, available after parsing."""
+        return type(self).__module__
+
+    def bench(self):
+        """Benchmark solution phases, comparing to baseline.
+
+        Each run uses a new solution instance, as later phases may depend
+        on state from earlier phases. Interpreter start-up and module
+        import time is also measured, in a new process per run.
+
+        Phases running over their time budget are reported, and excluded
+        from the timings.
+
+        Returns:
+            int: exit status, 1 if any phase regressed from the baseline or
+                timed out
+        """
+
+        samples = {}
+        module = self.module_name
+        if module:
+            samples["startup"] = measure_startup_time(module, n=self.args.bench)
+        samples.update({phase: [] for phase in self.phases})
+        peaks = {phase: [] for phase in self.phases}
+        timeouts = {phase: 0 for phase in self.phases}
+        for j in range(self.args.warmup + self.args.bench):
+            soln = type(self)()
+            soln.args = self.args
+            completed = []
+            for phase in soln.phases:
+                try:
+                    soln.run_phase(phase)
+                except PartTimeout as e:
+                    _logger.warning(str(e))
+                    timeouts[phase] += j >= self.args.warmup
+                    if phase == "parse":
+                        break
+                else:
+                    completed.append(phase)
+            if j >= self.args.warmup:
+                for phase in completed:
+                    samples[phase].append(soln.timings[phase])
+                    if phase in soln.memory:
+                        peaks[phase].append(soln.memory[phase]["peak"])
+        key = soln.bench_key
+
+        results = {
+            phase: {
+                "min": min(times) if times else None,
+                "median": _percentile(times, 50) if times else None,
+                "p95": _percentile(times, 95) if times else None,
+            } for phase, times in samples.items()}
+        for phase, phase_peaks in peaks.items():
+            if phase_peaks:
+                results[phase]["peak_memory"] = max(phase_peaks)
+        for phase, n_timeouts in timeouts.items():
+            if n_timeouts:
+                results[phase]["timeouts"] = n_timeouts
+
+        baselines = {}
+        baseline = None
+        if self.args.baseline and self.args.baseline.exists():
+            baselines = json.loads(self.args.baseline.read_text())
+            baseline = baselines.get(key)
+
+        regressed = [
+            phase for phase, result in results.items()
+            if baseline and baseline.get(phase) and baseline[phase]["median"] is not None
+            and (result["median"] is None
+                 or result["median"] > baseline[phase]["median"] * (1.0 + self.args.threshold))]
+        if self.args.json:
+            for phase, result in results.items():
+                base = baseline and baseline.get(phase)
+                record = {
+                    "timestamp": time.time(),
+                    "solution": module or type(self).__module__,
+                    "bench_key": key,
+                    "phase": phase,
+                    "runs": self.args.bench,
+                    "baseline_median": base["median"] if base else None,
+                    "regressed": phase in regressed,
+                }
+                record.update(result)
+                print(json.dumps(record), flush=True)
+        else:
+            self._print_bench(results, baseline, regressed)
+
+        if regressed:
+            _s = "Phases regressed by more than {:.0%} from baseline: {}"
+            _logger.warning(_s.format(self.args.threshold, ", ".join(regressed)))
+        if self.args.baseline and (baseline is None or self.args.update_baseline):
+            baselines[key] = results
+            self.args.baseline.write_text(json.dumps(baselines, indent=2, sort_keys=True))
+            _logger.info("Wrote benchmark baseline to '{}'".format(self.args.baseline))
+        return 1 if regressed or any(timeouts.values()) else 0
+
+    def _print_bench(self, results, baseline, regressed):
+        """Print benchmark results as a table."""
+        track_memory = any("peak_memory" in result for result in results.values())
+        lines = ["Phase    Min (s)   Median (s)  P95 (s) " + ("  Peak memory" if track_memory else "") + "  Baseline median (s)"]
+        for phase, result in results.items():
+            base = baseline and baseline.get(phase)
+            if result["median"] is None:
+                line = "{:7s}  {:>8s}  {:>10s}  {:>8s}".format(phase, "", "timed out", "")
+            else:
+                line = "{:7s}  {:8.4f}  {:10.4f}  {:8.4f}".format(phase, result["min"], result["median"], result["p95"])
+            if track_memory:
+                line += "  {:>11s}".format(_format_bytes(result["peak_memory"]) if "peak_memory" in result else "")
+            if base and base["median"] is not None:
+                line += "  {:19.4f}".format(base["median"])
+                if phase in regressed:
+                    line += "  REGRESSED"
+            if result.get("timeouts"):
+                line += "  ({} timed out)".format(result["timeouts"])
+            lines.append(line.rstrip())
+        print("Benchmark over {} runs:\n{}".format(self.args.bench, "\n".join(lines)))
 
     @classmethod
     def main(cls):
-        cls().run()
+        sys.exit(cls().run())
 
 
 class InputtedSolution(Solution):  # TODO: unit-test
     """Solution interface with an input text file."""
     year = None
     day = None
+    cache_answers = False
 
     def __init__(self):
         super().__init__()
@@ -134,20 +1194,258 @@ class InputtedSolution(Solution):  # TODO: unit-test
             help="input data file, default: download from 'adventofcode.com'",
             nargs="?",
         )
+        self.parser.add_argument(
+            "--no-cache",
+            action="store_true",
+            help="don't use or store cached answers")
         self.input_text = None
+        self.input_path = None
+        self._input_digest = None
+
+    @property
+    def streaming(self):
+        """bool: don't load the input text, only its path."""
+        return False
 
     def parse(self):
         super().parse()
-        if self.args.input_txt is None:
+        self._input_digest = None
+        if self.streaming:
+            if self.args.input_txt is None:
+                self.input_path = download_input_file(self.day, self.year)
+            else:
+                self.input_path = self.args.input_txt
+        elif self.args.input_txt is None:
             self.input_text = download_input(self.day, self.year)
         else:
+            self.input_path = self.args.input_txt
             self.input_text = self.args.input_txt.read_text()
 
+    @property
+    def input_digest(self):
+        """str: SHA-256 hex-digest of input text, computed once per parse."""
+        if self._input_digest is None:
+            if self.input_text is not None:
+                self._input_digest = hashlib.sha256(self.input_text.encode()).hexdigest()
+            else:
+                hash_ = hashlib.sha256()
+                with self.input_path.open("rb") as f:
+                    for chunk in iter(lambda: f.read(2 ** 20), b""):
+                        hash_.update(chunk)
+                self._input_digest = hash_.hexdigest()
+        return self._input_digest
+
+    def _get_answer_cache_key(self, phase):
+        if not self.cache_answers or self.args.no_cache or phase == "parse":
+            return None
+        if self.args.bench or self.args.profile:
+            return None  # time and profile the computation, not the lookup
+        return (self.module_name or type(self).__module__, phase, self._code_version, self.input_digest)
+
+    @property
+    def _code_version(self):
+        """str: SHA-256 hex-digest of the solution's module source."""
+        module = type(self).__module__
+        if module not in _code_versions:
+            source = pathlib.Path(sys.modules[module].__file__).read_bytes()
+            _code_versions[module] = hashlib.sha256(source).hexdigest()
+        return _code_versions[module]
+
+    def _get_checkpoint_name(self, phase):
+        return "{}.{}".format(super()._get_checkpoint_name(phase), self.input_digest[:16])
+
+    def phase_record(self, phase, answer=None, status="ok"):
+        record = super().phase_record(phase, answer=answer, status=status)
+        record.update(year=self.year, day=self.day, input_digest=self.input_digest)
+        return record
+
+    @property
+    def bench_key(self):
+        name = type(self).__module__ if self.year is None else "{}/{}".format(self.year, self.day)
+        return "{} {}".format(name, self.input_digest[:12])
+
+
+class AnswerCache:
+    """Persistent solution answer cache, with least-recently-used eviction.
+
+    Entries are files in the directory in environment variable
+    ``AOC_ANSWER_CACHE`` (default: ``~/.cache/advent-of-code/answers``),
+    with recency tracked by modification time. Only ``int``, ``float`` and
+    ``str`` answers (including NumPy scalars) are stored.
+
+    Args:
+        max_entries (int): maximum number of entries, default: environment
+            variable ``AOC_ANSWER_CACHE_SIZE`` or 1024
+    """
+
+    def __init__(self, max_entries=None):
+        cache_dir = os.environ.get("AOC_ANSWER_CACHE", "~/.cache/advent-of-code/answers")
+        self.path = pathlib.Path(cache_dir).expanduser()
+        if max_entries is None:
+            max_entries = int(os.environ.get("AOC_ANSWER_CACHE_SIZE", 1024))
+        self.max_entries = max_entries
+
+    def _get_entry_path(self, key):
+        return self.path / hashlib.sha256(json.dumps(key).encode()).hexdigest()
+
+    def get(self, key):
+        """Get cached answer.
+
+        Args:
+            key (tuple[str]): answer key
+
+        Returns:
+            tuple[bool, object]: whether the answer was cached, and the
+                answer
+        """
+
+        path = self._get_entry_path(key)
+        try:
+            answer = json.loads(path.read_text())["answer"]
+        except FileNotFoundError:
+            _answer_cache_counts["misses"] += 1
+            return False, None
+        path.touch()
+        _answer_cache_counts["hits"] += 1
+        _logger.debug("Using cached answer for {}".format(key[:2]))
+        return True, answer
+
+    def set(self, key, answer):
+        """Store answer, evicting least-recently used if full.
+
+        Args:
+            key (tuple[str]): answer key
+            answer: answer to store
+        """
+
+        if type(answer).__module__ == "numpy":
+            answer = answer.item()
+        if not isinstance(answer, (int, float, str)):
+            _logger.debug("Not caching answer of type '{}'".format(type(answer).__name__))
+            return
+        self.path.mkdir(parents=True, exist_ok=True)
+        path = self._get_entry_path(key)
+        tmp_path = path.with_suffix(".tmp{}".format(os.getpid()))
+        tmp_path.write_text(json.dumps({"key": key, "answer": answer}))
+        tmp_path.replace(path)
+
+        entries = [p for p in self.path.iterdir() if not p.suffix]
+        if len(entries) > self.max_entries:
+            entries.sort(key=lambda p: p.stat().st_mtime)
+            for entry in entries[:len(entries) - self.max_entries]:
+                entry.unlink()
+
+
+class LineStream:
+    """Lazily parsed lines of a file, read again on each iteration.
+
+    Lines match those from ``text.strip().splitlines()``. Files at least
+    ``mmap_threshold`` bytes are read through a memory-map.
+
+    Args:
+        path (pathlib.Path): file path
+        line_type (callable): line conversion function
+    """
+
+    mmap_threshold = 2 ** 26
+
+    def __init__(self, path, line_type=str):
+        self.path = path
+        self.line_type = line_type
+
+    def __repr__(self):
+        return "{}({}, {})".format(type(self).__name__, repr(self.path), repr(self.line_type))
+
+    def _iter_raw_lines(self):
+        with self.path.open("rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size and size >= self.mmap_threshold:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    yield from iter(mm.readline, b"")
+            else:
+                yield from f
+
+    def __iter__(self):
+        line_type = self.line_type
+        prev = None
+        blanks = []
+        for line in self._iter_raw_lines():
+            line = line.decode().rstrip("\r\n")
+            if not line.strip():
+                if prev is not None:
+                    blanks.append(line)
+                continue
+            if prev is None:
+                line = line.lstrip()
+            else:
+                yield line_type(prev)
+                for blank in blanks:
+                    yield line_type(blank)
+                blanks = []
+            prev = line
+        if prev is not None:
+            yield line_type(prev.rstrip())
+
+
+def parse_numeric_lines(text, line_type):
+    """Parse lines of numbers in bulk, with NumPy.
+
+    Args:
+        text (str): text with one number per line
+        line_type (type): ``int`` or ``float``
+
+    Returns:
+        numpy.ndarray: parsed numbers
+
+    Raises:
+        ValueError: a line isn't a single number
+        OverflowError: an integer is too large for 64 bits
+    """
+
+    import numpy as np
+
+    text = text.strip()
+    if not text:
+        return np.array([], dtype=_numeric_line_dtypes[line_type])
+    items = np.fromstring(text, dtype=_numeric_line_dtypes[line_type], sep="\n")
+    if len(items) != text.count("\n") + 1:
+        raise ValueError("Expected one number per line")
+    if line_type is int:
+        info = np.iinfo(items.dtype)
+        if np.any((items == info.max) | (items == info.min)):
+            raise OverflowError("Integer possibly out of range of {}".format(items.dtype))
+    return items
+
+
+_numeric_line_dtypes = {int: "int64", float: "float64"}
+
 
 class InputLinesSolution(InputtedSolution):  # TODO: unit-test
-    """Solution interface with an input text file of lines."""
+    """Solution interface with an input text file of lines.
+
+    Lines of integers or floats (``line_type`` of ``int`` or ``float``) are
+    parsed in bulk with NumPy if the input is at least
+    ``bulk_parse_min_bytes`` long (below that, importing NumPy costs more
+    than it saves); set ``array_items`` to always parse in bulk and keep
+    them as a NumPy array.
+
+    Set ``stream_items`` to have ``items`` be a :class:`LineStream` rather
+    than a list, for constant-memory parsing. Solutions which only iterate
+    over ``items`` can set ``streamable`` to accept ``--stream`` instead.
+    """
+
+    stream_items = False
+    streamable = False
+    array_items = False
+    bulk_parse_min_bytes = 2 ** 20
+
     def __init__(self):
         super().__init__()
+        if self.streamable:
+            self.parser.add_argument(
+                "--stream",
+                action="store_true",
+                help="parse input lines lazily on each pass, instead of loading them")
         self.items = None
 
     @staticmethod
@@ -155,9 +1453,25 @@ class InputLinesSolution(InputtedSolution):  # TODO: unit-test
         """Line conversion function."""
         return line
 
+    @property
+    def streaming(self):
+        return self.stream_items or (self.streamable and self.args.stream)
+
     def parse(self):
         super().parse()
-        self.items = [self.line_type(line) for line in self.input_text.strip().splitlines()]
+        if self.streaming:
+            self.items = LineStream(self.input_path, self.line_type)
+        elif self.line_type in _numeric_line_dtypes and (
+                self.array_items or len(self.input_text) >= self.bulk_parse_min_bytes):
+            try:
+                items = parse_numeric_lines(self.input_text, self.line_type)
+            except (ValueError, OverflowError) as e:
+                _logger.debug("Falling back to per-line parsing: {}".format(e))
+                self.items = [self.line_type(line) for line in self.input_text.strip().splitlines()]
+            else:
+                self.items = items if self.array_items else items.tolist()
+        else:
+            self.items = [self.line_type(line) for line in self.input_text.strip().splitlines()]
 
 
 def get_input_file():
@@ -174,34 +1488,356 @@ def get_input_file():
     return soln.input_text
 
 
-def download_input(day, year):
-    if isinstance(requests, Exception):
-        raise requests
-    url = "https://adventofcode.com/{}/day/{}/input".format(year, day)
+def _get_session():
+    """Get the HTTP session shared by input downloads."""
+    global _session
+    if _session is None:
+        import requests
+        _session = requests.Session()
+    return _session
+
+
+def _get_session_token():
+    return os.environ["AOC_SESSION_TOKEN"]
+
+
+def get_input_cache_path(day, year, session_token=None):
+    """Get the cache path of a puzzle input.
+
+    The cache directory is set by environment variable ``AOC_INPUT_CACHE``,
+    default: ``~/.cache/advent-of-code/inputs``. The path is the hash of
+    the year, day and hashed session token, as inputs differ per user.
+
+    Args:
+        day (int): puzzle day
+        year (int): puzzle year
+        session_token (str): 'adventofcode.com' session token, default:
+            environment variable ``AOC_SESSION_TOKEN``
+
+    Returns:
+        pathlib.Path: input cache file path
+    """
+
+    cache_dir = os.environ.get("AOC_INPUT_CACHE", "~/.cache/advent-of-code/inputs")
+    session_token = session_token or _get_session_token()
+    token_hash = hashlib.sha256(session_token.encode()).hexdigest()
+    key = hashlib.sha256("{}/{}/{}".format(year, day, token_hash).encode()).hexdigest()
+    return pathlib.Path(cache_dir).expanduser() / key[:2] / key
+
+
+def _fetch_input(day, year):
+    """Download puzzle input from 'adventofcode.com', without caching."""
+    base_url = os.environ.get("AOC_BASE_URL", "https://adventofcode.com")
+    url = "{}/{}/day/{}/input".format(base_url, year, day)
     cookies = {
-        "session": os.environ["AOC_SESSION_TOKEN"],
+        "session": _get_session_token(),
     }
-    response = requests.get(url, cookies=cookies)
+    _logger.debug("Downloading input from '{}'".format(url))
+    response = _get_session().get(url, cookies=cookies)
+    response.raise_for_status()
     return response.text
 
 
+def _write_cached_input(cache_path, text):
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_suffix(".tmp{}-{}".format(os.getpid(), threading.get_ident()))
+    tmp_path.write_text(text)
+    tmp_path.replace(cache_path)
+
+
+def download_input_file(day, year):
+    """Get puzzle input file, from the cache or else from 'adventofcode.com'.
+
+    The input is streamed to the cache file, without loading it into
+    memory.
+
+    Args:
+        day (int): puzzle day
+        year (int): puzzle year
+
+    Returns:
+        pathlib.Path: cached input file path
+    """
+
+    cache_path = get_input_cache_path(day, year)
+    if cache_path.exists():
+        _logger.debug("Using cached input for {} day {}".format(year, day))
+        return cache_path
+
+    base_url = os.environ.get("AOC_BASE_URL", "https://adventofcode.com")
+    url = "{}/{}/day/{}/input".format(base_url, year, day)
+    _logger.debug("Downloading input from '{}'".format(url))
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_suffix(".tmp{}-{}".format(os.getpid(), threading.get_ident()))
+    with _get_session().get(url, cookies={"session": _get_session_token()}, stream=True) as response:
+        response.raise_for_status()
+        with tmp_path.open("wb") as f:
+            for chunk in response.iter_content(chunk_size=2 ** 16):
+                f.write(chunk)
+    tmp_path.replace(cache_path)
+    return cache_path
+
+
+def download_input(day, year):
+    """Get puzzle input, from the cache or else from 'adventofcode.com'.
+
+    Set environment variable ``AOC_BASE_URL`` to download from elsewhere.
+
+    Args:
+        day (int): puzzle day
+        year (int): puzzle year
+
+    Returns:
+        str: puzzle input
+    """
+
+    cache_path = get_input_cache_path(day, year)
+    if cache_path.exists():
+        _logger.debug("Using cached input for {} day {}".format(year, day))
+        return cache_path.read_text()
+
+    text = _fetch_input(day, year)
+    _write_cached_input(cache_path, text)
+    return text
+
+
+def _is_retryable(exc):
+    """Check if a download error is transient."""
+    import requests
+
+    if isinstance(exc, requests.HTTPError) and exc.response is not None:
+        status = exc.response.status_code
+        return status == 429 or status >= 500
+    return isinstance(exc, (requests.ConnectionError, requests.Timeout))
+
+
+async def _prefetch_input(day, year, semaphore, n_retries, backoff):
+    """Download and cache a puzzle input, retrying transient errors."""
+    cache_path = get_input_cache_path(day, year)
+    if cache_path.exists():
+        return cache_path
+
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+    for attempt in range(n_retries + 1):
+        async with semaphore:
+            try:
+                text = await loop.run_in_executor(None, _fetch_input, day, year)
+            except Exception as e:
+                if attempt == n_retries or not _is_retryable(e):
+                    raise
+                delay = backoff * 2 ** attempt
+                _s = "Download of {} day {} input failed ({}), retrying in {:.1f} s"
+                _logger.warning(_s.format(year, day, e, delay))
+            else:
+                await loop.run_in_executor(None, _write_cached_input, cache_path, text)
+                return cache_path
+        await asyncio.sleep(delay)
+
+
+async def prefetch_inputs_async(puzzles, max_in_flight=4, n_retries=3, backoff=1.0):
+    """Concurrently download and cache missing puzzle inputs.
+
+    Downloads run in the event loop's default executor. Transient errors
+    (connection errors, timeouts, rate-limiting and server errors) are
+    retried with exponential backoff.
+
+    Args:
+        puzzles (list[tuple[int, int]]): puzzle years and days
+        max_in_flight (int): maximum number of concurrent requests
+        n_retries (int): maximum number of retries of each download
+        backoff (float): delay before first retry (s), doubled each
+            retry
+
+    Returns:
+        tuple[dict[tuple[int, int], pathlib.Path], dict[tuple[int, int], Exception]]:
+            input cache paths, and download errors, by puzzle year and day
+    """
+
+    import asyncio
+
+    semaphore = asyncio.Semaphore(max_in_flight)
+    puzzles = list(puzzles)
+    results = await asyncio.gather(
+        *(_prefetch_input(day, year, semaphore, n_retries, backoff) for year, day in puzzles),
+        return_exceptions=True)
+    paths = {}
+    errors = {}
+    for puzzle, result in zip(puzzles, results):
+        if isinstance(result, Exception):
+            _logger.error("Failed to download {} day {} input: {}".format(*puzzle, result))
+            errors[puzzle] = result
+        else:
+            paths[puzzle] = result
+    return paths, errors
+
+
+def prefetch_inputs(year, days=range(1, 26), max_in_flight=4):
+    """Download and cache puzzle inputs.
+
+    Args:
+        year (int): puzzle year
+        days (list[int]): puzzle days
+        max_in_flight (int): maximum number of concurrent requests
+
+    Returns:
+        dict[int, pathlib.Path]: input cache paths by day
+    """
+
+    import asyncio
+
+    puzzles = [(year, day) for day in days]
+    paths, errors = asyncio.run(prefetch_inputs_async(puzzles, max_in_flight=max_in_flight))
+    if errors:
+        raise next(iter(errors.values()))
+    return {day: path for (_, day), path in paths.items()}
+
+
+def _format_function(func):
+    filename, line, name = func
+    if filename == "~":
+        return name
+    return "{}:{}({})".format(os.path.basename(filename), line, name)
+
+
+def collapse_stacks(stats, min_weight=1e-6):
+    """Estimate collapsed call stacks from profile statistics.
+
+    Profiles only record caller-callee pairs, so time of a function called
+    from multiple stacks is split proportionally to its callers' times.
+
+    Args:
+        stats (pstats.Stats): profile statistics
+        min_weight (float): minimum stack time to keep (s)
+
+    Returns:
+        dict[tuple[str], float]: function's own time (s) by call stack
+    """
+
+    callees = {}
+    roots = []
+    for func, (_, _, _, _, callers) in stats.stats.items():
+        if not callers:
+            roots.append(func)
+        for caller, caller_stats in callers.items():
+            callees.setdefault(caller, {})[func] = caller_stats[3]
+
+    stacks = {}
+
+    def walk(func, stack, scale):
+        stack = stack + (_format_function(func),)
+        _, _, tt, ct, _ = stats.stats[func]
+        if tt * scale >= min_weight:
+            stacks[stack] = stacks.get(stack, 0.0) + tt * scale
+        for callee, callee_ct in callees.get(func, {}).items():
+            callee_total = stats.stats[callee][3]
+            if callee_total <= 0 or _format_function(callee) in stack:
+                continue
+            if callee_ct * scale >= min_weight:
+                walk(callee, stack, callee_ct * scale / callee_total)
+
+    for root in roots:
+        walk(root, (), 1.0)
+    return stacks
+
+
+def write_profile(profile, path, top=10):
+    """Write profile statistics and collapsed call stacks.
+
+    Writes ``<path>.pstats``, and ``<path>.collapsed`` with lines of
+    semicolon-separated stacks and their time in microseconds, for
+    flame-graph tools. The hottest functions are logged at exit.
+
+    Args:
+        profile (cProfile.Profile): finished profile
+        path (pathlib.Path): output path, without suffix
+        top (int): number of hottest functions to log
+    """
+
+    import pstats
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    stats = pstats.Stats(profile)
+    stats.dump_stats(str(path.with_name(path.name + ".pstats")))
+    lines = [
+        "{} {}".format(";".join(stack), int(round(weight * 1e6)))
+        for stack, weight in collapse_stacks(stats).items()]
+    path.with_name(path.name + ".collapsed").write_text("\n".join(lines) + "\n")
+    _profiles.append((path.name, stats, top))
+
+
+def log_profiles():
+    """Log hottest functions of written profiles, by own time."""
+    for name, stats, top in _profiles:
+        rows = sorted(stats.stats.items(), key=lambda x: x[1][2], reverse=True)[:top]
+        lines = ["Own (s)   Cumulative (s)  Calls     Function"]
+        for func, (_, nc, tt, ct, _) in rows:
+            lines.append("{:8.3f}  {:14.3f}  {:8d}  {}".format(tt, ct, nc, _format_function(func)))
+        _logger.debug("Hottest functions in {}:\n{}".format(name, "\n".join(lines)))
+
+
+def get_call_times():
+    """Get recorded call times.
+
+    Returns:
+        dict[str, dict[str, float]]: call time statistics (in seconds) by
+            function qualified name, for functions which have been called
+    """
+
+    table = {}
+    for name, stats in _timings.items():
+        if stats.count == 0:
+            continue
+        table[name] = {
+            "total": stats.total / 1e9,
+            "count": stats.count,
+            "mean": stats.mean / 1e9,
+            "std": stats.std / 1e9,
+            "max": stats.max / 1e9,
+            "min": stats.min / 1e9,
+            "p50": stats.percentile(50) / 1e9,
+            "p95": stats.percentile(95) / 1e9,
+            "p99": stats.percentile(99) / 1e9,
+        }
+    return table
+
+
 def log_call_times():
-    """Log recorded call times."""
-    if not _timings:
+    """Log recorded call times, and answer cache hits and misses.
+
+    Also writes call times as JSON to the path in environment variable
+    ``AOC_CALL_TIMES_JSON``, if set.
+    """
+
+    if any(_answer_cache_counts.values()):
+        _s = "Answer cache: {} hits, {} misses"
+        _logger.debug(_s.format(_answer_cache_counts["hits"], _answer_cache_counts["misses"]))
+
+    table = get_call_times()
+    if not table:
         return
-    len_names = max(len(n) for n in _timings)
+    json_path = os.environ.get("AOC_CALL_TIMES_JSON")
+    if json_path:
+        pathlib.Path(json_path).write_text(json.dumps(table, indent=2))
+    len_names = max([13] + [len(n) for n in table])
     sp = " " * (len_names - 13)
-    s = "Function name{}  Total (s)  N         Mean (s)  StdDev (s)  Max (s)  Min (s)".format(sp)
+    s = "Function name{}  Total (s)  N         Mean (s)  StdDev (s)  Max (s)  Min (s)  P50 (s)  P95 (s)".format(sp)
     lines = [s]
-    _fmt = "{:" + str(len_names) + "s}  {:9.2g}  {:8d}  {:8.2g}  {:10.2g}  {:7.2g}  {:7.2g}"
-    for name, times in _timings.items():
-        if len(times) == 0:
-            continue
-        ts = np.array(times)
-        lines.append(_fmt.format(name, ts.sum(), len(ts), ts.mean(), ts.std(), ts.max(), ts.min()))
-    if len(lines) < 2:
-        return
+    _fmt = "{:" + str(len_names) + "s}  {:9.2g}  {:8d}  {:8.2g}  {:10.2g}  {:7.2g}  {:7.2g}  {:7.2g}  {:7.2g}"
+    for name, row in table.items():
+        lines.append(_fmt.format(
+            name,
+            row["total"],
+            row["count"],
+            row["mean"],
+            row["std"],
+            row["max"],
+            row["min"],
+            row["p50"],
+            row["p95"]))
     _logger.debug("Call times:\n{}".format("\n".join(lines)))
 
 
+atexit.register(log_profiles)
 atexit.register(log_call_times)
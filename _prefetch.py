@@ -0,0 +1,65 @@
+"""Download all missing puzzle inputs concurrently.
+
+Inputs are written to the input cache (see
+:func:`_common.get_input_cache_path`), so solutions run afterwards never
+wait on the network.
+"""
+
+import sys
+import asyncio
+import argparse
+import logging as lg
+
+import _common
+
+_logger = lg.getLogger(__name__)
+
+
+def _parse_days(text):
+    """Parse a day range, eg '1-25' or '3'."""
+    start, _, stop = text.partition("-")
+    return range(int(start), int(stop or start) + 1)
+
+
+def main(args=None):
+    """Prefetch inputs from command-line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("years", type=int, nargs="+", help="puzzle years")
+    parser.add_argument(
+        "--days",
+        type=_parse_days,
+        default=range(1, 26),
+        help="puzzle day range, eg '1-10', default: all days")
+    parser.add_argument(
+        "-j",
+        "--max-in-flight",
+        type=int,
+        default=4,
+        help="maximum number of concurrent requests, default: %(default)s")
+    parser.add_argument(
+        "--retries",
+        type=int,
+        default=3,
+        help="maximum number of retries of each download, default: %(default)s")
+    parser.add_argument(
+        "--backoff",
+        type=float,
+        default=1.0,
+        help="delay before first retry (s), doubled each retry, default: %(default)s")
+    parser.add_argument("-v", "--verbose", action="store_true", help="log each download")
+    args = parser.parse_args(args)
+    _common.setup_logging(level=lg.DEBUG if args.verbose else lg.INFO)
+
+    puzzles = [(year, day) for year in args.years for day in args.days]
+    with _common.LogTime("Prefetch"):
+        paths, errors = asyncio.run(_common.prefetch_inputs_async(
+            puzzles,
+            max_in_flight=args.max_in_flight,
+            n_retries=args.retries,
+            backoff=args.backoff))
+    _logger.info("Cached {} of {} inputs".format(len(paths), len(puzzles)))
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    sys.exit(main())
@@ -0,0 +1,86 @@
+"""Solutions registry.
+
+Solution modules are found without importing them, and only the
+requested day's module is imported.
+"""
+
+import ast
+import pathlib
+import importlib
+import logging as lg
+
+_logger = lg.getLogger(__name__)
+_root = pathlib.Path(__file__).parent.parent
+_packages = ("solutions_2018", "solutions_2019")
+
+
+def _defines_solution(path):
+    """Check if a module source defines a top-level ``Solution`` class.
+
+    The module isn't imported, as some older solutions do work at
+    import-time.
+    """
+
+    tree = ast.parse(path.read_text(), filename=str(path))
+    return any(isinstance(n, ast.ClassDef) and n.name == "Solution" for n in tree.body)
+
+
+def discover_solutions(packages=_packages):
+    """Find solution modules.
+
+    Args:
+        packages (list[str]): solution package names
+
+    Returns:
+        list[tuple[str, int, int]]: solution module names, puzzle years and
+            puzzle days, sorted by year then day
+    """
+
+    solutions = []
+    for package in packages:
+        year = int(package.rsplit("_", maxsplit=1)[1])
+        for path in (_root / package).glob("day*.py"):
+            if not _defines_solution(path):
+                _logger.debug("Skipping '{}': no solution class".format(path))
+                continue
+            day = int(path.stem[3:])
+            solutions.append(("{}.{}".format(package, path.stem), year, day))
+    return sorted(solutions, key=lambda x: (x[1], x[2]))
+
+
+def list_solutions(years=None):
+    """List available solutions.
+
+    Args:
+        years (list[int]): only list solutions for these years, default:
+            all years
+
+    Returns:
+        list[tuple[str, int, int]]: solution module names, puzzle years and
+            puzzle days, sorted by year then day
+    """
+
+    solutions = discover_solutions()
+    if years is not None:
+        solutions = [s for s in solutions if s[1] in years]
+    return solutions
+
+
+def get_solution_class(year, day):
+    """Import a day's solution.
+
+    Args:
+        year (int): puzzle year
+        day (int): puzzle day
+
+    Returns:
+        type[_common.Solution]: solution class
+
+    Raises:
+        LookupError: no solution for the day
+    """
+
+    for module, module_year, module_day in list_solutions(years=[year]):
+        if module_day == day:
+            return importlib.import_module(module).Solution
+    raise LookupError("No solution for {} day {}".format(year, day))
@@ -0,0 +1,51 @@
+"""Run Advent of Code solutions."""
+
+import sys
+import argparse
+
+import solutions
+
+
+def main(args=None):
+    """Run command from command-line."""
+    parser = argparse.ArgumentParser(prog="python -m solutions", description=__doc__)
+    subparsers = parser.add_subparsers(dest="command", metavar="COMMAND")
+    subparsers.required = True
+
+    run_parser = subparsers.add_parser(
+        "run",
+        add_help=False,
+        help="run a solution; other arguments are passed to the solution (see 'run YEAR DAY -h')")
+    run_parser.add_argument("year", type=int, help="puzzle year")
+    run_parser.add_argument("day", type=int, help="puzzle day")
+
+    list_parser = subparsers.add_parser("list", help="list available solutions")
+    list_parser.add_argument("--year", type=int, action="append", help="only list solutions for year")
+
+    subparsers.add_parser("batch", add_help=False, help="run many solutions in parallel (see 'batch -h')")
+    subparsers.add_parser("prefetch", add_help=False, help="download missing inputs (see 'prefetch -h')")
+
+    args, rest = parser.parse_known_args(args)
+    if args.command == "run":
+        try:
+            solution_class = solutions.get_solution_class(args.year, args.day)
+        except LookupError as e:
+            parser.error(str(e))
+        return solution_class().run(rest)
+    elif args.command == "batch":
+        import _batch
+
+        return _batch.main(rest)
+    elif args.command == "prefetch":
+        import _prefetch
+
+        return _prefetch.main(rest)
+    if rest:
+        parser.error("unrecognized arguments: {}".format(" ".join(rest)))
+    for module, year, day in solutions.list_solutions(years=args.year):
+        print("{}  {:2d}  {}".format(year, day, module))
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    sys.exit(main())
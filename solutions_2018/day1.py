@@ -22,28 +22,70 @@ def final_freq(changes: list):
 def get_first_duplicate_freq(changes: list):
     """Find the first duplicate frequency.
 
+    Frequencies visited in cycle ``k`` are the prefix sums offset by ``k``
+    times the cycle total ``T``, so a later frequency can only repeat an
+    earlier one with the same residue modulo ``T``. Within each residue
+    class, sorted in the direction of drift, each prefix first reaches
+    its next neighbour, after ``(difference / T)`` cycles. The earliest
+    such arrival (by cycle, then position) is the first duplicate.
+
     Args:
         changes: frequency changes
 
     Returns:
         first duplicate frequency
+
+    Raises:
+        ValueError: no changes, or frequencies never repeat
     """
 
-    cur_freq = 0
-    visited_freqs = set()
-    while True:
-        for change in changes:
-            if cur_freq in visited_freqs:
-                return cur_freq
-            visited_freqs.add(cur_freq)
-            cur_freq += change
+    import numpy as np
+
+    if isinstance(changes, np.ndarray):
+        changes = changes.astype(np.int64, copy=False)
+    else:
+        changes = np.fromiter(changes, dtype=np.int64)  # also lazy line streams
+    n = len(changes)
+    if n == 0:
+        raise ValueError("No frequency changes")
+    prefixes = np.zeros(n, dtype=np.int64)
+    np.cumsum(changes[:-1], out=prefixes[1:])
+    total = int(prefixes[-1] + changes[-1])
+
+    # repeat within first cycle
+    order = np.argsort(prefixes, kind="stable")
+    sorted_prefixes = prefixes[order]
+    is_repeat = sorted_prefixes[1:] == sorted_prefixes[:-1]
+    if is_repeat.any():
+        return int(prefixes[order[1:][is_repeat].min()])
+
+    if total == 0:
+        return 0  # start of second cycle
+
+    values = prefixes if total > 0 else -prefixes
+    drift = abs(total)
+    residues = values % drift
+    order = np.lexsort((values, residues))
+    starts = order[:-1]
+    ends = order[1:]
+    same_class = residues[starts] == residues[ends]
+    if not same_class.any():
+        raise ValueError("Frequency never repeats")
+    starts = starts[same_class]
+    ends = ends[same_class]
+    n_cycles = (values[ends] - values[starts]) // drift
+    times = n_cycles * n + starts
+    return int(prefixes[ends[np.argmin(times)]])
 
 
 class Solution(_common.InputLinesSolution):  # TODO: unit-test, document
     line_type = int
+    streamable = True
+    year = 2018
+    day = 1
 
     def part_1(self):
-        return sum(self.items)
+        return final_freq(self.items)
 
     def part_2(self):
         return get_first_duplicate_freq(self.items)
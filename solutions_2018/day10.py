@@ -1,12 +1,14 @@
-import pathlib
+"""Day 10 solution.
+
+https://adventofcode.com/2018/day/10
+"""
+
+import re
 import logging as lg
 
 import numpy as np
+import _common
 
-lg.basicConfig(
-    level=lg.DEBUG,
-    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-    datefmt="%H:%M:%S")
 _logger = lg.getLogger(__name__)
 
 
@@ -14,39 +16,78 @@ def parse_data(data_str):
     pts = []
     vs = []
     for line in data_str.strip().splitlines():
-        x = int(line[10:16].strip())
-        y = int(line[18:24].strip())
-        vx = int(line[36:38].strip())
-        vy = int(line[40:42].strip())
+        x, y, vx, vy = map(int, re.findall(r"-?\d+", line))
         pts.append((y, x))
         vs.append((vy, vx))
     return np.array(pts), np.array(vs)
 
 
-def print_points(points):
-    size = points.ptp(axis=0) + 1
+def format_points(points):
+    """Draw points.
+
+    Args:
+        points (np.ndarray): point positions (y, x)
+
+    Returns:
+        str: drawing, with '#' for points
+    """
+
+    size = np.ptp(points, axis=0) + 1
     points = points - points.min(axis=0)
     grid = np.zeros(size, dtype=np.uint8)
     grid[points[:, 0], points[:, 1]] = 1
-    print("\n".join("".join(("#" if el else " ") for el in row) for row in grid))
+    return "\n".join("".join(("#" if el else " ") for el in row).rstrip() for row in grid)
+
+
+def _bbox_area(points):
+    size = np.ptp(points, axis=0).astype(np.int64) + 1
+    return size[0] * size[1]
 
 
-def main_loop(points, velocities):
-    j = 0
+def find_message(points, velocities):
+    """Move points until they're closest together, assumed to be when they
+    spell the message.
+
+    Args:
+        points (np.ndarray): initial point positions (y, x)
+        velocities (np.ndarray): point velocities (y, x)
+
+    Returns:
+        tuple[np.ndarray, int]: point positions and seconds elapsed
+    """
+
+    second = 0
+    area = _bbox_area(points)
     while True:
-        points += velocities
-        if np.all(points.ptp(axis=0) < (88, 317)):
-            _logger.debug("Second {}".format(j))
-            print_points(points)
-            input("Press enter to continue (CTRL+C to quit)")
-        j += 1
+        next_points = points + velocities
+        next_area = _bbox_area(next_points)
+        if next_area > area:
+            _logger.debug("Points closest after {} seconds".format(second))
+            return points, second
+        points, area = next_points, next_area
+        second += 1
+
+
+class Solution(_common.InputtedSolution):  # TODO: unit-test, document
+    year = 2018
+    day = 10
+
+    def __init__(self):
+        super().__init__()
+        self.points = None
+        self.second = None
+
+    def parse(self):
+        super().parse()
+        self.points, self.second = find_message(*parse_data(self.input_text))
 
+    def part_1(self):
+        return "\n" + format_points(self.points)
 
-def main():
-    data_str = pathlib.Path("input_day10.txt").read_text()
-    points, velocities = parse_data(data_str)
-    main_loop(points, velocities)
+    def part_2(self):
+        return self.second
 
 
-if __name__ == "__main__":
+main = Solution.main
+if __name__ == "__main__":  # pragma: no cover
     main()
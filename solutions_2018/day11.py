@@ -1,13 +1,14 @@
-import time
+"""Day 11 solution.
+
+https://adventofcode.com/2018/day/11
+"""
+
 import logging as lg
 import functools as ft
 
 import numpy as np
+import _common
 
-lg.basicConfig(
-    level=lg.DEBUG,
-    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-    datefmt="%H:%M:%S")
 _logger = lg.getLogger(__name__)
 
 
@@ -53,38 +54,60 @@ class Grid:
         return np.unravel_index(np.argmax(self.window_sums), self.window_sums.shape)
 
 
-def main():
-    _logger.debug("{} @ {},{}".format(Grid(57).power_levels[78, 121], 122, 79))
-    _logger.debug("{} @ {},{}".format(Grid(39).power_levels[195, 216], 217, 196))
-    _logger.debug("{} @ {},{}".format(Grid(71).power_levels[152, 100], 101, 153))
-    _g18 = Grid(18)
-    _logger.debug("{}\n{}".format(_g18.window_sums[44, 32], _g18.power_levels[43:48, 31:36]))
-    _g42 = Grid(42)
-    _logger.debug("{}\n{}".format(_g42.window_sums[60, 20], _g42.power_levels[59:63, 19:24]))
-    _g42 = Grid(18, window_size=16)
-    _logger.debug("90,269,16: {}".format(_g42.window_sums[268, 89]))
-    _g42 = Grid(42, window_size=12)
-    _logger.debug("232,251,12: {}".format(_g42.window_sums[250, 231]))
+def find_best_window(serial):
+    """Find the 3x3 window with the most power.
 
-    serial = int(input("Enter serial number: "))
+    Args:
+        serial (int): grid serial number
+
+    Returns:
+        tuple[int, int]: window top-left coordinate (x, y)
+    """
 
     grid = Grid(serial)
-    _logger.debug("max_coord: {}".format(grid.best_sum_coord))
     _logger.debug("best sum: {}".format(grid.window_sums[grid.best_sum_coord]))
-    print("Answer pt1: {},{}".format(grid.best_sum_coord[1] + 1, grid.best_sum_coord[0] + 1))
+    return grid.best_sum_coord[1] + 1, grid.best_sum_coord[0] + 1
+
+
+def find_best_window_any_size(serial):
+    """Find the window of any size with the most power.
+
+    Args:
+        serial (int): grid serial number
+
+    Returns:
+        tuple[int, int, int]: window top-left coordinate (x, y) and size
+    """
 
-    t = time.time()
     best_grid = Grid(serial, window_size=1)
     for j in range(2, 300):
         grid = Grid(serial, window_size=j)
         if grid.window_sums[grid.best_sum_coord] > best_grid.window_sums[best_grid.best_sum_coord]:
             best_grid = grid
     best_coord = best_grid.best_sum_coord
-    best_window_size = best_grid.window_size
     _logger.debug("best sum: {}".format(best_grid.window_sums[best_coord]))
-    print("Answer pt2: {},{},{}".format(best_coord[1] + 1, best_coord[0] + 1, best_window_size))
-    _logger.debug("Finished in {:.2f} seconds".format(time.time() - t))
+    return best_coord[1] + 1, best_coord[0] + 1, best_grid.window_size
+
+
+class Solution(_common.InputtedSolution):  # TODO: unit-test, document
+    year = 2018
+    day = 11
+
+    def __init__(self):
+        super().__init__()
+        self.serial = None
+
+    def parse(self):
+        super().parse()
+        self.serial = int(self.input_text.strip())
+
+    def part_1(self):
+        return "{},{}".format(*find_best_window(self.serial))
+
+    def part_2(self):
+        return "{},{},{}".format(*find_best_window_any_size(self.serial))
 
 
-if __name__ == "__main__":
+main = Solution.main
+if __name__ == "__main__":  # pragma: no cover
     main()
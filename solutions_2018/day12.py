@@ -1,19 +1,18 @@
-import time
-import pathlib
+"""Day 12 solution.
+
+https://adventofcode.com/2018/day/12
+"""
+
 import logging as lg
-import functools as ft
 
 import numpy as np
+import _common
 
-lg.basicConfig(
-    level=lg.DEBUG,
-    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-    datefmt="%H:%M:%S")
 _logger = lg.getLogger(__name__)
 
 
 class PlantSimulate:
-    _pad = np.zeros((4,), dtype=np.bool8)
+    _pad = np.zeros((4,), dtype=np.bool_)
 
     def __init__(self, init_state, kernels):
         self.init_state = init_state
@@ -22,11 +21,12 @@ class PlantSimulate:
         self.current_state = self.init_state
         self.offset = 0
         self._states = [self.init_state]
+        self._offsets = [0]
 
     @classmethod
     def from_data_str(cls, data_str):
         def get_arr(text):
-            return np.array([c == "#" for c in text], dtype=np.bool8)
+            return np.array([c == "#" for c in text], dtype=np.bool_)
 
         lines = data_str.splitlines()
         init_state = get_arr(lines[0][15:].strip())
@@ -53,7 +53,7 @@ class PlantSimulate:
             old_state_padded,
             (len(old_state_padded) - 4, 5),
             (1, 1))
-        new_state = np.zeros((len(old_state_view),), dtype=np.bool8)
+        new_state = np.zeros((len(old_state_view),), dtype=np.bool_)
         for kernel, has_plant in self.kernels:
             new_state[np.all(old_state_view == kernel, axis=1)] = has_plant
         lowest_j = np.argmax(new_state)
@@ -62,30 +62,60 @@ class PlantSimulate:
         self.current_state = new_state[lowest_j:highest_j]
         self.generation += 1
         self._states.append(self.current_state)
-        _logger.debug("generation: {}, offset: {}".format(self.generation, self.offset))
+        self._offsets.append(self.offset)
 
     def run(self, n=0):
-        for j in range(n):
-            if j % 10000 == 0:
-                _logger.debug("{} / {}".format(j, n))
-            self.step()
-            self._find_pattern()
+        progress = _common.Progress(
+            "PlantSimulate",
+            total=n,
+            unit="generations",
+            describe=lambda: {"offset": self.offset},
+            logger=_logger)
+        with progress:
+            for _ in range(n):
+                self.step()
+                self._find_pattern()
+                progress.step()
 
     def get_plant_pot_sum(self):
         return np.sum(np.nonzero(self.current_state)[0] + self.offset)
 
+    def skip_to(self, n):
+        """Advance to a generation, extrapolating once the pattern repeats.
+
+        A repeating pattern's plants may be shifted each period, so the
+        offset is extrapolated linearly.
+
+        Args:
+            n (int): generation to advance to
+        """
+
+        while self.generation < n:
+            self.step()
+            period = self._find_pattern()
+            if period:
+                for _ in range((n - self.generation) % period):
+                    self.step()
+                shift = self._offsets[-1] - self._offsets[-1 - period]
+                self.offset += (n - self.generation) // period * shift
+                self.generation = n
+
+
+class Solution(_common.InputtedSolution):  # TODO: unit-test, document
+    year = 2018
+    day = 12
+
+    def part_1(self):
+        sim = PlantSimulate.from_data_str(self.input_text)
+        sim.run(n=20)
+        return int(sim.get_plant_pot_sum())
 
-def main():
-    data_str = pathlib.Path("input_day12.txt").read_text()
-    sim = PlantSimulate.from_data_str(data_str)
-    sim.run(n=200)
-    _logger.debug("sim.init_state.shape: {}".format(sim.init_state.shape))
-    _logger.debug("sim.generation: {}".format(sim.generation))
-    # _logger.debug("sim.current_state: {}".format(sim.current_state))
-    _logger.debug("sim.offset: {}".format(sim.offset))
-    print("Answer:", sim.get_plant_pot_sum())
-    print("Answer pt2:", np.sum(np.nonzero(sim.current_state)[0] + 5 * 10**10 - 36))
+    def part_2(self):
+        sim = PlantSimulate.from_data_str(self.input_text)
+        sim.skip_to(5 * 10**10)
+        return int(sim.get_plant_pot_sum())
 
 
-if __name__ == "__main__":
+main = Solution.main
+if __name__ == "__main__":  # pragma: no cover
     main()
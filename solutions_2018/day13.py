@@ -1,13 +1,14 @@
+"""Day 13 solution.
+
+https://adventofcode.com/2018/day/13
+"""
+
 import time
-import pathlib
 import logging as lg
 
 import numpy as np
+import _common
 
-lg.basicConfig(
-    level=lg.DEBUG,
-    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-    datefmt="%H:%M:%S")
 _logger = lg.getLogger(__name__)
 
 
@@ -207,43 +208,60 @@ class Layout:
         return "\n".join("".join(symbs[j] for j in row) for row in track_ids)
 
 
-def main():
-    data_str = pathlib.Path("input_day13.txt").read_text()
-    layout = Layout.from_data_str(data_str)
-    assert layout.get_current_str() + "\n" == data_str
+def find_first_crash(layout):
+    """Run carts until the first crash.
+
+    Args:
+        layout (Layout): track layout, modified in-place
+
+    Returns:
+        tuple[int, int]: crash position (x, y)
+    """
 
-    t = time.time()
-    j = 0
-    while True:
-        if j % 100 == 0:
-            _logger.debug("Tick {}".format(j))
+    progress = _common.Progress("Layout", unit="ticks", logger=_logger)
+    while not layout.any_crashes():
         layout.tick()
-        # print(layout.get_current_str())
-        # print("Tick:", j)
-        # time.sleep(1.0 / 3.0)
-        if layout.any_crashes():
-            # _logger.debug("Current layout:\n{}".format(layout.get_current_str()))
-            _logger.debug("Crash at tick {}".format(j))
-            print("Answer pt1:", layout.first_crash()[::-1])
-            break
-        j += 1
-    _logger.debug("Finished in {:.2f}s".format(time.time() - t))
-
-    layout = Layout.from_data_str(data_str)
-
-    t = time.time()
-    j = 0
-    while True:
-        if j % 500 == 0:
-            _logger.debug("Tick {}".format(j))
-        if len(layout.carts) < 2:
-            print("Answer pt2:", layout.carts[0].cur_pos[::-1])
+        progress.step()
+    _logger.debug("Crash at tick {}".format(progress.count))
+    return layout.first_crash()[::-1]
+
+
+def find_last_cart(layout):
+    """Run carts, removing crashed carts, until one remains.
+
+    Args:
+        layout (Layout): track layout, modified in-place
+
+    Returns:
+        tuple[int, int]: last cart position (x, y)
+    """
+
+    progress = _common.Progress(
+        "Layout",
+        unit="ticks",
+        describe=lambda: {"carts": len(layout.carts)},
+        logger=_logger)
+    while len(layout.carts) > 1:
         layout.tick()
         while layout.any_crashes():
             layout.remove_carts_at(layout.first_crash())
-        j += 1
-    _logger.debug("Finished in {:.2f}s".format(time.time() - t))
+        progress.step()
+    return layout.carts[0].cur_pos[::-1]
+
+
+class Solution(_common.InputtedSolution):  # TODO: unit-test, document
+    year = 2018
+    day = 13
+
+    def part_1(self):
+        layout = Layout.from_data_str(self.input_text)
+        return "{},{}".format(*find_first_crash(layout))
+
+    def part_2(self):
+        layout = Layout.from_data_str(self.input_text)
+        return "{},{}".format(*find_last_cart(layout))
 
 
-if __name__ == "__main__":
+main = Solution.main
+if __name__ == "__main__":  # pragma: no cover
     main()
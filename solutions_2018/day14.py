@@ -1,16 +1,13 @@
-import sys
-import time
-import pathlib
+"""Day 14 solution.
+
+https://adventofcode.com/2018/day/14
+"""
+
 import logging as lg
 
-import numpy as np
+import _common
 
-lg.basicConfig(
-    level=lg.DEBUG,
-    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-    datefmt="%H:%M:%S")
 _logger = lg.getLogger(__name__)
-sys.setrecursionlimit(100000)
 
 
 class LinkedListElement:
@@ -168,14 +165,46 @@ class RecipeScore:
     def format_scoreboard(self):
         return "".join(self._format_score(score) for score in self.scoreboard)
 
-    def run(self, n=1):
-        j = 0
+    def _save_checkpoint(self, checkpointer, j):
+        idx1 = idx2 = None
+        for k, score in enumerate(self.scoreboard):
+            if score is self.current1:
+                idx1 = k
+            if score is self.current2:
+                idx2 = k
+        values = bytes(score.value for score in self.scoreboard)
+        checkpointer.save(j, (values, idx1, idx2))
+
+    def _load_checkpoint(self, checkpointer):
+        restored = checkpointer and checkpointer.load()
+        if not restored:
+            return 0
+        j, (values, idx1, idx2) = restored
+        self.scoreboard = LinkedList()
+        for value in values:
+            self.scoreboard.append(value)
+        self.current1 = self.scoreboard[idx1]
+        self.current2 = self.scoreboard[idx2]
+        return j
+
+    def _get_progress(self, start):
+        return _common.Progress(
+            "RecipeScore",
+            start=start,
+            describe=lambda: {"recipes": len(self.scoreboard)},
+            logger=_logger)
+
+    def run(self, n=1, checkpointer=None):
+        j = self._load_checkpoint(checkpointer)
+        progress = self._get_progress(j)
         while len(self.scoreboard) < n:
-            if j % 10000 == 0:
-                _logger.debug("Step {}".format(j))
             # print(self.format_scoreboard())
             self.step()
             j += 1
+            if j >= progress.next_check:
+                progress.update(j)
+            if checkpointer and checkpointer.due(j):
+                self._save_checkpoint(checkpointer, j)
 
     def _last_match(self, values):
         if len(values) > len(self.scoreboard) + 1:
@@ -187,32 +216,43 @@ class RecipeScore:
         else:
             return None
 
-    def find(self, values):
-        j = 0
+    def find(self, values, checkpointer=None):
+        j = self._load_checkpoint(checkpointer)
+        progress = self._get_progress(j)
         while True:
-            if j % 10000 == 0:
-                _logger.debug("Step {}".format(j))
             self.step()
             if self._last_match(values) is not None:
                 return self._last_match(values)
             j += 1
+            if j >= progress.next_check:
+                progress.update(j)
+            if checkpointer and checkpointer.due(j):
+                self._save_checkpoint(checkpointer, j)
 
 
-def main():
-    in_val = int(input("Number of recipes: "))
+class Solution(_common.InputtedSolution):  # TODO: unit-test, document
+    year = 2018
+    day = 14
+
+    def __init__(self):
+        super().__init__()
+        self.n_recipes = None
+
+    def parse(self):
+        super().parse()
+        self.n_recipes = int(self.input_text.strip())
 
-    runner = RecipeScore(3, 7)
-    runner.run(n=2018 + 10)
-    _logger.debug("After 9 steps: {}".format("".join(str(s.value) for s in runner.scoreboard[9:19])))
-    _logger.debug("After 5 steps: {}".format("".join(str(s.value) for s in runner.scoreboard[5:15])))
-    _logger.debug("After 18 steps: {}".format("".join(str(s.value) for s in runner.scoreboard[18:28])))
-    _logger.debug("After 2018 steps: {}".format("".join(str(s.value) for s in runner.scoreboard[2018:2028])))
-    runner.run(n=in_val + 10)
-    print("Answer pt1:", "".join(str(s.value) for s in runner.scoreboard[in_val:in_val + 10]))
+    def part_1(self):
+        runner = RecipeScore(3, 7)
+        runner.run(n=self.n_recipes + 10, checkpointer=self.checkpointer)
+        scores = runner.scoreboard[self.n_recipes:self.n_recipes + 10]
+        return "".join(str(s.value) for s in scores)
 
-    runner2 = RecipeScore(3, 7)
-    print("Answer pt2:", runner2.find(tuple(map(int, str(in_val)))))
+    def part_2(self):
+        runner = RecipeScore(3, 7)
+        return runner.find(tuple(map(int, str(self.n_recipes))), checkpointer=self.checkpointer)
 
 
-if __name__ == "__main__":
+main = Solution.main
+if __name__ == "__main__":  # pragma: no cover
     main()
@@ -211,28 +211,34 @@ class Game:
 
     @_common.record_call_times
     def run_round(self):
-        for unit in self.units_sorted:
-            if unit.is_dead:
-                continue
-            if not self._get_enemies(unit):
-                raise GameFinished()
-            target = self.target_in_range(unit)
-            if target is None:
-                self.move_unit(unit)
+        with _common.span("Game.run_round", round=self.n_rounds_completed + 1):
+            for unit in self.units_sorted:
+                if unit.is_dead:
+                    continue
+                if not self._get_enemies(unit):
+                    raise GameFinished()
                 target = self.target_in_range(unit)
-            if target is not None:
-                self._attack(unit, target)
-                self.remove_dead()
+                if target is None:
+                    with _common.span("Game.move_unit"):
+                        self.move_unit(unit)
+                    target = self.target_in_range(unit)
+                if target is not None:
+                    self._attack(unit, target)
+                    self.remove_dead()
 
     def run(self, log_state=False):
+        progress = _common.Progress(
+            "Game",
+            unit="rounds",
+            describe=lambda: {"remaining units": len(self.remaining_units)},
+            logger=_logger)
         while True:
-            if self.n_rounds_completed % 10 == 0:
-                _logger.debug("Rounds completed: {}".format(self.n_rounds_completed))
             try:
                 self.run_round()
             except GameFinished:
                 break
             self.n_rounds_completed += 1
+            progress.step()
             if log_state:
                 _logger.debug("Round {}:\n{}\n{}".format(
                     self.n_rounds_completed,
@@ -270,6 +276,10 @@ class Game:
 
 
 class Solution(_common.InputtedSolution):  # TODO: unit-test, document
+    year = 2018
+    day = 15
+    cache_answers = True
+
     def part_1(self):
         game = Game.from_data_str(self.input_text)
         _logger.debug("Initial units:\n{}".format(game.format_units()))
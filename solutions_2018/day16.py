@@ -303,6 +303,9 @@ def update_op_names(validity: np.ndarray):
 
 
 class Solution(_common.InputLinesSolution):  # TODO: unit-test, document
+    year = 2018
+    day = 16
+
     def __init__(self):
         super().__init__()
         self.bnas = None
@@ -184,6 +184,9 @@ class WaterFlow:
 
 
 class Solution(_common.InputtedSolution):  # TODO: unit-test, document
+    year = 2018
+    day = 17
+
     def __init__(self):
         super().__init__()
         self.scan = None
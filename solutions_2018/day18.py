@@ -88,19 +88,30 @@ class StrangeMagic:
 
     @_common.record_call_times
     def step(self):
-        new_acres = np.zeros_like(self.lca.acres)
-        for j, row in enumerate(self.lca.acres):
-            for k, el in enumerate(row):
-                new_acres[j, k] = self._get_new_type((j, k))
-        self.lca.acres = new_acres
-
-    def run(self, n_steps):
+        with _common.span("StrangeMagic.step"):
+            new_acres = np.zeros_like(self.lca.acres)
+            for j, row in enumerate(self.lca.acres):
+                for k, el in enumerate(row):
+                    new_acres[j, k] = self._get_new_type((j, k))
+            self.lca.acres = new_acres
+
+    def run(self, n_steps, checkpointer=None):
         self._compute_valid_adjacent_positions()
-        for j in range(n_steps):
+        start = 0
+        restored = checkpointer and checkpointer.load()
+        if restored:
+            start, self.lca.acres = restored
+        progress = _common.Progress(
+            "StrangeMagic",
+            total=n_steps,
+            start=start,
+            describe=lambda: {"resource value": self.resource_value},
+            logger=_logger)
+        for j in range(start, n_steps):
             self.step()
-            if j % 50 == 49:
-                _s = "Completed step {}, resource value: {}"
-                _logger.debug(_s.format(j + 1, self.resource_value))
+            progress.step()
+            if checkpointer and checkpointer.due(j + 1):
+                checkpointer.save(j + 1, self.lca.acres)
 
     @property
     @_common.record_call_times
@@ -109,6 +120,12 @@ class StrangeMagic:
 
 
 class Solution(_common.InputtedSolution):  # TODO: unit-test, document
+    year = 2018
+    day = 18
+    cache_answers = True
+    part_1_steps = 10
+    part_2_steps = 1000000000
+
     def __init__(self):
         super().__init__()
         self.lca = None
@@ -118,13 +135,13 @@ class Solution(_common.InputtedSolution):  # TODO: unit-test, document
         self.lca = LCA.from_data_str(self.input_text)
 
     def part_1(self):
-        strange_magic = StrangeMagic(self.lca)
-        strange_magic.run(10)
+        strange_magic = StrangeMagic(self.lca.copy())
+        strange_magic.run(self.part_1_steps, checkpointer=self.checkpointer)
         return strange_magic.resource_value
 
     def part_2(self):
-        strange_magic = StrangeMagic(self.lca)
-        strange_magic.run(1000000000)
+        strange_magic = StrangeMagic(self.lca.copy())  # independent of part 1, which may be cached
+        strange_magic.run(self.part_2_steps, checkpointer=self.checkpointer)
         return strange_magic.resource_value
 
 
@@ -230,41 +230,53 @@ class Program:
         self.instruction_idx = self.state[self.instruction_pointer_register]
         self.instruction_idx += 1
 
-    def run(self):
+    def run(self, checkpointer=None):
         if not self.has_valid_instruction_idx:
             _logger.warning("Program already finished")
         _logger.info("Running program")
         j = 0
+        restored = checkpointer and checkpointer.load()
+        if restored:
+            j, (registers, self.instruction_idx) = restored
+            self.state = self._state_class(*registers)
+        progress = _common.Progress(
+            "Program",
+            start=j,
+            describe=lambda: {"state": str(self.state), "instruction_idx": self.instruction_idx},
+            logger=_logger)
         while self.has_valid_instruction_idx:
             self.step()
-            if j % 100000 == 99999:
-                _logger.debug("Finished step {}, state: {}".format(j + 1, self.state))
             j += 1
+            if j >= progress.next_check:
+                progress.update(j)
+            if checkpointer and checkpointer.due(j):
+                registers = tuple(self.state[k] for k in range(len(self.state.__slots__)))
+                checkpointer.save(j, (registers, self.instruction_idx))
         _logger.info("Program finished after {} steps with state: {}".format(j, self.state))
 
 
 class Solution(_common.InputtedSolution):  # TODO: unit-test, document
-    def __init__(self):
-        super().__init__()
-        self.part_1_program = None
+    year = 2018
+    day = 19
+    cache_answers = True
 
     def part_1(self):
         program = Program.from_data_str(self.input_text)
-        program.run()
-        self.part_1_program = program
+        program.run(checkpointer=self.checkpointer)
         return program.state[0]
 
     def part_2(self):
-        new_init_state = self.part_1_program.init_state.copy()
+        part_1_program = Program.from_data_str(self.input_text)
+        new_init_state = part_1_program.init_state.copy()
         new_init_state[0] = 1
         program = Program(
-            self.part_1_program.instructions,
-            self.part_1_program.instruction_pointer_register,
+            part_1_program.instructions,
+            part_1_program.instruction_pointer_register,
             init_state=new_init_state)
         # for j, v in enumerate((42, 10551260, 9366059, 22519, 10, 0)):
         #     program.state[j] = v
         # program.instruction_idx = program.state[4] + 1
-        program.run()
+        program.run(checkpointer=self.checkpointer)
         return program.state[0]
 
 
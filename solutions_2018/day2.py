@@ -4,13 +4,16 @@ https://adventofcode.com/2018/day/2
 """
 
 import logging as lg
+import concurrent.futures
 
+import numpy as np
 import _common
 
 _logger = lg.getLogger(__name__)
+_pool_ids = None
 
 
-def compute_checksum(words):  # TODO: document
+def _compute_checksum_loop(words):
     counts2 = 0
     counts3 = 0
     for word in words:
@@ -26,7 +29,64 @@ def compute_checksum(words):  # TODO: document
     return counts2 * counts3
 
 
-def get_same_boxes_common_characters(words):  # TODO: document
+def words_to_array(words):
+    """Pack equal-length ASCII words into an array.
+
+    Args:
+        words (list[str]): words
+
+    Returns:
+        np.ndarray: character codes, shape (number of words, word length),
+            ``None`` if words differ in length or aren't ASCII
+    """
+
+    if not words or len({len(word) for word in words}) > 1:
+        return None
+    try:
+        data = "".join(words).encode("ascii")
+    except UnicodeEncodeError:
+        return None
+    return np.frombuffer(data, dtype=np.uint8).reshape(len(words), -1)
+
+
+def _compute_checksum_array(ids):
+    n, length = ids.shape
+    if length == 0:
+        return 0
+    # map characters present to a compact alphabet, then count per ID
+    present = np.zeros(256, dtype=bool)
+    present[ids.ravel()] = True
+    codes = np.zeros(256, dtype=np.intp)
+    codes[present] = np.arange(np.count_nonzero(present))
+    n_letters = int(np.count_nonzero(present))
+    keys = np.arange(n)[:, None] * n_letters + codes[ids]
+    counts = np.bincount(keys.ravel(), minlength=n * n_letters).reshape(n, n_letters)
+    counts2 = int(np.count_nonzero((counts == 2).any(axis=1)))
+    counts3 = int(np.count_nonzero((counts == 3).any(axis=1)))
+    return counts2 * counts3
+
+
+def compute_checksum(words):
+    """Compute box IDs checksum.
+
+    Equal-length ASCII IDs are counted vectorised, as a per-ID histogram
+    of characters.
+
+    Args:
+        words (list[str]): box IDs
+
+    Returns:
+        int: number of IDs with a letter exactly twice, times number of
+            IDs with a letter exactly three times
+    """
+
+    ids = words_to_array(words)
+    if ids is None:
+        return _compute_checksum_loop(words)
+    return _compute_checksum_array(ids)
+
+
+def _get_common_characters_pairwise(words):
     for j, word in enumerate(words):
         for word2 in words[j + 1:]:
             difference = 0
@@ -42,8 +102,134 @@ def get_same_boxes_common_characters(words):  # TODO: document
                 return "".join(common_chars)
 
 
-class Solution(_common.InputLinesSolution):  # TODO: unit-test, document
-    line_type = float
+def _get_common_characters_masked(words):
+    max_length = max((len(word) for word in words), default=0)
+    for l in range(max_length):
+        seen = {}
+        for word in words:
+            if len(word) <= l:
+                continue
+            masked = word[:l] + word[l + 1:]
+            if masked in seen:
+                if seen[masked] == word:
+                    return word  # exact duplicates
+                _logger.debug("{} / {} differ at {}".format(seen[masked], word, l))
+                return masked
+            seen[masked] = word
+    return None
+
+
+def _block_size(max_block_bytes):
+    # per block: distances (uint16) and one position's mismatches (bool)
+    return max(1, int((max_block_bytes / 3) ** 0.5))
+
+
+def _block_pairs(ids, start, stop, max_distance, block_size):
+    """Find pairs within distance with first ID in a row block."""
+    rows = ids[start:stop]
+    pairs = []
+    for col_start in range(start, len(ids), block_size):
+        cols = ids[col_start:col_start + block_size]
+        distances = np.zeros((len(rows), len(cols)), dtype=np.uint16)
+        for l in range(ids.shape[1]):
+            distances += rows[:, l, None] != cols[None, :, l]
+        js, ks = np.nonzero(distances <= max_distance)
+        upper = js + start < ks + col_start
+        js, ks = js[upper], ks[upper]
+        pairs.append(np.stack([js + start, ks + col_start, distances[js, ks]], axis=1))
+    return np.concatenate(pairs)
+
+
+def _init_worker(ids):
+    global _pool_ids
+    _pool_ids = ids
+
+
+def _pool_block_pairs(start, stop, max_distance, block_size):
+    return _block_pairs(_pool_ids, start, stop, max_distance, block_size)
+
+
+def find_similar_pairs(words, max_distance=1, max_block_bytes=2 ** 22, n_workers=None):
+    """Find all pairs of IDs within a Hamming distance.
+
+    Mismatch counts are computed over square blocks of ID pairs,
+    accumulating one character position at a time, so memory use is
+    bounded by the block size rather than the number of IDs.
+
+    Args:
+        words (list[str]): equal-length ASCII box IDs
+        max_distance (int): maximum number of differing characters
+        max_block_bytes (int): approximate working memory per block
+        n_workers (int): number of worker processes to split blocks over,
+            default: compute in this process
+
+    Returns:
+        np.ndarray: pairs' first ID indices, second ID indices and
+            distances, shape (number of pairs, 3), sorted by first then
+            second ID index
+
+    Raises:
+        ValueError: if IDs differ in length or aren't ASCII
+    """
+
+    ids = words_to_array(words)
+    if ids is None:
+        if not words:
+            return np.empty((0, 3), dtype=np.intp)
+        raise ValueError("Box IDs must be equal-length ASCII")
+    block_size = _block_size(max_block_bytes)
+    starts = range(0, len(ids), block_size)
+    _logger.debug("Comparing {} IDs in blocks of {}".format(len(ids), block_size))
+
+    if n_workers is None:
+        pairs = [_block_pairs(ids, s, s + block_size, max_distance, block_size) for s in starts]
+    else:
+        with concurrent.futures.ProcessPoolExecutor(
+                max_workers=n_workers,
+                initializer=_init_worker,
+                initargs=(ids,)) as executor:
+            futures = [
+                executor.submit(_pool_block_pairs, s, s + block_size, max_distance, block_size)
+                for s in starts]
+            pairs = [future.result() for future in futures]
+    pairs = np.concatenate(pairs).astype(np.intp)
+    return pairs[np.lexsort((pairs[:, 1], pairs[:, 0]))]
+
+
+def _get_common_characters_blocked(words):
+    pairs = find_similar_pairs(words, max_distance=1)
+    if len(pairs) == 0:
+        return None
+    word, word2 = words[pairs[0, 0]], words[pairs[0, 1]]
+    return "".join(c for c, c2 in zip(word, word2) if c == c2)
+
+
+def get_same_boxes_common_characters(words, method="masked"):
+    """Find the common characters of the two IDs differing by one character.
+
+    Args:
+        words (list[str]): box IDs
+        method (str): search method: 'masked' hashes each ID with each
+            position masked in turn (O(n L) expected), 'pairwise' compares
+            each pair of IDs (O(n^2 L)), 'blocked' compares equal-length
+            ASCII IDs in vectorised blocks (see :func:`find_similar_pairs`)
+
+    Returns:
+        str: characters in common, ``None`` if no IDs differ by one
+    """
+
+    if method == "masked":
+        return _get_common_characters_masked(words)
+    elif method == "pairwise":
+        return _get_common_characters_pairwise(words)
+    elif method == "blocked":
+        return _get_common_characters_blocked(words)
+    raise ValueError("Unknown method: {}".format(method))
+
+
+class Solution(_common.InputLinesSolution):  # TODO: document
+    year = 2018
+    day = 2
 
     def part_1(self):
         return compute_checksum(self.items)
@@ -1,30 +1,191 @@
-with open("input_day3.txt", "r") as f:
-    lines = f.readlines()
+"""Day 3 solution.
+
+https://adventofcode.com/2018/day/3
+"""
+
+import logging as lg
 
 import numpy as np
+import _common
+
+_logger = lg.getLogger(__name__)
+
+
+def parse_claims(lines):
+    """Parse fabric claims.
+
+    Args:
+        lines (list[str]): claims, eg "#123 @ 3,2: 5x4"
+
+    Returns:
+        tuple[list[str], np.ndarray, np.ndarray]: claim IDs, claim
+            top-left positions (y, x) and claim sizes (height, width)
+    """
+
+    yxs = [None] * len(lines)
+    hws = [None] * len(lines)
+    ids = [None] * len(lines)
+    for j, line in enumerate(lines):
+        id_str, _, xy_str, size_str = line.strip().split()
+        x, y = map(int, xy_str[:-1].split(","))
+        w, h = map(int, size_str.split("x"))
+        yxs[j] = (y, x)
+        hws[j] = (h, w)
+        ids[j] = id_str[1:]
+    return ids, np.array(yxs).reshape(-1, 2), np.array(hws).reshape(-1, 2)
+
+
+def _count_claims_loop(yxs, hws):
+    max_yx = np.max(yxs + hws, axis=0)
+    counts = np.zeros(max_yx, dtype=np.int64)
+    for (y, x), (h, w) in zip(yxs, hws):
+        counts[y:y + h, x:x + w] += 1
+    return counts
+
+
+def count_claims(yxs, hws):
+    """Count claims on each square inch of fabric.
+
+    Each claim adds its corners to a difference array (+1 at top-left and
+    bottom-right, -1 at the other two), which cumulative sums over both
+    axes turn into claim counts, in O(claims + area).
+
+    Args:
+        yxs (np.ndarray): claim top-left positions (y, x)
+        hws (np.ndarray): claim sizes (height, width)
+
+    Returns:
+        np.ndarray: claim counts
+    """
+
+    max_yx = np.max(yxs + hws, axis=0)
+    _logger.debug("Fabric size: {}".format(max_yx))
+    ends = yxs + hws
+    diffs = np.zeros(max_yx + 1, dtype=np.int64)
+    np.add.at(diffs, (yxs[:, 0], yxs[:, 1]), 1)
+    np.add.at(diffs, (yxs[:, 0], ends[:, 1]), -1)
+    np.add.at(diffs, (ends[:, 0], yxs[:, 1]), -1)
+    np.add.at(diffs, (ends[:, 0], ends[:, 1]), 1)
+    return diffs.cumsum(axis=0).cumsum(axis=1)[:-1, :-1]
+
+
+def compress_claims(yxs, hws):
+    """Compress claim coordinates to the distinct claim edges.
+
+    Each compressed cell is a rectangle of fabric between consecutive
+    edges, covered entirely by the same claims.
+
+    Args:
+        yxs (np.ndarray): claim top-left positions (y, x)
+        hws (np.ndarray): claim sizes (height, width)
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: compressed claim
+            top-left positions and sizes, and compressed cell areas
+    """
+
+    ends = yxs + hws
+    c_yxs = np.empty_like(yxs)
+    c_ends = np.empty_like(ends)
+    sizes = []
+    for k in range(2):
+        edges = np.unique(np.concatenate([yxs[:, k], ends[:, k]]))
+        c_yxs[:, k] = np.searchsorted(edges, yxs[:, k])
+        c_ends[:, k] = np.searchsorted(edges, ends[:, k])
+        sizes.append(np.diff(edges))
+    _logger.debug("Compressed fabric size: {}".format([len(s) for s in sizes]))
+    return c_yxs, c_ends - c_yxs, np.outer(sizes[0], sizes[1])
+
+
+def overlap_table(counts):
+    """Build a summed-area table of overlapped fabric.
+
+    Args:
+        counts (np.ndarray): claim counts
+
+    Returns:
+        np.ndarray: number of square inches claimed more than once above
+            and left of each position, shape one larger than ``counts``
+    """
+
+    table = np.zeros((counts.shape[0] + 1, counts.shape[1] + 1), dtype=np.int64)
+    np.cumsum(counts > 1, axis=0, out=table[1:, 1:])
+    np.cumsum(table[1:, 1:], axis=1, out=table[1:, 1:])
+    return table
+
+
+def count_claim_overlaps(yxs, hws, table):
+    """Count overlapped square inches in each claim.
+
+    Args:
+        yxs (np.ndarray): claim top-left positions (y, x)
+        hws (np.ndarray): claim sizes (height, width)
+        table (np.ndarray): overlap summed-area table, see
+            :func:`overlap_table`
+
+    Returns:
+        np.ndarray: number of overlapped square inches of each claim
+    """
+
+    (y0, x0), (y1, x1) = yxs.T, (yxs + hws).T
+    return table[y1, x1] - table[y0, x1] - table[y1, x0] + table[y0, x0]
+
+
+def find_unique_claim(ids, yxs, hws, counts):
+    """Find the claim which doesn't overlap any other.
+
+    Args:
+        ids (list[str]): claim IDs
+        yxs (np.ndarray): claim top-left positions (y, x)
+        hws (np.ndarray): claim sizes (height, width)
+        counts (np.ndarray): claim counts
+
+    Returns:
+        str: claim ID, ``None`` if all claims overlap
+    """
+
+    overlaps = count_claim_overlaps(yxs, hws, overlap_table(counts))
+    unique_idxs = np.flatnonzero(overlaps == 0)
+    return ids[unique_idxs[0]] if len(unique_idxs) else None
+
+
+class Solution(_common.InputLinesSolution):  # TODO: document
+    year = 2018
+    day = 3
+    max_dense_area = 2 ** 26
+
+    def __init__(self):
+        super().__init__()
+        self.parser.add_argument(
+            "--sparse",
+            action="store_true",
+            help="count claims on fabric compressed to claim edges, default: "
+                 "when fabric is larger than {} square inches".format(self.max_dense_area))
+        self.ids = None
+        self.yxs = None
+        self.hws = None
+        self.areas = None
+        self.counts = None
+
+    def parse(self):
+        super().parse()
+        self.ids, self.yxs, self.hws = parse_claims(self.items)
+        area = int(np.prod(np.max(self.yxs + self.hws, axis=0), dtype=np.int64))
+        if self.args.sparse or area > self.max_dense_area:
+            self.yxs, self.hws, self.areas = compress_claims(self.yxs, self.hws)
+
+    def part_1(self):
+        self.counts = count_claims(self.yxs, self.hws)
+        if self.areas is None:
+            return int(np.sum(self.counts > 1))
+        return int(np.sum(self.areas[self.counts > 1]))
+
+    def part_2(self):
+        if self.counts is None:
+            self.counts = count_claims(self.yxs, self.hws)
+        return find_unique_claim(self.ids, self.yxs, self.hws, self.counts)
+
 
-yxs = [None] * len(lines)
-hws = [None] * len(lines)
-ids = [None] * len(lines)
-for j, line in enumerate(lines):
-    line = line.strip()
-    id_str, _, xy_str, size_str = line.split()
-    x, y = map(int, xy_str[:-1].split(","))
-    w, h = map(int, size_str.split("x"))
-    yxs[j] = (y, x)
-    hws[j] = (h, w)
-    ids[j] = id_str[1:]
-yxs = np.array(yxs)
-hws = np.array(hws)
-
-max_yx = np.max(yxs + hws, axis=0)
-print("max_yx:", max_yx)
-
-counts = np.zeros(max_yx, dtype=np.int)
-for (y, x), (h, w) in zip(yxs, hws):
-    counts[y:y + h, x:x + w] += 1
-print("n squares with more than 1 claim:", np.sum(counts > 1))
-
-for j, ((y, x), (h, w)) in enumerate(zip(yxs, hws)):
-    if np.all(counts[y:y + h, x:x + w] == 1):
-        print("unique claim:", ids[j], "({})".format(((y, x), (h, w))))
+main = Solution.main
+if __name__ == "__main__":  # pragma: no cover
+    main()
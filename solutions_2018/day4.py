@@ -1,8 +1,15 @@
-with open("input_day4.txt", "r") as f:
-    lines = f.readlines()
+"""Day 4 solution.
+
+https://adventofcode.com/2018/day/4
+"""
 
 import datetime
+import logging as lg
+
 import numpy as np
+import _common
+
+_logger = lg.getLogger(__name__)
 
 
 class Event:
@@ -41,13 +48,16 @@ class Shift:
     def __init__(self, start_event):
         assert start_event.event_type == 2
         self.events = [start_event]
+        self.guard = None
+        self._is_asleep = None
 
     def __str__(self):
-        # print("".join(map(str, self.is_asleep.astype(np.uint8))))
         return "Shift for guard {}\n  {}".format(self.guard_id, "\n  ".join(map(str, self.events)))
 
     def clear_cache(self):
-        pass
+        self._is_asleep = None
+        if self.guard is not None:
+            self.guard.clear_cache()
 
     @property
     def guard_id(self):
@@ -61,13 +71,12 @@ class Shift:
 
     @property
     def is_asleep(self):
-        is_asleep = np.zeros((60,), dtype=np.bool8)
-        for event in self.events[1:]:
-            # print("event.dt.minute:", event.dt.minute)
-            # print("bool(event.event_type):", bool(event.event_type))
-            # print("event.event_str:", event.event_str)
-            is_asleep[event.dt.minute:] = bool(event.event_type)
-        return is_asleep
+        if self._is_asleep is None:
+            is_asleep = np.zeros((60,), dtype=np.bool_)
+            for event in self.events[1:]:
+                is_asleep[event.dt.minute:] = bool(event.event_type)
+            self._is_asleep = is_asleep
+        return self._is_asleep
 
     @property
     def minutes_asleep(self):
@@ -78,73 +87,297 @@ class Guard:
     def __init__(self, guard_id):
         self.guard_id = guard_id
         self.shifts = []
+        self.model = None
+        self._is_asleep_sum = None
 
     def __str__(self):
         return "Guard {} shifts:\n {}".format(self.guard_id, "\n ".join(map(str, self.shifts)))
 
     def clear_cache(self):
-        pass
+        self._is_asleep_sum = None
+        if self.model is not None:
+            self.model.clear_cache()
 
     def add_shift(self, shift):
         self.clear_cache()
         assert shift.guard_id == self.guard_id
+        shift.guard = self
         self.shifts.append(shift)
 
     @property
     def minutes_asleep(self):
-        return np.sum([s.minutes_asleep for s in self.shifts])
+        return np.sum(self.is_asleep_sum)
 
     @property
     def is_asleep_sum(self):
-        is_asleep = np.stack([s.is_asleep for s in self.shifts], axis=0)
-        return np.sum(is_asleep, axis=0)
+        if self._is_asleep_sum is None:
+            is_asleep = np.stack([s.is_asleep for s in self.shifts], axis=0)
+            self._is_asleep_sum = np.sum(is_asleep, axis=0)
+        return self._is_asleep_sum
 
     @property
     def minute_most_asleep(self):
         return np.argmax(self.is_asleep_sum)
 
 
-def main():
-    events = [Event.from_line(line) for line in lines]
-    events = sorted(events, key=lambda event: event.dt)
+class SleepModel:
+    """Minutes asleep of every shift, indexed by guard.
+
+    Args:
+        guard_ids (list[str]): guard IDs
+        asleep (np.ndarray): whether asleep at each minute of each shift,
+            shape (number of shifts, 60)
+        guard_idxs (np.ndarray): index into ``guard_ids`` of each shift's
+            guard; each guard has at least one shift
+    """
+
+    def __init__(self, guard_ids, asleep, guard_idxs):
+        self._guards = None
+        self._guard_ids = guard_ids
+        self._asleep = asleep.astype(np.uint8, copy=False)
+        self._guard_idxs = guard_idxs
+        self._histograms = None
+
+    @classmethod
+    def from_guards(cls, guards):
+        """Pack guards' shifts.
+
+        The model is linked to the guards: changes to their shifts clear
+        its cache (via :meth:`Guard.clear_cache`), and it's repacked on next
+        access. Guards later added to ``guards`` are included when the
+        cache is next cleared.
+
+        Args:
+            guards (dict[str, Guard]): guards by ID
+
+        Returns:
+            SleepModel: sleep model
+        """
+
+        model = cls([], np.zeros((0, 60), dtype=np.uint8), np.zeros((0,), dtype=np.intp))
+        model._guards = guards
+        model.clear_cache()
+        return model
+
+    def _pack(self):
+        guard_ids = list(self._guards)
+        shifts = []
+        for guard_id in guard_ids:
+            self._guards[guard_id].model = self
+            shifts.extend(self._guards[guard_id].shifts)
+        asleep = np.zeros((len(shifts), 60), dtype=np.uint8)
+        for j, shift in enumerate(shifts):
+            asleep[j] = shift.is_asleep
+        n_shifts = [len(self._guards[guard_id].shifts) for guard_id in guard_ids]
+        self._guard_ids = guard_ids
+        self._asleep = asleep
+        self._guard_idxs = np.repeat(np.arange(len(guard_ids)), n_shifts)
+
+    def clear_cache(self):
+        self._histograms = None
+        if self._guards is not None:
+            self._asleep = None
+
+    @property
+    def guard_ids(self):
+        """list[str]: guard IDs."""
+        if self._asleep is None:
+            self._pack()
+        return self._guard_ids
+
+    @property
+    def asleep(self):
+        """np.ndarray: whether asleep at each minute of each shift."""
+        if self._asleep is None:
+            self._pack()
+        return self._asleep
+
+    @property
+    def guard_idxs(self):
+        """np.ndarray: index into ``guard_ids`` of each shift's guard."""
+        if self._asleep is None:
+            self._pack()
+        return self._guard_idxs
+
+    @property
+    def histograms(self):
+        """np.ndarray: number of shifts asleep at each minute, by guard."""
+        if self._histograms is None:
+            order = np.argsort(self.guard_idxs, kind="stable")
+            starts = np.searchsorted(self.guard_idxs[order], np.arange(len(self.guard_ids)))
+            self._histograms = np.add.reduceat(self.asleep[order], starts, axis=0, dtype=np.int64)
+        return self._histograms
+
+    @property
+    def minutes_asleep(self):
+        """np.ndarray: total minutes asleep, by guard."""
+        return np.sum(self.histograms, axis=1)
+
+
+def build_shifts(events):
+    """Group events into guards' shifts.
+
+    Args:
+        events (list[Event]): events, in any order
+
+    Returns:
+        list[Shift]: shifts, in time order
+    """
 
     shifts = []
-    for event in events:
+    for event in sorted(events, key=lambda event: event.dt):
         if event.event_type == 2:
             if shifts:
                 assert event.dt > shifts[-1].events[0].dt
             shifts.append(Shift(event))
         else:
             shifts[-1].add_event(event)
+    return shifts
+
+
+def build_guards(shifts):
+    """Group shifts by guard.
+
+    Args:
+        shifts (list[Shift]): shifts
+
+    Returns:
+        dict[str, Guard]: guards by ID
+    """
 
     guards = {}
     for shift in shifts:
-        # print(shift)
         guards.setdefault(shift.guard_id, Guard(shift.guard_id)).add_shift(shift)
+    return guards
+
+
+def _read_numbers(buf, starts, offset, width):
+    idxs = starts[:, None] + offset + np.arange(width)
+    digits = buf[idxs].astype(np.int64) - ord("0")
+    return digits @ 10 ** np.arange(width - 1, -1, -1, dtype=np.int64)
+
+
+def _read_guard_numbers(buf, starts, offset, max_width=10):
+    idxs = np.minimum(starts[:, None] + offset + np.arange(max_width), len(buf) - 1)
+    digits = buf[idxs].astype(np.int64) - ord("0")
+    valid = np.cumprod((digits >= 0) & (digits <= 9), axis=1).astype(bool)
+    exponents = valid.sum(axis=1)[:, None] - 1 - np.arange(max_width)
+    return np.sum(np.where(valid, digits * 10 ** np.maximum(exponents, 0), 0), axis=1)
+
+
+def parse_log(text):
+    """Parse a guard log directly into a sleep model.
+
+    Timestamps and guard numbers are read from fixed offsets of each line
+    of the log's bytes, events are sorted on a packed integer timestamp,
+    and sleep is accumulated per shift in a difference array, without
+    splitting lines or creating per-event objects.
+
+    Args:
+        text (bytes | str): log, with lines eg "[1518-11-01 00:00] Guard
+            #10 begins shift" in any order; ``str`` must be ASCII
+
+    Returns:
+        SleepModel: guards' sleep, guards in order of first shift
+
+    Raises:
+        ValueError: if an event comes before any shift begins
+    """
+
+    if isinstance(text, str):
+        text = text.encode("ascii")
+    buf = np.frombuffer(text, dtype=np.uint8)
+    starts = np.concatenate([[0], np.flatnonzero(buf == ord("\n")) + 1])
+    starts = starts[starts < len(buf)]
+    starts = starts[buf[starts] == ord("[")]  # skip blank lines
+    year = _read_numbers(buf, starts, 1, 4)
+    month = _read_numbers(buf, starts, 6, 2)
+    day = _read_numbers(buf, starts, 9, 2)
+    hour = _read_numbers(buf, starts, 12, 2)
+    minute = _read_numbers(buf, starts, 15, 2)
+    key = (((year * 13 + month) * 32 + day) * 24 + hour) * 60 + minute
+    order = np.argsort(key, kind="stable")
+    starts, minute = starts[order], minute[order]
+
+    kinds = buf[starts + 19]
+    is_begin = kinds == ord("G")
+    shift_idxs = np.cumsum(is_begin) - 1
+    if len(shift_idxs) and shift_idxs[0] < 0:
+        line = bytes(buf[starts[0]:starts[0] + 19]).decode("ascii")
+        raise ValueError("Event before first shift: {}".format(line))
+    guard_numbers = _read_guard_numbers(buf, starts[is_begin], 26)
+    _logger.debug("Parsed {} events in {} shifts".format(len(starts), len(guard_numbers)))
+
+    diffs = np.zeros((len(guard_numbers), 61), dtype=np.int64)
+    is_sleep = kinds == ord("f")
+    is_wake = kinds == ord("w")
+    np.add.at(diffs, (shift_idxs[is_sleep], minute[is_sleep]), 1)
+    np.add.at(diffs, (shift_idxs[is_wake], minute[is_wake]), -1)
+    asleep = np.cumsum(diffs, axis=1)[:, :60] > 0
+
+    numbers, first_idxs, guard_idxs = np.unique(guard_numbers, return_index=True, return_inverse=True)
+    guard_order = np.argsort(first_idxs)
+    guard_ids = ["#{}".format(n) for n in numbers[guard_order]]
+    guard_idxs = np.argsort(guard_order)[guard_idxs.ravel()]
+    return SleepModel(guard_ids, asleep, guard_idxs)
+
+
+def _guard_number(guard_id):
+    return int(guard_id[1:])
+
+
+def strategy_1(model):
+    """Find the guard most asleep, and the minute they're most asleep.
+
+    Args:
+        model (SleepModel): guards' sleep
+
+    Returns:
+        int: guard ID number times minute
+    """
+
+    minutes_asleep = model.minutes_asleep
+    idx = int(np.argmax(minutes_asleep))
+    guard_id = model.guard_ids[idx]
+    _logger.debug("Most asleep guard: {}, {} minutes".format(guard_id, minutes_asleep[idx]))
+    return _guard_number(guard_id) * int(np.argmax(model.histograms[idx]))
+
+
+def strategy_2(model):
+    """Find the guard most frequently asleep on the same minute.
+
+    Args:
+        model (SleepModel): guards' sleep
+
+    Returns:
+        int: guard ID number times minute
+    """
+
+    idx, minute = np.unravel_index(np.argmax(model.histograms), model.histograms.shape)
+    guard_id = model.guard_ids[idx]
+    _logger.debug("Most frequently asleep guard: {}".format(guard_id))
+    return _guard_number(guard_id) * int(minute)
+
 
-    for guard in sorted(guards.values(), key=lambda guard: int(guard.guard_id[1:])):
-        print(guard)
+class Solution(_common.InputtedSolution):  # TODO: document
+    year = 2018
+    day = 4
 
-    print("len(guards.shifts):", [len(guard.shifts) for guard in guards.values()])
+    def __init__(self):
+        super().__init__()
+        self.model = None
 
-    # most_asleep_guard = max(guards.values(), key=lambda guard: guard.minutes_asleep)
-    most_asleep_guard = max(guards.values(), key=lambda guard: guard.minutes_asleep / len(guard.shifts))
-    print("most_asleep_guard.guard_id:", most_asleep_guard.guard_id)
-    print("len(most_asleep_guard.shifts):", len(most_asleep_guard.shifts))
-    print("most_asleep_guard.minutes_asleep:", most_asleep_guard.minutes_asleep)
-    print("most_asleep_guard.is_asleep_sum:", most_asleep_guard.is_asleep_sum)
-    print("most_asleep_guard.minute_most_asleep:", most_asleep_guard.minute_most_asleep)
-    print("answer pt1:", int(most_asleep_guard.guard_id[1:]) * most_asleep_guard.minute_most_asleep)
+    def parse(self):
+        super().parse()
+        self.model = parse_log(self.input_text.encode("ascii"))
 
-    # most_freq_asleep_guard = max(guards.values(), key=lambda guard: np.max(guard.is_asleep_sum))
-    most_freq_asleep_guard = max(guards.values(), key=lambda guard: np.max(guard.is_asleep_sum) / len(guard.shifts))
-    print("most_freq_asleep_guard.guard_id:", most_freq_asleep_guard.guard_id)
-    print("len(most_freq_asleep_guard.shifts):", len(most_freq_asleep_guard.shifts))
-    print("most_freq_asleep_guard.is_asleep_sum:", most_freq_asleep_guard.is_asleep_sum)
-    print("np.argmax(most_freq_asleep_guard.is_asleep_sum):", np.argmax(most_freq_asleep_guard.is_asleep_sum))
-    print("answer pt2:", int(most_freq_asleep_guard.guard_id[1:]) * np.argmax(most_freq_asleep_guard.is_asleep_sum))
+    def part_1(self):
+        return strategy_1(self.model)
 
+    def part_2(self):
+        return strategy_2(self.model)
 
 
-if __name__ == "__main__":
+main = Solution.main
+if __name__ == "__main__":  # pragma: no cover
     main()
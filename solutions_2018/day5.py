@@ -1,14 +1,22 @@
-with open("input_day5.txt", "r") as f:
-    data = f.read().strip()
+"""Day 5 solution.
+
+https://adventofcode.com/2018/day/5
+"""
 
 import logging as lg
-lg.basicConfig(level=lg.DEBUG, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s", datefmt="%H:%M:%S")
-_logger = lg.getLogger(__name__)
 
-_logger.debug("data length: {}".format(len(data)))
+import _common
+
+_logger = lg.getLogger(__name__)
 
 
 def collapse(letters):
+    """Fully react a polymer, in-place.
+
+    Args:
+        letters (list[str]): polymer units
+    """
+
     # A = 65
     # a = 97
     j = 0
@@ -25,18 +33,48 @@ def collapse(letters):
             j = 0
 
 
-letters = list(data)
-collapse(letters)
-# _logger.debug("Final result: {}".format("".join(letters)))
-print("Answer pt1:", len(letters))
+def shortest_improved_length(letters):
+    """Find the shortest fully reacted polymer after removing one unit type.
+
+    Args:
+        letters (list[str]): polymer units
+
+    Returns:
+        int: shortest polymer length
+    """
+
+    final_lengths = []
+    for j in range(26):
+        remove_letter_ords = (65 + j, 97 + j)
+        letters_j = [l for l in letters if ord(l) not in remove_letter_ords]
+        collapse(letters_j)
+        _logger.debug("Removing '{}': final length: {}".format(chr(65 + j), len(letters_j)))
+        final_lengths.append(len(letters_j))
+    return min(final_lengths)
+
+
+class Solution(_common.InputtedSolution):  # TODO: unit-test, document
+    year = 2018
+    day = 5
+
+    def __init__(self):
+        super().__init__()
+        self.letters = None
+
+    def parse(self):
+        super().parse()
+        self.letters = list(self.input_text.strip())
+        _logger.debug("data length: {}".format(len(self.letters)))
+
+    def part_1(self):
+        letters = self.letters.copy()
+        collapse(letters)
+        return len(letters)
+
+    def part_2(self):
+        return shortest_improved_length(self.letters)
 
-letters = list(data)
-final_lengths = []
-for j in range(26):
-    remove_letter_ords = (65 + j, 97 + j)
-    letters_j = [l for l in letters if ord(l) not in remove_letter_ords]
-    collapse(letters_j)
-    _logger.debug("Removing '{}': final length: {}".format(chr(65 + j), len(letters_j)))
-    final_lengths.append(len(letters_j))
 
-print("Answer pt2:", min(final_lengths))
+main = Solution.main
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -1,42 +1,103 @@
-import numpy as np
+"""Day 6 solution.
+
+https://adventofcode.com/2018/day/6
+"""
+
 import logging as lg
-lg.basicConfig(level=lg.DEBUG, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s", datefmt="%H:%M:%S")
+
+import numpy as np
+import _common
+
 _logger = lg.getLogger(__name__)
 
-points = np.loadtxt("input_day6.txt", dtype=np.int16, delimiter=", ")
-_logger.debug("points.shape: {}".format(points.shape))
-
-points -= points.min(axis=0) - 1
-bbox_size = points.max(axis=0) + 3
-
-grid = [
-    np.broadcast_to(np.arange(bbox_size[0])[:, None], bbox_size),
-    np.broadcast_to(np.arange(bbox_size[1])[None, :], bbox_size)]
-grid = np.stack(grid, axis=2)
-dists = np.linalg.norm(grid[:, :, None, :] - points[None, None, :], ord=1, axis=3)
-
-nearest = np.argmin(dists, axis=2)
-nearest2 = len(points) - 1 - np.argmin(dists[..., ::-1], axis=2)
-_logger.debug("number of ties: {} / {}".format(np.sum(nearest != nearest2), nearest.size))
-# _logger.debug(nearest[120:130, 100:110])
-# _logger.debug(nearest2[120:130, 100:110])
-nearest[nearest != nearest2] = 2**16 - 1  # remove ties
-# _logger.debug(nearest[120:130, 100:110])
-_logger.debug("nearest.shape: {}".format(nearest.shape))
-
-bdys = np.concatenate([nearest[:, 0], nearest[0, :], nearest[:, -1], nearest[-1, :]], axis=0)
-bdy_js = np.unique(bdys)
-_logger.debug("Points with infite areas: {}".format(bdy_js))
-max_size = 0
-max_j = 0
-for j in range(len(points)):
-    if j in bdy_js:
-        continue
-    size_j = np.sum(nearest == j)
-    _logger.debug("Size of area {}: {}".format(j, size_j))
-    if size_j > max_size:
-        max_size = size_j
-        max_j = j
-print("Answer pt1:", max_size)
-
-print("Answer pt2:", np.sum(np.sum(dists, axis=2) < 10000))
+
+def compute_distances(points):
+    """Compute Manhattan distances from each grid location to each point.
+
+    The grid covers the points' bounding box with a margin.
+
+    Args:
+        points (np.ndarray): coordinates
+
+    Returns:
+        np.ndarray: distances, shape (height, width, number of points)
+    """
+
+    points = points - (points.min(axis=0) - 1)
+    bbox_size = points.max(axis=0) + 3
+
+    grid = [
+        np.broadcast_to(np.arange(bbox_size[0])[:, None], bbox_size),
+        np.broadcast_to(np.arange(bbox_size[1])[None, :], bbox_size)]
+    grid = np.stack(grid, axis=2)
+    return np.linalg.norm(grid[:, :, None, :] - points[None, None, :], ord=1, axis=3)
+
+
+def largest_finite_area(dists):
+    """Find the size of the largest finite area nearest to one point.
+
+    Args:
+        dists (np.ndarray): grid distances to points
+
+    Returns:
+        int: area size
+    """
+
+    n_points = dists.shape[2]
+    nearest = np.argmin(dists, axis=2)
+    nearest2 = n_points - 1 - np.argmin(dists[..., ::-1], axis=2)
+    _logger.debug("number of ties: {} / {}".format(np.sum(nearest != nearest2), nearest.size))
+    nearest[nearest != nearest2] = 2**16 - 1  # remove ties
+
+    bdys = np.concatenate([nearest[:, 0], nearest[0, :], nearest[:, -1], nearest[-1, :]], axis=0)
+    bdy_js = np.unique(bdys)
+    _logger.debug("Points with infite areas: {}".format(bdy_js))
+    max_size = 0
+    for j in range(n_points):
+        if j in bdy_js:
+            continue
+        size_j = np.sum(nearest == j)
+        _logger.debug("Size of area {}: {}".format(j, size_j))
+        max_size = max(max_size, size_j)
+    return int(max_size)
+
+
+def safe_region_size(dists, max_total=10000):
+    """Count locations with total distance to all points under a limit.
+
+    Args:
+        dists (np.ndarray): grid distances to points
+        max_total (int): total distance limit (exclusive)
+
+    Returns:
+        int: region size
+    """
+
+    return int(np.sum(np.sum(dists, axis=2) < max_total))
+
+
+class Solution(_common.InputtedSolution):  # TODO: unit-test, document
+    year = 2018
+    day = 6
+
+    def __init__(self):
+        super().__init__()
+        self.dists = None
+
+    def parse(self):
+        super().parse()
+        lines = self.input_text.strip().splitlines()
+        points = np.array([tuple(map(int, line.split(","))) for line in lines], dtype=np.int16)
+        _logger.debug("points.shape: {}".format(points.shape))
+        self.dists = compute_distances(points)
+
+    def part_1(self):
+        return largest_finite_area(self.dists)
+
+    def part_2(self):
+        return safe_region_size(self.dists)
+
+
+main = Solution.main
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -1,22 +1,23 @@
-with open("input_day7.txt", "r") as f:
-    lines = f.readlines()
+"""Day 7 solution.
+
+https://adventofcode.com/2018/day/7
+"""
 
-import networkx as nx
 import logging as lg
-lg.basicConfig(
-    level=lg.DEBUG,
-    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-    datefmt="%H:%M:%S")
+
+import _common
+
 _logger = lg.getLogger(__name__)
 
 
 class Requirements:
     def __init__(self):
-        self.requirements = {s: [] for s in map(chr, range(65, 91))}
+        self.requirements = {}
 
     def add_requirement(self, step_name, require_name):
-        assert step_name not in self.requirements[require_name]  # no cycles
-        self.requirements[step_name].append(require_name)
+        assert step_name not in self.requirements.get(require_name, [])  # no cycles
+        self.requirements.setdefault(require_name, [])
+        self.requirements.setdefault(step_name, []).append(require_name)
 
     def add_requirements_from_lines(self, lines):
         [self.add_requirement(line[36], line[5]) for line in lines]
@@ -43,22 +44,15 @@ class Order:
     def build_order(self):
         # _reqs_str = "\n".join("{}: {}".format(s, rs) for s, rs in self.requirements.items())
         # _logger.debug("Requirements:\n{}".format(_reqs_str))
-        while len(self.order) < 26:
+        while len(self.order) < len(self.requirements.requirements):
             self._set_next_step()
 
 
-reqs = Requirements()
-reqs.add_requirements_from_lines(lines)
-order = Order(reqs)
-order.build_order()
-assert "".join(order.order) == "FDSEGJLPKNRYOAMQIUHTCVWZXB"
-print("Answer pt1:", "".join(order.order))
-
-
 class Task:
-    def __init__(self, step_name, start_second):
+    def __init__(self, step_name, start_second, base_length=60):
         self.step_name = step_name
         self.start_second = start_second
+        self.base_length = base_length
 
     def __str__(self):
         return "{} @ {}".format(self.step_name, self.start_second)
@@ -71,15 +65,16 @@ class Task:
 
     @property
     def length(self):
-        return 60 + ord(self.step_name) - 65
+        return self.base_length + ord(self.step_name) - 65
 
 
 class Schedule:
-    def __init__(self, requirements):
+    def __init__(self, requirements, n_workers=5, base_length=60):
         self.requirements = requirements
+        self.base_length = base_length
         self.seconds = []
         self._completed = set()
-        self._current = [None] * 5
+        self._current = [None] * n_workers
         self._next = []
 
     def _update_next(self):
@@ -102,20 +97,44 @@ class Schedule:
                 continue
             if not self._next:
                 break
-            self._current[j] = Task(self._next.pop(0), len(self.seconds))
+            self._current[j] = Task(self._next.pop(0), len(self.seconds), base_length=self.base_length)
 
     def _add_second(self):
         _logger.debug("Second {}: {}".format(len(self.seconds), self._current))
         self.seconds.append(self._current.copy())
 
     def build_schedule(self):
-        while len(self._completed) < 26:
+        while len(self._completed) < len(self.requirements.requirements):
             self._finish_tasks()
             self._update_next()
             self._start_tasks()
             self._add_second()
 
 
-sched = Schedule(reqs)
-sched.build_schedule()
-print("Answer pt2:", len(sched.seconds) - 1)
+class Solution(_common.InputLinesSolution):  # TODO: unit-test, document
+    year = 2018
+    day = 7
+
+    def __init__(self):
+        super().__init__()
+        self.requirements = None
+
+    def parse(self):
+        super().parse()
+        self.requirements = Requirements()
+        self.requirements.add_requirements_from_lines(self.items)
+
+    def part_1(self):
+        order = Order(self.requirements)
+        order.build_order()
+        return "".join(order.order)
+
+    def part_2(self):
+        schedule = Schedule(self.requirements)
+        schedule.build_schedule()
+        return len(schedule.seconds) - 1
+
+
+main = Solution.main
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -1,9 +1,12 @@
+"""Day 8 solution.
+
+https://adventofcode.com/2018/day/8
+"""
+
 import logging as lg
 
-lg.basicConfig(
-    level=lg.DEBUG,
-    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-    datefmt="%H:%M:%S")
+import _common
+
 _logger = lg.getLogger(__name__)
 
 
@@ -55,10 +58,27 @@ class Parser:
         self.root = node
 
 
-with open("input_day8.txt", "r") as f:
-    data_str = f.read()
-parser = Parser.from_data_str(data_str)
-parser.parse()
-print("Answer pt1:", parser.root.sum_metadata())
+class Solution(_common.InputtedSolution):  # TODO: unit-test, document
+    year = 2018
+    day = 8
+
+    def __init__(self):
+        super().__init__()
+        self.root = None
+
+    def parse(self):
+        super().parse()
+        parser = Parser.from_data_str(self.input_text)
+        parser.parse()
+        self.root = parser.root
+
+    def part_1(self):
+        return self.root.sum_metadata()
+
+    def part_2(self):
+        return self.root.get_value()
+
 
-print("Answer pt2:", parser.root.get_value())
+main = Solution.main
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -1,10 +1,13 @@
+"""Day 9 solution.
+
+https://adventofcode.com/2018/day/9
+"""
+
+import re
 import logging as lg
-import time
 
-lg.basicConfig(
-    level=lg.DEBUG,
-    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-    datefmt="%H:%M:%S")
+import _common
+
 _logger = lg.getLogger(__name__)
 
 
@@ -40,20 +43,51 @@ class Marble:
         return self
 
 
-n_players = int(input("Number of players: "))
-last_marble = int(input("Enter last marble points: "))
-
-t = time.time()
-scores = [0] * n_players
-current = Marble(0)
-player = 0
-for value in range(1, last_marble + 1):
-    if value % 23 == 0:
-        back7 = current.get_prev(n=7).pop()
-        current = back7.next_
-        scores[player] += value + back7.value
-    else:
-        current = current.get_next(n=1).insert_next(value)
-    player = (player + 1) % n_players
-print("Answer:", max(scores))
-print("Finished in {:.3f} seconds".format(time.time() - t))
+def play(n_players, last_marble):
+    """Play the marble game.
+
+    Args:
+        n_players (int): number of players
+        last_marble (int): value of last marble
+
+    Returns:
+        int: winning score
+    """
+
+    scores = [0] * n_players
+    current = Marble(0)
+    player = 0
+    for value in range(1, last_marble + 1):
+        if value % 23 == 0:
+            back7 = current.get_prev(n=7).pop()
+            current = back7.next_
+            scores[player] += value + back7.value
+        else:
+            current = current.get_next(n=1).insert_next(value)
+        player = (player + 1) % n_players
+    return max(scores)
+
+
+class Solution(_common.InputtedSolution):  # TODO: unit-test, document
+    year = 2018
+    day = 9
+
+    def __init__(self):
+        super().__init__()
+        self.n_players = None
+        self.last_marble = None
+
+    def parse(self):
+        super().parse()
+        self.n_players, self.last_marble = map(int, re.findall(r"\d+", self.input_text))
+
+    def part_1(self):
+        return play(self.n_players, self.last_marble)
+
+    def part_2(self):
+        return play(self.n_players, self.last_marble * 100)
+
+
+main = Solution.main
+if __name__ == "__main__":  # pragma: no cover
+    main()
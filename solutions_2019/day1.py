@@ -39,6 +39,7 @@ def get_fuel_required_including_self(module_mass: float) -> float:
 
 class Solution(_common.InputLinesSolution):  # TODO: unit-test, document
     line_type = float
+    streamable = True
     year = 2019
     day = 1
 
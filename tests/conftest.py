@@ -0,0 +1,77 @@
+"""Shared test fixtures."""
+
+import time
+import threading
+import http.server
+
+import pytest
+
+
+class _InputHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    paths = []
+
+    def do_GET(self):
+        self.paths.append(self.path)
+        body = "input for {}\n".format(self.path).encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def input_server(tmp_path, monkeypatch):
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _InputHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    _InputHandler.paths = []
+    monkeypatch.setenv("AOC_BASE_URL", "http://127.0.0.1:{}".format(server.server_port))
+    monkeypatch.setenv("AOC_INPUT_CACHE", str(tmp_path / "cache"))
+    monkeypatch.setenv("AOC_SESSION_TOKEN", "spam")
+    yield _InputHandler.paths
+    server.shutdown()
+    server.server_close()
+
+
+class _FlakyInputHandler(_InputHandler):
+    lock = threading.Lock()
+    in_flight = 0
+    max_in_flight = 0
+    failed = set()
+
+    def do_GET(self):
+        cls = type(self)
+        with cls.lock:
+            cls.in_flight += 1
+            cls.max_in_flight = max(cls.max_in_flight, cls.in_flight)
+            fail = self.path not in cls.failed
+            cls.failed.add(self.path)
+        time.sleep(0.05)
+        with cls.lock:
+            cls.in_flight -= 1
+        if "/day/13/" in self.path:
+            self.paths.append(self.path)
+            self.send_error(404)
+        elif fail:
+            self.paths.append(self.path)
+            self.send_error(503)
+        else:
+            super().do_GET()
+
+
+@pytest.fixture
+def flaky_input_server(input_server, monkeypatch):
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _FlakyInputHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    _FlakyInputHandler.paths = []
+    _FlakyInputHandler.failed = set()
+    _FlakyInputHandler.max_in_flight = 0
+    monkeypatch.setenv("AOC_BASE_URL", "http://127.0.0.1:{}".format(server.server_port))
+    yield _FlakyInputHandler
+    server.shutdown()
+    server.server_close()
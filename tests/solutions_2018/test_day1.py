@@ -1,5 +1,6 @@
 from solutions_2018 import day1 as tscr
 import pytest
+import numpy as np
 
 
 @pytest.mark.parametrize(("changes", "exp"), [
@@ -19,3 +20,51 @@ def test_part_1(changes, exp):
     ([7, 7, -2, -7, -4], 14)])
 def test_part_2(changes, exp):
     assert tscr.get_first_duplicate_freq(changes) == exp
+
+
+def _simulate_first_duplicate_freq(changes):
+    cur_freq = 0
+    visited_freqs = set()
+    while True:
+        for change in changes:
+            if cur_freq in visited_freqs:
+                return cur_freq
+            visited_freqs.add(cur_freq)
+            cur_freq += change
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_part_2_random(seed):
+    rng = np.random.default_rng(seed)
+    changes = rng.integers(-50, 51, size=rng.integers(1, 40)).tolist()
+    changes.append(int(rng.integers(-3, 4)) - sum(changes))  # small drift
+    assert tscr.get_first_duplicate_freq(changes) == _simulate_first_duplicate_freq(changes)
+
+
+@pytest.mark.parametrize(("changes", "exp"), [
+    ([5], None),
+    ([0], 0),
+    ([1, 2], None),
+    ([2, -2, 1000000], 0),
+    ([-1000000, 1000001], 0)])
+def test_part_2_edge_cases(changes, exp):
+    if exp is None:
+        with pytest.raises(ValueError):
+            tscr.get_first_duplicate_freq(changes)
+    else:
+        assert tscr.get_first_duplicate_freq(changes) == exp
+
+
+def test_part_2_empty():
+    with pytest.raises(ValueError):
+        tscr.get_first_duplicate_freq([])
+
+
+def test_solution_stream(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_text("+3\n+3\n+4\n-2\n-4\n")
+    soln = tscr.Solution()
+    soln.parse_args([str(path), "--stream"])
+    soln.parse()
+    assert soln.part_1() == 4
+    assert soln.part_2() == 10
@@ -0,0 +1,59 @@
+from solutions_2018 import day10 as tscr
+# import pytest
+
+data_str = """\
+position=< 9,  1> velocity=< 0,  2>
+position=< 7,  0> velocity=<-1,  0>
+position=< 3, -2> velocity=<-1,  1>
+position=< 6, 10> velocity=<-2, -1>
+position=< 2, -4> velocity=< 2,  2>
+position=<-6, 10> velocity=< 2, -2>
+position=< 1,  8> velocity=< 1, -1>
+position=< 1,  7> velocity=< 1,  0>
+position=<-3, 11> velocity=< 1, -2>
+position=< 7,  6> velocity=<-1, -1>
+position=<-2,  3> velocity=< 1,  0>
+position=<-4,  3> velocity=< 2,  0>
+position=<10, -3> velocity=<-1,  1>
+position=< 5, 11> velocity=< 1, -2>
+position=< 4,  7> velocity=< 0, -1>
+position=< 8, -2> velocity=< 0,  1>
+position=<15,  0> velocity=<-2,  0>
+position=< 1,  6> velocity=< 1,  0>
+position=< 8,  9> velocity=< 0, -1>
+position=< 3,  3> velocity=<-1,  1>
+position=< 0,  5> velocity=< 0, -1>
+position=<-2,  2> velocity=< 2,  0>
+position=< 5, -2> velocity=< 1,  2>
+position=< 1,  4> velocity=< 2,  1>
+position=<-2,  7> velocity=< 2, -2>
+position=< 3,  6> velocity=<-1, -1>
+position=< 5,  0> velocity=< 1,  0>
+position=<-6,  0> velocity=< 2,  0>
+position=< 5,  9> velocity=< 1, -2>
+position=<14,  7> velocity=<-2,  0>
+position=<-3,  6> velocity=< 2, -1>
+"""
+
+exp_message = "\n".join((
+    "#   #  ###",
+    "#   #   #",
+    "#   #   #",
+    "#####   #",
+    "#   #   #",
+    "#   #   #",
+    "#   #   #",
+    "#   #  ###"))
+
+
+def test_parse_data():
+    points, velocities = tscr.parse_data(data_str)
+    assert points.shape == velocities.shape == (31, 2)
+    assert points[0].tolist() == [1, 9]
+    assert velocities[3].tolist() == [-1, -2]
+
+
+def test_find_message():
+    points, second = tscr.find_message(*tscr.parse_data(data_str))
+    assert second == 3
+    assert tscr.format_points(points) == exp_message
@@ -0,0 +1,16 @@
+from solutions_2018 import day11 as tscr
+import pytest
+
+
+@pytest.mark.parametrize(("serial", "x", "y", "exp"), [
+    (8, 3, 5, 4),
+    (57, 122, 79, -5),
+    (39, 217, 196, 0),
+    (71, 101, 153, 4)])
+def test_power_levels(serial, x, y, exp):
+    assert tscr.Grid(serial).power_levels[y - 1, x - 1] == exp
+
+
+@pytest.mark.parametrize(("serial", "exp"), [(18, (33, 45)), (42, (21, 61))])
+def test_part_1(serial, exp):
+    assert tscr.find_best_window(serial) == exp
@@ -0,0 +1,38 @@
+from solutions_2018 import day12 as tscr
+import pytest
+
+data_str = """\
+initial state: #..#.#..##......###...###
+
+...## => #
+..#.. => #
+.#... => #
+.#.#. => #
+.#.## => #
+.##.. => #
+.#### => #
+#.#.# => #
+#.### => #
+##.#. => #
+##.## => #
+###.. => #
+###.# => #
+####. => #
+"""
+
+
+def test_part_1():
+    sim = tscr.PlantSimulate.from_data_str(data_str)
+    sim.run(n=20)
+    assert sim.get_plant_pot_sum() == 325
+
+
+@pytest.mark.parametrize("n", [20, 100, 157, 250])
+def test_skip_to(n):
+    sim = tscr.PlantSimulate.from_data_str(data_str)
+    sim.run(n=n)
+    skipped = tscr.PlantSimulate.from_data_str(data_str)
+    skipped.skip_to(n)
+    assert skipped.generation == n
+    assert len(skipped._states) <= len(sim._states)  # pattern repeats from generation 87
+    assert skipped.get_plant_pot_sum() == sim.get_plant_pot_sum()
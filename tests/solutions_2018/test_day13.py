@@ -0,0 +1,35 @@
+from solutions_2018 import day13 as tscr
+# import pytest
+
+
+def _pad(lines):
+    width = max(len(line) for line in lines)
+    return "\n".join(line.ljust(width) for line in lines) + "\n"
+
+
+crash_data_str = _pad((
+    "/->-\\",
+    "|   |  /----\\",
+    "| /-+--+-\\  |",
+    "| | |  | v  |",
+    "\\-+-/  \\-+--/",
+    "  \\------/"))
+
+last_cart_data_str = _pad((
+    "/>-<\\",
+    "|   |",
+    "| /<+-\\",
+    "| | | v",
+    "\\>+</ |",
+    "  |   ^",
+    "  \\<->/"))
+
+
+def test_part_1():
+    layout = tscr.Layout.from_data_str(crash_data_str)
+    assert tscr.find_first_crash(layout) == (7, 3)
+
+
+def test_part_2():
+    layout = tscr.Layout.from_data_str(last_cart_data_str)
+    assert tscr.find_last_cart(layout) == (6, 4)
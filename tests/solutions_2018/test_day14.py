@@ -0,0 +1,46 @@
+from solutions_2018 import day14 as tscr
+import _common
+import pytest
+import logging as lg
+
+lg.getLogger().setLevel(lg.DEBUG)
+
+
+@pytest.mark.parametrize(("n", "exp"), [
+    (9, "5158916779"),
+    (5, "0124515891"),
+    (18, "9251071085"),
+    (2018, "5941429882")])
+def test_part_1(n, exp):
+    runner = tscr.RecipeScore(3, 7)
+    runner.run(n=n + 10)
+    assert "".join(str(s.value) for s in runner.scoreboard[n:n + 10]) == exp
+
+
+@pytest.mark.parametrize(("values", "exp"), [
+    ((5, 1, 5, 8, 9), 9),
+    ((0, 1, 2, 4, 5), 5),
+    ((9, 2, 5, 1, 0), 18),
+    ((5, 9, 4, 1, 4), 2018)])
+def test_part_2(values, exp):
+    runner = tscr.RecipeScore(3, 7)
+    assert runner.find(values) == exp
+
+
+def test_find_resume(tmp_path):
+    path = tmp_path / "recipes.ckpt.gz"
+    runner = tscr.RecipeScore(3, 7)
+    runner.run(n=1500, checkpointer=_common.Checkpointer(path, every_steps=1000))
+    assert path.exists()
+
+    runner = tscr.RecipeScore(3, 7)
+    assert runner.find((5, 9, 4, 1, 4), checkpointer=_common.Checkpointer(path, resume=True)) == 2018
+
+
+def test_run_checkpoint_every_few_steps(tmp_path):
+    path = tmp_path / "recipes.ckpt.gz"
+    runner = tscr.RecipeScore(3, 7)
+    runner.run(n=100, checkpointer=_common.Checkpointer(path, every_steps=7))
+    step, _ = _common.Checkpointer(path, resume=True).load()
+    assert 0 < step < 1000
+    assert step % 7 == 0
@@ -1,4 +1,5 @@
 from solutions_2018 import day18 as tscr
+import _common
 import pytest
 import numpy as np
 import logging as lg
@@ -191,3 +192,55 @@ def test_part_1():
     strange_magic = tscr.StrangeMagic(lca)
     strange_magic.run(10)
     assert strange_magic.resource_value == 1147
+
+
+def test_run_resume(tmp_path):
+    data_str = "\n".join((
+        ".#.#...|#.",
+        ".....#|##|",
+        ".|..|...#.",
+        "..|#.....#",
+        "#.#|||#|#|",
+        "...#.||...",
+        ".|....|...",
+        "||...#|.#|",
+        "|.||||..|.",
+        "...#.|..|."))
+    path = tmp_path / "magic.ckpt.gz"
+    lca = tscr.LCA.from_data_str(data_str)
+    tscr.StrangeMagic(lca).run(5, checkpointer=_common.Checkpointer(path, every_steps=5))
+    assert path.exists()
+
+    strange_magic = tscr.StrangeMagic(lca)
+    strange_magic.run(10, checkpointer=_common.Checkpointer(path, every_steps=100, resume=True))
+    assert strange_magic.resource_value == 1147
+
+
+def test_solution_part_2_independent_of_cached_part_1(tmp_path, monkeypatch):
+    monkeypatch.setenv("AOC_ANSWER_CACHE", str(tmp_path / "answers"))
+    monkeypatch.setattr(tscr.Solution, "part_2_steps", 12)
+    path = tmp_path / "input.txt"
+    path.write_text("\n".join((
+        ".#.#...|#.",
+        ".....#|##|",
+        ".|..|...#.",
+        "..|#.....#",
+        "#.#|||#|#|",
+        "...#.||...",
+        ".|....|...",
+        "||...#|.#|",
+        "|.||||..|.",
+        "...#.|..|.")) + "\n")
+
+    def run(args, phases):
+        soln = tscr.Solution()
+        soln.parse_args([str(path)] + args)
+        answers = [soln.run_phase(phase) for phase in ("parse",) + phases]
+        return soln, answers[-1]
+
+    run([], ("part_1",))  # cache part 1 only
+    cached_soln, cached_answer = run([], ("part_1", "part_2"))
+    assert cached_soln.cache_hits == {"part_1"}
+    uncached_soln, uncached_answer = run(["--no-cache"], ("part_1", "part_2"))
+    assert not uncached_soln.cache_hits
+    assert cached_answer == uncached_answer
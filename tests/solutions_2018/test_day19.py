@@ -1,4 +1,5 @@
 from solutions_2018 import day19 as tscr
+import _common
 # import pytest
 import logging as lg
 
@@ -33,3 +34,23 @@ def test_program():
     program.step()
     assert program.state == tscr.State(6, 5, 6, 0, 0, 9)
     assert program.instruction_idx == 7
+
+
+def test_program_run_checkpoint_every_few_steps(tmp_path):
+    data_str = "\n".join((
+        "#ip 0",
+        "seti 5 0 1",
+        "seti 6 0 2",
+        "addi 0 1 0",
+        "addr 1 2 3",
+        "setr 1 0 0",
+        "seti 8 0 4",
+        "seti 9 0 5"))
+    path = tmp_path / "program.ckpt.gz"
+    program = tscr.Program.from_data_str(data_str)
+    program.run(checkpointer=_common.Checkpointer(path, every_steps=2))
+    assert program.state == tscr.State(6, 5, 6, 0, 0, 9)
+    step, (registers, instruction_idx) = _common.Checkpointer(path, resume=True).load()
+    assert step == 4
+    assert registers == (5, 5, 6, 0, 0, 0)
+    assert instruction_idx == 6
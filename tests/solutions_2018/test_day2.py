@@ -1,5 +1,6 @@
 from solutions_2018 import day2 as tscr
-# import pytest
+import pytest
+import numpy as np
 
 
 def test_part_1():
@@ -8,7 +9,56 @@ def test_part_1():
     assert tscr.compute_checksum(words) == exp
 
 
-def test_part_2():
+def test_part_1_loop():
+    words = ["abcdef", "bababc", "abbcd", "abcccd", "aabcdd", "abcdee", "ababab"]
+    assert tscr.words_to_array(words) is None
+    assert tscr.compute_checksum(words) == 12
+
+
+def test_part_1_random():
+    rng = np.random.default_rng(0)
+    words = ["".join(rng.choice(list("abcde"), size=8)) for _ in range(500)]
+    assert tscr.compute_checksum(words) == tscr._compute_checksum_loop(words)
+
+
+@pytest.mark.parametrize("method", ["masked", "pairwise", "blocked"])
+def test_part_2(method):
     words = ["abcde", "fghij", "klmno", "pqrst", "fguij", "axcye", "wvxyz"]
     exp = "fgij"
+    assert tscr.get_same_boxes_common_characters(words, method=method) == exp
+
+
+@pytest.mark.parametrize("method", ["masked", "pairwise", "blocked"])
+def test_part_2_none(method):
+    words = ["abcde", "fghij", "abxyz"]
+    assert tscr.get_same_boxes_common_characters(words, method=method) is None
+
+
+def test_part_2_random():
+    rng = np.random.default_rng(0)
+    words = list({"".join(rng.choice(list("abcdefghij"), size=12)) for _ in range(2000)})
+    words.append(words[1234][:5] + "z" + words[1234][6:])
+    exp = words[1234][:5] + words[1234][6:]
     assert tscr.get_same_boxes_common_characters(words) == exp
+
+
+def _brute_force_pairs(words, max_distance):
+    return [
+        (j, k, sum(c != c2 for c, c2 in zip(words[j], words[k])))
+        for j in range(len(words)) for k in range(j + 1, len(words))
+        if sum(c != c2 for c, c2 in zip(words[j], words[k])) <= max_distance]
+
+
+@pytest.mark.parametrize("n_workers", [None, 2])
+def test_find_similar_pairs(n_workers):
+    rng = np.random.default_rng(0)
+    words = ["".join(rng.choice(list("abc"), size=6)) for _ in range(300)]
+    exp = _brute_force_pairs(words, 2)
+    res = tscr.find_similar_pairs(words, max_distance=2, max_block_bytes=3 * 37 ** 2, n_workers=n_workers)
+    assert [tuple(p) for p in res.tolist()] == exp
+
+
+def test_find_similar_pairs_invalid():
+    assert tscr.find_similar_pairs([]).shape == (0, 3)
+    with pytest.raises(ValueError):
+        tscr.find_similar_pairs(["abc", "ab"])
@@ -0,0 +1,71 @@
+from solutions_2018 import day3 as tscr
+import numpy as np
+
+lines = ["#1 @ 1,3: 4x4", "#2 @ 3,1: 4x4", "#3 @ 5,5: 2x2"]
+
+
+def test_parse_claims():
+    ids, yxs, hws = tscr.parse_claims(lines)
+    assert ids == ["1", "2", "3"]
+    assert yxs.tolist() == [[3, 1], [1, 3], [5, 5]]
+    assert hws.tolist() == [[4, 4], [4, 4], [2, 2]]
+
+
+def test_part_1():
+    ids, yxs, hws = tscr.parse_claims(lines)
+    counts = tscr.count_claims(yxs, hws)
+    assert counts.shape == (7, 7)
+    assert (counts > 1).sum() == 4
+
+
+def test_part_2():
+    ids, yxs, hws = tscr.parse_claims(lines)
+    counts = tscr.count_claims(yxs, hws)
+    assert tscr.find_unique_claim(ids, yxs, hws, counts) == "3"
+
+
+def test_count_claims_random():
+    rng = np.random.default_rng(0)
+    yxs = rng.integers(0, 50, size=(200, 2))
+    hws = rng.integers(1, 20, size=(200, 2))
+    np.testing.assert_array_equal(tscr.count_claims(yxs, hws), tscr._count_claims_loop(yxs, hws))
+
+
+def test_count_claim_overlaps():
+    rng = np.random.default_rng(0)
+    yxs = rng.integers(0, 50, size=(200, 2))
+    hws = rng.integers(1, 20, size=(200, 2))
+    counts = tscr.count_claims(yxs, hws)
+    res = tscr.count_claim_overlaps(yxs, hws, tscr.overlap_table(counts))
+    exp = [np.sum(counts[y:y + h, x:x + w] > 1) for (y, x), (h, w) in zip(yxs, hws)]
+    assert res.tolist() == exp
+
+
+def test_part_2_none():
+    ids, yxs, hws = tscr.parse_claims(lines[:2])
+    counts = tscr.count_claims(yxs, hws)
+    assert tscr.find_unique_claim(ids, yxs, hws, counts) is None
+
+
+def test_compress_claims():
+    rng = np.random.default_rng(0)
+    yxs = rng.integers(0, 50, size=(200, 2))
+    hws = rng.integers(1, 20, size=(200, 2))
+    counts = tscr.count_claims(yxs, hws)
+    c_yxs, c_hws, areas = tscr.compress_claims(yxs, hws)
+    c_counts = tscr.count_claims(c_yxs, c_hws)
+    assert areas[c_counts > 1].sum() == (counts > 1).sum()
+    c_overlaps = tscr.count_claim_overlaps(c_yxs, c_hws, tscr.overlap_table(c_counts))
+    overlaps = tscr.count_claim_overlaps(yxs, hws, tscr.overlap_table(counts))
+    assert ((c_overlaps == 0) == (overlaps == 0)).all()
+
+
+def test_solution_sparse(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_text("#1 @ 1000001,3000003: 4x4\n#2 @ 1000003,3000001: 4x4\n#3 @ 1000005,3000005: 2x2\n")
+    soln = tscr.Solution()
+    soln.parse_args([str(path)])
+    soln.parse()
+    assert soln.areas is not None
+    assert soln.part_1() == 4
+    assert soln.part_2() == "3"
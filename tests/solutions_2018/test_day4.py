@@ -0,0 +1,126 @@
+from solutions_2018 import day4 as tscr
+import pytest
+import numpy as np
+
+lines = [
+    "[1518-11-01 00:00] Guard #10 begins shift",
+    "[1518-11-01 00:05] falls asleep",
+    "[1518-11-01 00:25] wakes up",
+    "[1518-11-01 00:30] falls asleep",
+    "[1518-11-01 00:55] wakes up",
+    "[1518-11-01 23:58] Guard #99 begins shift",
+    "[1518-11-02 00:40] falls asleep",
+    "[1518-11-02 00:50] wakes up",
+    "[1518-11-03 00:05] Guard #10 begins shift",
+    "[1518-11-03 00:24] falls asleep",
+    "[1518-11-03 00:29] wakes up",
+    "[1518-11-04 00:02] Guard #99 begins shift",
+    "[1518-11-04 00:36] falls asleep",
+    "[1518-11-04 00:46] wakes up",
+    "[1518-11-05 00:03] Guard #99 begins shift",
+    "[1518-11-05 00:45] falls asleep",
+    "[1518-11-05 00:55] wakes up",
+]
+
+
+def _get_guards():
+    events = [tscr.Event.from_line(line) for line in reversed(lines)]
+    return tscr.build_guards(tscr.build_shifts(events))
+
+
+def test_build_guards():
+    guards = _get_guards()
+    assert set(guards) == {"#10", "#99"}
+    assert len(guards["#10"].shifts) == 2
+    assert guards["#10"].minutes_asleep == 50
+    assert guards["#10"].minute_most_asleep == 24
+    assert guards["#99"].is_asleep_sum[45] == 3
+
+
+def test_clear_cache():
+    guards = _get_guards()
+    shift = guards["#10"].shifts[-1]
+    assert guards["#10"].minutes_asleep == 50
+    shift.add_event(tscr.Event.from_line("[1518-11-03 00:40] falls asleep"))
+    assert guards["#10"].minutes_asleep == 70
+
+
+def test_sleep_model():
+    guards = _get_guards()
+    model = tscr.SleepModel.from_guards(guards)
+    assert model.asleep.shape == (5, 60)
+    assert model.guard_ids == ["#10", "#99"]
+    assert model.minutes_asleep.tolist() == [50, 30]
+    assert model.histograms[1].tolist() == guards["#99"].is_asleep_sum.tolist()
+
+
+def test_sleep_model_clear_cache():
+    guards = _get_guards()
+    model = tscr.SleepModel.from_guards(guards)
+    assert model.minutes_asleep.tolist() == [50, 30]
+    guards["#10"].shifts[-1].add_event(tscr.Event.from_line("[1518-11-03 00:40] falls asleep"))
+    assert model.minutes_asleep.tolist() == [70, 30]
+    assert model.asleep[1, 45] == 1
+    shift = tscr.Shift(tscr.Event.from_line("[1518-11-06 00:00] Guard #99 begins shift"))
+    guards["#99"].add_shift(shift)
+    shift.add_event(tscr.Event.from_line("[1518-11-06 00:58] falls asleep"))
+    assert model.asleep.shape == (6, 60)
+    assert model.minutes_asleep.tolist() == [70, 32]
+
+
+def test_sleep_model_unordered():
+    asleep = np.zeros((3, 60), dtype=np.uint8)
+    asleep[0, 10:20] = asleep[2, 15:16] = asleep[1, 30:35] = 1
+    model = tscr.SleepModel(["#1", "#2"], asleep, np.array([1, 0, 1]))
+    assert model.minutes_asleep.tolist() == [5, 11]
+    assert model.histograms[1, 15] == 2
+
+
+def test_part_1():
+    assert tscr.strategy_1(tscr.SleepModel.from_guards(_get_guards())) == 240
+
+
+def test_part_2():
+    assert tscr.strategy_2(tscr.SleepModel.from_guards(_get_guards())) == 4455
+
+
+def test_parse_log():
+    exp = tscr.SleepModel.from_guards(_get_guards())
+    model = tscr.parse_log("\n".join(reversed(lines)).encode("ascii"))
+    assert model.guard_ids == exp.guard_ids
+    assert model.guard_idxs.tolist() == [0, 1, 0, 1, 1]
+    assert model.histograms.tolist() == exp.histograms.tolist()
+    assert tscr.strategy_1(model) == 240
+    assert tscr.strategy_2(model) == 4455
+
+
+def test_parse_log_invalid():
+    with pytest.raises(ValueError):
+        tscr.parse_log("\n".join(["[1518-10-31 00:05] falls asleep"] + lines))
+
+
+def test_solution(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_text("\n" + "\r\n".join(reversed(lines)) + "\n\n")
+    soln = tscr.Solution()
+    soln.parse_args([str(path)])
+    soln.parse()
+    assert soln.part_1() == 240
+    assert soln.part_2() == 4455
+
+
+def test_part_1_total_not_average():
+    log = [
+        "[1518-11-01 00:00] Guard #10 begins shift",
+        "[1518-11-01 00:10] falls asleep",
+        "[1518-11-01 00:40] wakes up",
+        "[1518-11-02 00:00] Guard #20 begins shift",
+        "[1518-11-02 00:10] falls asleep",
+        "[1518-11-02 00:30] wakes up",
+        "[1518-11-03 00:00] Guard #20 begins shift",
+        "[1518-11-03 00:20] falls asleep",
+        "[1518-11-03 00:40] wakes up",
+    ]
+    model = tscr.SleepModel.from_guards(tscr.build_guards(tscr.build_shifts(map(tscr.Event.from_line, log))))
+    assert model.minutes_asleep.tolist() == [30, 40]  # #10 sleeps more per shift, #20 more in total
+    assert tscr.strategy_1(model) == 20 * 20
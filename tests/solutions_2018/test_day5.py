@@ -0,0 +1,14 @@
+from solutions_2018 import day5 as tscr
+# import pytest
+
+polymer = "dabAcCaCBAcCcaDA"
+
+
+def test_part_1():
+    letters = list(polymer)
+    tscr.collapse(letters)
+    assert "".join(letters) == "dabCBAcaDA"
+
+
+def test_part_2():
+    assert tscr.shortest_improved_length(list(polymer)) == 4
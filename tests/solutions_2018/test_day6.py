@@ -0,0 +1,13 @@
+from solutions_2018 import day6 as tscr
+# import pytest
+import numpy as np
+
+points = np.array([[1, 1], [1, 6], [8, 3], [3, 4], [5, 5], [8, 9]], dtype=np.int16)
+
+
+def test_part_1():
+    assert tscr.largest_finite_area(tscr.compute_distances(points)) == 17
+
+
+def test_part_2():
+    assert tscr.safe_region_size(tscr.compute_distances(points), max_total=32) == 16
@@ -0,0 +1,30 @@
+from solutions_2018 import day7 as tscr
+# import pytest
+
+lines = [
+    "Step C must be finished before step A can begin.",
+    "Step C must be finished before step F can begin.",
+    "Step A must be finished before step B can begin.",
+    "Step A must be finished before step D can begin.",
+    "Step B must be finished before step E can begin.",
+    "Step D must be finished before step E can begin.",
+    "Step F must be finished before step E can begin.",
+]
+
+
+def _get_requirements():
+    requirements = tscr.Requirements()
+    requirements.add_requirements_from_lines(lines)
+    return requirements
+
+
+def test_part_1():
+    order = tscr.Order(_get_requirements())
+    order.build_order()
+    assert "".join(order.order) == "CABDFE"
+
+
+def test_part_2():
+    schedule = tscr.Schedule(_get_requirements(), n_workers=2, base_length=0)
+    schedule.build_schedule()
+    assert len(schedule.seconds) - 1 == 15
@@ -0,0 +1,18 @@
+from solutions_2018 import day8 as tscr
+# import pytest
+
+data_str = "2 3 0 3 10 11 12 1 1 0 1 99 2 1 1 2\n"
+
+
+def _get_root():
+    parser = tscr.Parser.from_data_str(data_str)
+    parser.parse()
+    return parser.root
+
+
+def test_part_1():
+    assert _get_root().sum_metadata() == 138
+
+
+def test_part_2():
+    assert _get_root().get_value() == 66
@@ -0,0 +1,13 @@
+from solutions_2018 import day9 as tscr
+import pytest
+
+
+@pytest.mark.parametrize(("n_players", "last_marble", "exp"), [
+    (9, 25, 32),
+    (10, 1618, 8317),
+    (13, 7999, 146373),
+    (17, 1104, 2764),
+    (21, 6111, 54718),
+    (30, 5807, 37305)])
+def test_play(n_players, last_marble, exp):
+    assert tscr.play(n_players, last_marble) == exp
@@ -0,0 +1,50 @@
+"""Test ``_batch``."""
+
+import _batch as tscr
+
+
+def test_run_batch(tmp_path):
+    (tmp_path / "2019" / "day1").mkdir(parents=True)
+    (tmp_path / "2019" / "day1" / "a.txt").write_text("12\n14\n1969\n100756\n")
+    (tmp_path / "2018" / "day1").mkdir(parents=True)
+    (tmp_path / "2018" / "day1" / "a.txt").write_text("+1\n-2\n+3\n+1\n")
+    solutions = [("solutions_2018.day1", 2018, 1), ("solutions_2019.day1", 2019, 1)]
+    jobs = tscr.build_jobs(solutions, tmp_path)
+    assert [(j.year, j.day) for j in jobs] == [(2018, 1), (2019, 1)]
+
+    results = tscr.run_batch(jobs, n_workers=2)
+    assert [r["error"] for r in results] == [None, None]
+    assert results[0]["answers"] == {"part_1": 3, "part_2": 2}
+    records = list(tscr.iter_records(results))
+    assert [(r["day"], r["phase"]) for r in records[:3]] == [(1, "parse"), (1, "part_1"), (1, "part_2")]
+    assert records[1]["answer"] == 3
+    assert records[1]["input"] == str(tmp_path / "2018" / "day1" / "a.txt")
+    assert results[1]["answers"]["part_1"] == 2 + 2 + 654 + 33583
+    assert set(results[1]["timings"]) == {"parse", "part_1", "part_2"}
+    assert "2019" in tscr.format_report(results)
+
+
+def test_run_job_memory(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_text("12\n14\n")
+    result = tscr.run_job(tscr.Job("solutions_2019.day1", 2019, 1, path), solution_args=["--memory"])
+    assert set(result["memory"]) == {"parse", "part_1", "part_2"}
+    assert result["memory"]["parse"]["peak"] > 0
+    assert "Part 1 peak" in tscr.format_report([result])
+
+
+def test_run_job_error(tmp_path):
+    job = tscr.Job("solutions_2019.day1", 2019, 1, tmp_path / "missing.txt")
+    result = tscr.run_job(job)
+    assert result["error"].startswith("FileNotFoundError")
+    assert result["answers"] == {}
+    (record,) = tscr.iter_records([result])
+    assert record["status"] == "error"
+
+
+def test_run_job_time_budget(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_text("12\n")
+    result = tscr.run_job(tscr.Job("solutions_2019.day1", 2019, 1, path), solution_args=["--time-budget=60"])
+    assert result["timeouts"] == {}
+    assert result["answers"]["part_1"] == 2
@@ -0,0 +1,620 @@
+"""Test ``_common``."""
+
+import os
+import sys
+import json
+import asyncio
+import pstats
+import pathlib
+import subprocess
+import tracemalloc
+
+import _common as tscr
+import pytest
+import numpy as np
+
+
+def test_download_input_cached(input_server):
+    assert tscr.download_input(3, 2018) == "input for /2018/day/3/input\n"
+    assert tscr.download_input(3, 2018) == "input for /2018/day/3/input\n"
+    assert input_server == ["/2018/day/3/input"]
+
+
+def test_input_cache_path_per_token():
+    path_a = tscr.get_input_cache_path(3, 2018, session_token="a")
+    path_b = tscr.get_input_cache_path(3, 2018, session_token="b")
+    assert path_a != path_b
+    assert path_a == tscr.get_input_cache_path(3, 2018, session_token="a")
+    assert path_a != tscr.get_input_cache_path(4, 2018, session_token="a")
+
+
+def test_prefetch_inputs(input_server):
+    paths = tscr.prefetch_inputs(2019, days=[1, 2])
+    assert sorted(input_server) == ["/2019/day/1/input", "/2019/day/2/input"]
+    assert paths[2].read_text() == "input for /2019/day/2/input\n"
+    assert tscr.download_input(1, 2019) == "input for /2019/day/1/input\n"
+    assert len(input_server) == 2
+
+
+def test_prefetch_inputs_async(flaky_input_server):
+    puzzles = [(2018, day) for day in range(1, 15)]
+    coro = tscr.prefetch_inputs_async(puzzles, max_in_flight=3, n_retries=2, backoff=0.01)
+    paths, errors = asyncio.run(coro)
+    assert 1 < flaky_input_server.max_in_flight <= 3
+    assert list(errors) == [(2018, 13)]
+    assert errors[2018, 13].response.status_code == 404
+    assert flaky_input_server.paths.count("/2018/day/13/input") == 1
+    assert flaky_input_server.paths.count("/2018/day/1/input") == 2
+    assert len(paths) == 13
+    assert paths[2018, 14].read_text() == "input for /2018/day/14/input\n"
+
+    paths, errors = asyncio.run(tscr.prefetch_inputs_async(puzzles[:2]))
+    assert not errors
+    assert flaky_input_server.paths.count("/2018/day/1/input") == 2
+
+
+def test_call_stats():
+    stats = tscr.CallStats()
+    for t in range(1, 1001):
+        stats.add(t * 1000)
+    assert stats.count == 1000
+    assert stats.min == 1000
+    assert stats.max == 1000000
+    assert stats.mean == pytest.approx(500500)
+    assert stats.std == pytest.approx(288675, rel=1e-2)  # estimated from histogram
+    assert stats.percentile(50) == pytest.approx(500000, rel=0.07)
+    assert stats.percentile(95) == pytest.approx(950000, rel=0.07)
+    assert stats.percentile(100) == 1000000
+
+
+@pytest.mark.parametrize("t", [0, 1, 15, 16, 17, 31, 32, 1000, 2**40 + 12345, 2**63 - 1])
+def test_call_stats_bucket(t):
+    lower, upper = tscr.CallStats._bucket_bounds(tscr.CallStats._bucket(t))
+    assert lower <= t < upper
+
+
+def test_record_call_times(monkeypatch, tmp_path):
+    monkeypatch.setattr(tscr, "_timings", {})
+
+    @tscr.record_call_times
+    def spam(a):
+        return a + 1
+
+    assert spam(1) == 2
+    assert spam(2) == 3
+    table = tscr.get_call_times()
+    assert list(table) == ["test_record_call_times.<locals>.spam"]
+    assert table["test_record_call_times.<locals>.spam"]["count"] == 2
+
+    json_path = tmp_path / "call-times.json"
+    monkeypatch.setenv("AOC_CALL_TIMES_JSON", str(json_path))
+    tscr.log_call_times()
+    assert json_path.exists()
+
+
+def test_record_call_times_disabled(monkeypatch):
+    monkeypatch.setattr(tscr, "_timings", {})
+    monkeypatch.setattr(tscr, "_record_call_times", False)
+
+    def spam(a):
+        return a + 1
+
+    assert tscr.record_call_times(spam) is spam
+    assert tscr.get_call_times() == {}
+
+
+class _CountSolution(tscr.Solution):
+    n_runs = 0
+
+    def part_1(self):
+        type(self).n_runs += 1
+        return 1
+
+    def part_2(self):
+        return 2
+
+
+def test_solution_bench(tmp_path):
+    baseline = tmp_path / "baseline.json"
+    args = ["--bench", "3", "--warmup", "2", "--baseline", str(baseline)]
+    assert _CountSolution().run(args) == 0
+    assert _CountSolution.n_runs == 5
+    baselines = json.loads(baseline.read_text())
+    assert set(baselines[__name__]) == {"startup", "parse", "part_1", "part_2"}
+    assert set(baselines[__name__]["part_1"]) == {"min", "median", "p95"}
+
+    baselines[__name__]["part_1"]["median"] = -1.0
+    baseline.write_text(json.dumps(baselines))
+    assert _CountSolution().run(args) == 1
+    assert json.loads(baseline.read_text())[__name__]["part_1"]["median"] == -1.0
+
+
+def test_solution_bench_json(capsys):
+    assert _CountSolution().run(["--bench", "2", "--json"]) == 0
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [r["phase"] for r in records] == ["startup", "parse", "part_1", "part_2"]
+    assert records[2]["runs"] == 2
+    assert records[2]["regressed"] is False
+    assert records[2]["min"] <= records[2]["median"]
+
+
+def test_import_is_lazy():
+    code = "import sys, _common; print(' '.join(sorted(sys.modules)))"
+    root = pathlib.Path(tscr.__file__).parent
+    modules = subprocess.run([sys.executable, "-c", code], cwd=str(root), capture_output=True, text=True, check=True)
+    modules = modules.stdout.split()
+    assert "_common" in modules
+    assert not {"numpy", "requests", "coloredlogs", "colored_traceback"} & set(modules)
+    assert not {"pstats", "cProfile", "ctypes", "tracemalloc", "subprocess"} & set(modules)
+
+
+def test_measure_startup_time():
+    times = tscr.measure_startup_time("_common", n=2)
+    assert len(times) == 2
+    assert all(t > 0.0 for t in times)
+
+
+@pytest.mark.parametrize("mmap_threshold", [0, 2 ** 26])
+@pytest.mark.parametrize("text", [
+    "1\n2\n3\n",
+    "\n\n  1\n2\r\n\n  \n3  \n\n \n",
+    "1",
+    "",
+    "\n \n",
+])
+def test_line_stream(tmp_path, monkeypatch, mmap_threshold, text):
+    monkeypatch.setattr(tscr.LineStream, "mmap_threshold", mmap_threshold)
+    path = tmp_path / "input.txt"
+    path.write_bytes(text.encode())
+    stream = tscr.LineStream(path)
+    assert list(stream) == text.strip().splitlines()
+    assert list(stream) == text.strip().splitlines()
+
+
+def test_streaming_solution(tmp_path):
+    from solutions_2019 import day1
+
+    path = tmp_path / "input.txt"
+    path.write_text("12\n14\n1969\n100756\n")
+    soln = day1.Solution()
+    soln.parse_args([str(path), "--stream"])
+    soln.parse()
+    assert isinstance(soln.items, tscr.LineStream)
+    assert soln.input_text is None
+    assert soln.part_1() == 2 + 2 + 654 + 33583
+    assert soln.part_2() == 2 + 2 + 966 + 50346
+    assert soln.input_digest == tscr.hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def test_streaming_solution_download(input_server):
+    from solutions_2019 import day1
+
+    soln = day1.Solution()
+    soln.parse_args(["--stream"])
+    soln.parse()
+    assert soln.input_text is None
+    assert soln.input_path == tscr.get_input_cache_path(1, 2019)
+    assert soln.input_path.read_text() == "input for /2019/day/1/input\n"
+    assert tscr.download_input_file(1, 2019) == soln.input_path
+    assert input_server == ["/2019/day/1/input"]
+
+
+def test_streaming_unsupported(capsys):
+    from solutions_2018 import day2
+
+    with pytest.raises(SystemExit):
+        day2.Solution().parse_args(["input.txt", "--stream"])
+    assert "--stream" in capsys.readouterr().err
+
+
+class _CachedSolution(tscr.InputtedSolution):
+    cache_answers = True
+    n_runs = 0
+
+    def part_1(self):
+        type(self).n_runs += 1
+        return len(self.input_text)
+
+    def part_2(self):
+        return [1, 2]
+
+
+class _JSONSolution(_CachedSolution):
+    n_runs = 0
+
+
+class _BenchedSolution(_CachedSolution):
+    n_runs = 0
+
+
+def test_answer_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("AOC_ANSWER_CACHE", str(tmp_path / "answers"))
+    path = tmp_path / "input.txt"
+    path.write_text("spam")
+    for args, exp_n_runs in [([], 1), ([], 1), (["--no-cache"], 2)]:
+        soln = _CachedSolution()
+        soln.parse_args([str(path)] + args)
+        soln.run_phase("parse")
+        assert soln.run_phase("part_1") == 4
+        assert soln.run_phase("part_2") == [1, 2]
+        assert _CachedSolution.n_runs == exp_n_runs
+    path.write_text("eggs!")
+    soln = _CachedSolution()
+    soln.parse_args([str(path)])
+    soln.run_phase("parse")
+    assert soln.run_phase("part_1") == 5
+    assert _CachedSolution.n_runs == 3
+
+
+def test_input_digest_computed_once(tmp_path, monkeypatch):
+    path = tmp_path / "input.txt"
+    path.write_text("spam")
+    soln = _CachedSolution()
+    soln.parse_args([str(path), "--no-cache"])
+    soln.parse()
+    calls = []
+    sha256 = tscr.hashlib.sha256
+    monkeypatch.setattr(tscr.hashlib, "sha256", lambda *a: calls.append(a) or sha256(*a))
+    digests = {soln.input_digest, soln.phase_record("part_1")["input_digest"], soln.bench_key.split()[1]}
+    assert digests == {sha256(b"spam").hexdigest(), sha256(b"spam").hexdigest()[:12]}
+    assert len(calls) == 1
+    path.write_text("eggs")
+    soln.parse()
+    assert soln.input_digest == sha256(b"eggs").hexdigest()
+
+
+def test_answer_cache_skipped_when_measuring(tmp_path, monkeypatch):
+    monkeypatch.setenv("AOC_ANSWER_CACHE", str(tmp_path / "answers"))
+    monkeypatch.setattr(tscr, "_profiles", [])
+    path = tmp_path / "input.txt"
+    path.write_text("spam")
+    for args in (["--bench", "2"], ["--profile", str(tmp_path / "profiles")]):
+        soln = _BenchedSolution()
+        soln.parse_args([str(path)] + args)
+        assert soln._get_answer_cache_key("part_1") is None
+    soln = _BenchedSolution()
+    soln.parse_args([str(path)])
+    soln.run_phase("parse")
+    soln.run_phase("part_1")
+    assert _BenchedSolution.n_runs == 1
+    assert not _BenchedSolution().run([str(path), "--bench", "2"])
+    assert _BenchedSolution.n_runs == 3
+
+
+def test_solution_json(tmp_path, monkeypatch, capsys):
+    monkeypatch.setenv("AOC_ANSWER_CACHE", str(tmp_path / "answers"))
+    path = tmp_path / "input.txt"
+    path.write_text("spam")
+    assert not _JSONSolution().run([str(path), "--json", "--memory", "--no-cache"])
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [r["phase"] for r in records] == ["parse", "part_1", "part_2"]
+    assert records[1]["answer"] == 4
+    assert records[2]["answer"] == "[1, 2]"
+    assert records[1]["status"] == "ok"
+    assert records[1]["cpu_time"] > 0
+    assert records[1]["peak_memory"] > 0
+    assert records[1]["input_digest"] == tscr.hashlib.sha256(b"spam").hexdigest()
+    assert records[1]["solution"] == __name__
+
+
+def test_answer_cache_eviction(tmp_path, monkeypatch):
+    monkeypatch.setenv("AOC_ANSWER_CACHE", str(tmp_path))
+    cache = tscr.AnswerCache(max_entries=2)
+    cache.set(("a",), 1)
+    cache.set(("b",), np.int64(2))
+    assert cache.get(("b",)) == (True, 2)
+    os.utime(cache._get_entry_path(("a",)), (0, 0))
+    os.utime(cache._get_entry_path(("b",)), (1, 1))
+    assert cache.get(("a",)) == (True, 1)
+    cache.set(("c",), "3")
+    assert cache.get(("b",)) == (False, None)
+    assert cache.get(("a",)) == (True, 1)
+    assert cache.get(("c",)) == (True, "3")
+
+
+def _fib(n):
+    return n if n < 2 else _fib(n - 1) + _fib(n - 2)
+
+
+class _ProfiledSolution(tscr.Solution):
+    def part_1(self):
+        return _fib(15)
+
+    def part_2(self):
+        return sorted(range(10000), key=lambda x: -x)[0]
+
+
+def test_profile(tmp_path, monkeypatch):
+    monkeypatch.setattr(tscr, "_profiles", [])
+    soln = _ProfiledSolution()
+    soln.parse_args(["--profile", str(tmp_path)])
+    assert soln.run_phase("part_1") == 610
+    assert soln.run_phase("part_2") == 9999
+
+    stats = pstats.Stats(str(tmp_path / (__name__ + ".part_1.pstats")))
+    assert any(func[2] == "_fib" for func in stats.stats)
+    collapsed = (tmp_path / (__name__ + ".part_2.collapsed")).read_text().splitlines()
+    stacks = dict(line.rsplit(" ", maxsplit=1) for line in collapsed)
+    assert any(stack.endswith("(<lambda>)") and "(part_2)" in stack for stack in stacks)
+    assert all(int(weight) >= 0 for weight in stacks.values())
+    assert [name for name, _, _ in tscr._profiles] == [__name__ + ".part_1", __name__ + ".part_2"]
+    tscr.log_profiles()
+
+
+def test_log_time_memory():
+    with tscr.LogTime("spam", track_memory=True) as timer:
+        data = bytearray(10 * 2 ** 20)
+        del data
+        kept = bytearray(2 ** 20)
+    assert timer.memory["peak"] >= 10 * 2 ** 20
+    assert 2 ** 20 <= timer.memory["net"] < 2 * 2 ** 20
+    assert set(timer.memory) == {"peak", "net", "rss"}
+    assert not tracemalloc.is_tracing()
+    assert len(kept) == 2 ** 20
+
+
+def test_log_time_no_memory():
+    with tscr.LogTime("spam") as timer:
+        pass
+    assert timer.memory is None
+    assert timer.elapsed >= 0.0
+
+
+def test_span_disabled():
+    assert tscr._trace is None
+    with tscr.span("spam", a=1) as span:
+        pass
+    assert span is tscr._null_span
+
+
+def test_span_trace(tmp_path):
+    tscr.start_tracing()
+    try:
+        with tscr.span("outer") as outer:
+            with tscr.span("inner", n=3) as inner:
+                sum(range(10000))
+            assert tscr._get_span_stack() == [outer]
+        assert inner.parent is outer
+        assert outer.parent is None
+        assert inner.elapsed <= outer.elapsed
+        assert inner.cpu >= 0.0
+    finally:
+        tscr.export_trace(tmp_path / "trace.json")
+    assert tscr._trace is None
+
+    events = json.loads((tmp_path / "trace.json").read_text())["traceEvents"]
+    assert [e["name"] for e in events] == ["inner", "outer"]
+    inner_event, outer_event = events
+    assert inner_event["args"]["n"] == 3
+    assert "cpu_ms" in outer_event["args"]
+    assert outer_event["ts"] <= inner_event["ts"]
+    assert inner_event["ts"] + inner_event["dur"] <= outer_event["ts"] + outer_event["dur"]
+
+
+def test_span_trace_limit():
+    tscr.start_tracing(max_events=2)
+    for _ in range(5):
+        with tscr.span("spam"):
+            pass
+    assert tscr._trace["n_dropped"] == 3
+    assert len(tscr.stop_tracing()) == 2
+
+
+@pytest.mark.parametrize(("text", "line_type", "exp"), [
+    ("+1\n-2\n  +3\n", int, [1, -2, 3]),
+    ("12\n14.5\n1e3", float, [12.0, 14.5, 1000.0]),
+    ("\n", int, []),
+])
+def test_parse_numeric_lines(text, line_type, exp):
+    res = tscr.parse_numeric_lines(text, line_type)
+    np.testing.assert_array_equal(res, exp)
+    assert res.dtype == np.dtype(line_type)
+
+
+@pytest.mark.parametrize("text", ["1\nx\n3", "1 2\n3"])
+def test_parse_numeric_lines_invalid(text):
+    with pytest.raises(ValueError):
+        tscr.parse_numeric_lines(text, int)
+
+
+class _NumericSolution(tscr.InputLinesSolution):
+    line_type = int
+
+
+@pytest.mark.parametrize(("array_items", "text", "exp_type"), [
+    (False, "1\n-2\n", list),
+    (True, "1\n-2\n", np.ndarray),
+    (True, "1\n" + "9" * 30 + "\n", list),
+])
+def test_numeric_lines_solution(tmp_path, monkeypatch, array_items, text, exp_type):
+    monkeypatch.setattr(_NumericSolution, "array_items", array_items)
+    path = tmp_path / "input.txt"
+    path.write_text(text)
+    soln = _NumericSolution()
+    soln.parse_args([str(path)])
+    soln.parse()
+    assert type(soln.items) is exp_type
+    assert list(soln.items) == [int(line) for line in text.split()]
+
+
+@pytest.mark.parametrize(("bulk_parse_min_bytes", "exp_bulk"), [(2 ** 20, False), (0, True)])
+def test_numeric_lines_solution_bulk_threshold(tmp_path, monkeypatch, bulk_parse_min_bytes, exp_bulk):
+    calls = []
+    parse_numeric_lines = tscr.parse_numeric_lines
+    monkeypatch.setattr(tscr, "parse_numeric_lines", lambda *a: calls.append(a) or parse_numeric_lines(*a))
+    monkeypatch.setattr(_NumericSolution, "bulk_parse_min_bytes", bulk_parse_min_bytes)
+    path = tmp_path / "input.txt"
+    path.write_text("1\n-2\n")
+    soln = _NumericSolution()
+    soln.parse_args([str(path)])
+    soln.parse()
+    assert soln.items == [1, -2]
+    assert bool(calls) is exp_bulk
+
+
+def test_parse_numeric_lines_overflow():
+    with pytest.raises(OverflowError):
+        tscr.parse_numeric_lines("1\n-" + "9" * 30, int)
+
+
+class _SlowSolution(tscr.Solution):
+    def part_1(self):
+        j = 0
+        while True:
+            j += 1
+            if j % 1000 == 0:
+                tscr.set_progress_snapshot(step=j)
+
+    def part_2(self):
+        return 42
+
+
+def test_time_budget():
+    soln = _SlowSolution()
+    soln.parse_args(["--time-budget", "0.2"])
+    soln.run_phase("parse")
+    with pytest.raises(tscr.PartTimeout) as e:
+        soln.run_phase("part_1")
+    assert e.value.phase == "part_1"
+    assert e.value.budget == 0.2
+    assert e.value.snapshot["step"] > 0
+    assert 0.2 <= soln.timings["part_1"] < 2
+    assert soln.run_phase("part_2") == 42
+
+
+def test_time_budget_run(capsys):
+    assert not _SlowSolution().run(["--time-budget", "part_1=0.1"])
+    out = capsys.readouterr().out
+    assert "Part 1 answer: timed out" in out
+    assert "Part 2 answer: 42" in out
+
+    assert not _SlowSolution().run(["--time-budget", "part_1=0.1", "--json"])
+    record = json.loads(capsys.readouterr().out.splitlines()[1])
+    assert record["status"] == "timeout"
+    assert record["answer"] is None
+    assert record["progress"]["step"] > 0
+
+
+class _SlowParseSolution(_SlowSolution):
+    def parse(self):
+        self.part_1()
+
+
+def test_time_budget_run_parse(capsys):
+    assert _SlowParseSolution().run(["--time-budget", "parse=0.1"]) == 1
+    assert "answer" not in capsys.readouterr().out
+
+    assert _SlowParseSolution().run(["--time-budget", "parse=0.1", "--json"]) == 1
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert len(records) == 1
+    assert records[0]["phase"] == "parse"
+    assert records[0]["status"] == "timeout"
+
+
+def test_time_budget_bench(capsys):
+    assert _SlowSolution().run(["--bench", "2", "--time-budget", "part_1=0.1"]) == 1
+    out = capsys.readouterr().out
+    assert "(2 timed out)" in out
+    assert "part_2" in out
+
+    assert _SlowSolution().run(["--bench", "1", "--time-budget", "part_1=0.1", "--json"]) == 1
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    results = {record["phase"]: record for record in records}
+    assert results["part_1"]["timeouts"] == 1
+    assert results["part_1"]["median"] is None
+    assert results["part_2"]["median"] is not None
+
+
+def test_time_budget_bench_parse():
+    assert _SlowParseSolution().run(["--bench", "1", "--time-budget", "parse=0.1"]) == 1
+
+
+def test_watchdog_under_budget():
+    with tscr.Watchdog(1.0) as watchdog:
+        pass
+    assert not watchdog.fired
+
+
+def test_watchdog_fired_during_other_error(monkeypatch):
+    calls = []
+    watchdog = tscr.Watchdog(60.0)
+    monkeypatch.setattr(watchdog, "_set_async_exc", calls.append)
+    with pytest.raises(ValueError):
+        with watchdog:
+            watchdog._fire()  # timer fires as the phase fails
+            raise ValueError()
+    assert calls == [tscr.PartTimeout, None]
+
+
+def test_checkpointer(tmp_path, monkeypatch):
+    path = tmp_path / "a" / "sim.ckpt.gz"
+    checkpointer = tscr.Checkpointer(path, every_steps=10)
+    assert checkpointer.load() is None
+    assert not checkpointer.due(9)
+    assert checkpointer.due(10)
+    checkpointer.save(10, {"grid": np.arange(4)})
+    assert not checkpointer.due(19)
+    assert checkpointer.due(20)
+
+    step, state = tscr.Checkpointer(path, resume=True).load()
+    assert step == 10
+    np.testing.assert_array_equal(state["grid"], np.arange(4))
+    assert tscr.Checkpointer(path).load() is None
+
+    checkpointer = tscr.Checkpointer(path, every_seconds=60)
+    assert not checkpointer.due(1000)
+    monkeypatch.setattr(checkpointer, "_last_time", checkpointer._last_time - 61)
+    assert checkpointer.due(1001)
+    checkpointer.clear()
+    assert not path.exists()
+
+
+class _SimulationSolution(tscr.Solution):
+    def part_1(self):
+        restored = self.checkpointer.load()
+        step = restored[0] if restored else 0
+        self.checkpointer.save(step + 1, None)
+        return step
+
+    def part_2(self):
+        return self.checkpointer
+
+
+def test_solution_checkpointer(tmp_path):
+    soln = _SimulationSolution()
+    soln.parse_args(["--checkpoint-dir", str(tmp_path), "--resume"])
+    checkpointer = soln.get_checkpointer("part_1")
+    assert checkpointer.every_seconds == 60
+    assert checkpointer.path.parent == tmp_path
+    checkpointer.save(3, None)
+    assert soln.run_phase("part_1") == 3
+    assert not checkpointer.path.exists()
+
+    soln.parse_args([])
+    assert soln.run_phase("part_2") is None
+
+
+def test_progress(caplog):
+    caplog.set_level(tscr.lg.DEBUG, logger="_common")
+    progress = tscr.Progress("Sim", total=100, interval=0.0, describe=lambda: {"value": 42})
+    progress.step(10)
+    assert "Sim: 10/100 steps (10.0%)" in caplog.text
+    assert "ETA 0:00:00" in caplog.text
+    assert "value: 42" in caplog.text
+    assert tscr.get_progress_snapshot() == {"steps": 10, "value": 42}
+    with progress:
+        progress.update(100)
+    assert "Sim: completed 100 steps in" in caplog.records[-1].message
+
+
+def test_progress_rate_limited(caplog):
+    caplog.set_level(tscr.lg.DEBUG, logger="_common")
+    calls = []
+    progress = tscr.Progress("Sim", interval=60.0, describe=lambda: calls.append(1) or {})
+    for j in range(1, 100001):
+        if j >= progress.next_check:
+            progress.update(j)
+    assert 0 < len(calls) < 100
+    assert not caplog.records
+    assert progress.count <= 100000 < progress.next_check
+    assert progress.next_check - progress.count > 1000
@@ -0,0 +1,19 @@
+"""Test ``_prefetch``."""
+
+import _prefetch as tscr
+import pytest
+
+
+@pytest.mark.parametrize(("text", "exp"), [("3", range(3, 4)), ("1-25", range(1, 26))])
+def test_parse_days(text, exp):
+    assert tscr._parse_days(text) == exp
+
+
+def test_main(input_server):
+    assert tscr.main(["2018", "2019", "--days", "1-2", "-j", "2"]) == 0
+    assert sorted(input_server) == [
+        "/2018/day/1/input",
+        "/2018/day/2/input",
+        "/2019/day/1/input",
+        "/2019/day/2/input",
+    ]
@@ -0,0 +1,60 @@
+"""Test ``solutions``."""
+
+import sys
+import pathlib
+import importlib
+import subprocess
+
+import solutions as tscr
+from solutions import __main__ as tscr_main
+import pytest
+
+
+def test_discover_solutions():
+    solutions = tscr.discover_solutions()
+    assert ("solutions_2018.day15", 2018, 15) in solutions
+    assert ("solutions_2019.day1", 2019, 1) in solutions
+    assert ("solutions_2018.day5", 2018, 5) in solutions
+    assert solutions == sorted(solutions, key=lambda x: (x[1], x[2]))
+
+
+def test_import_is_lazy():
+    code = "import sys, solutions.__main__; print(' '.join(sorted(sys.modules)))"
+    root = pathlib.Path(tscr.__file__).parent.parent
+    modules = subprocess.run([sys.executable, "-c", code], cwd=str(root), capture_output=True, text=True, check=True)
+    assert not {"_batch", "_prefetch", "asyncio", "concurrent.futures"} & set(modules.stdout.split())
+
+
+def test_list_solutions():
+    solutions = tscr.list_solutions(years=[2018])
+    assert [day for _, _, day in solutions] == list(range(1, 20))
+    assert {year for _, year, _ in solutions} == {2018}
+
+
+def test_import_side_effect_free(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    for module, _, _ in tscr.list_solutions():
+        sys.modules.pop(module, None)
+        importlib.import_module(module)
+    assert capsys.readouterr().out == ""
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_get_solution_class():
+    from solutions_2018 import day5
+
+    assert tscr.get_solution_class(2018, 5) is day5.Solution
+    with pytest.raises(LookupError):
+        tscr.get_solution_class(2018, 26)
+
+
+def test_main_run(tmp_path, capsys):
+    path = tmp_path / "input.txt"
+    path.write_text("dabAcCaCBAcCcaDA\n")
+    assert not tscr_main.main(["run", "2018", "5", str(path)])
+    assert capsys.readouterr().out == "Part 1 answer: 10\nPart 2 answer: 4\n"
+
+
+def test_main_list(capsys):
+    assert tscr_main.main(["list", "--year", "2019"]) == 0
+    assert capsys.readouterr().out.splitlines()[0].split() == ["2019", "1", "solutions_2019.day1"]